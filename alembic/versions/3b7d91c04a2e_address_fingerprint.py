@@ -0,0 +1,30 @@
+"""address fingerprint
+
+Revision ID: 3b7d91c04a2e
+Revises: e68b5514af54
+Create Date: 2026-10-19 10:12:41.508733
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3b7d91c04a2e'
+down_revision: Union[str, Sequence[str], None] = 'e68b5514af54'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('addresses', sa.Column('fingerprint', sa.String(length=64), nullable=True))
+    op.create_index(op.f('ix_addresses_fingerprint'), 'addresses', ['fingerprint'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_addresses_fingerprint'), table_name='addresses')
+    op.drop_column('addresses', 'fingerprint')
@@ -0,0 +1,34 @@
+"""pending since index
+
+Revision ID: 5a9f0e27b6c1
+Revises: 8c2e4f6a1d93
+Create Date: 2026-10-19 12:26:50.114027
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5a9f0e27b6c1'
+down_revision: Union[str, Sequence[str], None] = '8c2e4f6a1d93'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'ix_addresses_pending_since',
+        'addresses',
+        [sa.text('coalesce(updated_at, created_at)')],
+        unique=False,
+        postgresql_where=sa.text("validation_status = 'pending'"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_addresses_pending_since', table_name='addresses')
@@ -0,0 +1,28 @@
+"""validated_at index
+
+Revision ID: 8c2e4f6a1d93
+Revises: 3b7d91c04a2e
+Create Date: 2026-10-19 11:03:17.220914
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8c2e4f6a1d93'
+down_revision: Union[str, Sequence[str], None] = '3b7d91c04a2e'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_addresses_validated_at_id', 'addresses', ['validated_at', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_addresses_validated_at_id', table_name='addresses')
@@ -0,0 +1,33 @@
+"""validation results address index
+
+Revision ID: 9d3a6b2e7f14
+Revises: c41d7e8b2f05
+Create Date: 2026-10-19 16:05:12.482931
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9d3a6b2e7f14'
+down_revision: Union[str, Sequence[str], None] = 'c41d7e8b2f05'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        op.f('ix_validation_results_address_id'),
+        'validation_results',
+        ['address_id'],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_validation_results_address_id'), table_name='validation_results')
@@ -0,0 +1,28 @@
+"""address client id
+
+Revision ID: b6e2d4f81a37
+Revises: 9d3a6b2e7f14
+Create Date: 2026-10-19 18:22:40.913057
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b6e2d4f81a37'
+down_revision: Union[str, Sequence[str], None] = '9d3a6b2e7f14'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('addresses', sa.Column('client_id', sa.String(length=255), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('addresses', 'client_id')
@@ -0,0 +1,42 @@
+"""pending since index id
+
+Revision ID: f2a8c5d17e49
+Revises: b6e2d4f81a37
+Create Date: 2026-10-19 21:04:18.552310
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f2a8c5d17e49'
+down_revision: Union[str, Sequence[str], None] = 'b6e2d4f81a37'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.drop_index('ix_addresses_pending_since', table_name='addresses')
+    op.create_index(
+        'ix_addresses_pending_since',
+        'addresses',
+        [sa.text('coalesce(updated_at, created_at)'), 'id'],
+        unique=False,
+        postgresql_where=sa.text("validation_status = 'pending'"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_addresses_pending_since', table_name='addresses')
+    op.create_index(
+        'ix_addresses_pending_since',
+        'addresses',
+        [sa.text('coalesce(updated_at, created_at)')],
+        unique=False,
+        postgresql_where=sa.text("validation_status = 'pending'"),
+    )
@@ -1,12 +1,15 @@
 from collections.abc import AsyncGenerator
 
+from fastapi import Request
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.db.session import async_session_maker
+from src.db.slow_query import set_query_origin
 
 
-async def get_db() -> AsyncGenerator[AsyncSession, None]:
-    async with async_session_maker() as session:
+async def get_db(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    route = request.scope.get("route")
+    set_query_origin(f"{request.method} {getattr(route, 'path', request.url.path)}")
+    async with request.app.state.session_maker() as session:
         try:
             yield session
             await session.commit()
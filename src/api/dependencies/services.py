@@ -1,27 +1,52 @@
 from typing import Annotated
 
 from arq import ArqRedis
-from fastapi import Depends
+from fastapi import Depends, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.api.dependencies.database import get_db
+from src.core.exceptions import ServiceUnavailableError
 from src.repositories.address_repository import AddressRepository
+from src.repositories.webhook_repository import WebhookRepository
 from src.services.address_service import AddressService
+from src.services.address_stats import AddressStatsCounter
+from src.services.bulk_validation import BulkValidationTracker
+from src.services.profiler import ProfileStore
+from src.services.status_stream import StatusBroadcaster
+from src.services.webhook_service import WebhookService
 
-_arq_pool: ArqRedis | None = None
 
+async def get_arq_pool(request: Request) -> ArqRedis | None:
+    pool: ArqRedis | None = request.app.state.arq_pool
+    return pool
 
-async def get_arq_pool() -> ArqRedis | None:
-    return _arq_pool
 
+async def get_status_broadcaster(request: Request) -> StatusBroadcaster:
+    broadcaster: StatusBroadcaster | None = request.app.state.status_broadcaster
+    if broadcaster is None:
+        raise ServiceUnavailableError("Status stream")
+    return broadcaster
 
-def set_arq_pool(pool: ArqRedis | None) -> None:
-    global _arq_pool
-    _arq_pool = pool
+
+async def get_profile_store(request: Request) -> ProfileStore:
+    pool: ArqRedis | None = request.app.state.arq_pool
+    if pool is None:
+        raise ServiceUnavailableError("Profile store")
+    return ProfileStore(pool, ttl=request.app.state.settings.profiling_ttl_seconds)
 
 
 async def get_address_service(
     session: Annotated[AsyncSession, Depends(get_db)],
     arq: Annotated[ArqRedis | None, Depends(get_arq_pool)],
 ) -> AddressService:
-    return AddressService(AddressRepository(session), arq)
+    if arq is None:
+        return AddressService(AddressRepository(session))
+    return AddressService(
+        AddressRepository(session), arq, AddressStatsCounter(arq), BulkValidationTracker(arq)
+    )
+
+
+async def get_webhook_service(
+    session: Annotated[AsyncSession, Depends(get_db)],
+) -> WebhookService:
+    return WebhookService(WebhookRepository(session))
@@ -0,0 +1,244 @@
+import asyncio
+import hashlib
+import logging
+import random
+import time
+from datetime import UTC, datetime
+from uuid import uuid4
+
+from fastapi.responses import JSONResponse, Response
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.config import Settings
+from src.services.idempotency import (
+    IdempotencyInProgressError,
+    IdempotencyKeyReusedError,
+    IdempotencyStore,
+    StoredResponse,
+)
+from src.services.profiler import ProfileStore, RequestProfile, StackSampler, capture_queries
+
+logger = logging.getLogger(__name__)
+
+IDEMPOTENCY_HEADER = "idempotency-key"
+REPLAYED_HEADER = "Idempotent-Replayed"
+MAX_KEY_LENGTH = 255
+REQUEST_ID_HEADER = "x-request-id"
+PROFILE_ID_HEADER = "X-Profile-Id"
+
+
+class IdempotencyMiddleware:
+    """Makes POST requests carrying an `Idempotency-Key` header safe to retry.
+
+    Runs before routing, so a replayed response never opens a database session. Keys are
+    scoped to the path. Responses below 500 are stored; a 5xx or an exception releases
+    the key so the client's next retry runs again. Without Redis requests pass through.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] != "POST":
+            await self.app(scope, receive, send)
+            return
+
+        key = Headers(scope=scope).get(IDEMPOTENCY_HEADER)
+        state = scope["app"].state
+        if not key or state.arq_pool is None:
+            await self.app(scope, receive, send)
+            return
+        if len(key) > MAX_KEY_LENGTH:
+            response: Response = _error(
+                400,
+                "DOMAIN_ERROR",
+                f"Idempotency-Key is longer than {MAX_KEY_LENGTH} characters",
+            )
+            await response(scope, receive, send)
+            return
+
+        body, receive = await _buffer_body(receive)
+        fingerprint = _fingerprint(scope, body)
+        scoped_key = f"{scope['path']}:{key}"
+        store = _store(state.arq_pool, state.settings)
+
+        try:
+            stored = await store.claim(scoped_key, fingerprint)
+        except IdempotencyKeyReusedError:
+            response = _error(
+                422,
+                "IDEMPOTENCY_KEY_REUSED",
+                "Idempotency-Key was already used with a different request",
+            )
+        except IdempotencyInProgressError:
+            response = _error(
+                409,
+                "IDEMPOTENCY_IN_PROGRESS",
+                "A request with this Idempotency-Key is still in progress",
+            )
+        except RedisError as e:
+            logger.warning("Idempotency store unavailable, processing request once: %s", e)
+            await self.app(scope, receive, send)
+            return
+        else:
+            if stored is None:
+                await self._run_and_store(scope, receive, send, store, scoped_key, fingerprint)
+                return
+            response = Response(
+                content=stored.body.encode("latin-1"),
+                status_code=stored.status_code,
+                media_type=stored.content_type,
+                headers={REPLAYED_HEADER: "true"},
+            )
+        await response(scope, receive, send)
+
+    async def _run_and_store(
+        self,
+        scope: Scope,
+        receive: Receive,
+        send: Send,
+        store: IdempotencyStore,
+        key: str,
+        fingerprint: str,
+    ) -> None:
+        capture = _ResponseCapture(send)
+        try:
+            await self.app(scope, receive, capture)
+        except Exception:
+            await store.release(key)
+            raise
+
+        if capture.status_code >= 500:
+            await store.release(key)
+            return
+        await store.complete(
+            key,
+            fingerprint,
+            StoredResponse(
+                status_code=capture.status_code,
+                content_type=capture.content_type,
+                body=b"".join(capture.body).decode("latin-1"),
+            ),
+        )
+
+
+class ProfilingMiddleware:
+    """Profiles requests carrying `settings.profiling_header`, plus a sampled share of the rest.
+
+    Only installed when `PROFILING_ENABLED` is set. The sampled stacks and the SQL run are
+    stored in Redis under an id generated here and returned in `X-Profile-Id`; the client's
+    `X-Request-ID` is only kept on the profile for correlation, so no caller can choose a
+    key and overwrite another request's profile. Without Redis requests pass through
+    unprofiled.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        state = scope["app"].state
+        if scope["type"] != "http" or state.arq_pool is None:
+            await self.app(scope, receive, send)
+            return
+
+        settings: Settings = state.settings
+        headers = Headers(scope=scope)
+        if (
+            settings.profiling_header not in headers
+            and random.random() >= settings.profiling_sample_rate
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        request_id = uuid4().hex
+        profile = RequestProfile(
+            request_id=request_id,
+            client_request_id=headers.get(REQUEST_ID_HEADER, "")[:MAX_KEY_LENGTH] or None,
+            method=scope["method"],
+            path=scope["path"],
+            started_at=datetime.now(UTC),
+        )
+
+        async def send_with_profile_id(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message).append(PROFILE_ID_HEADER, request_id)
+            await send(message)
+
+        task = asyncio.current_task()
+        assert task is not None
+        sampler = StackSampler(task, settings.profiling_interval_ms / 1000)
+        started = time.perf_counter()
+        sampler.start()
+        try:
+            with capture_queries(profile):
+                await self.app(scope, receive, send_with_profile_id)
+        finally:
+            profile.samples = sampler.stop()
+            profile.duration_ms = round((time.perf_counter() - started) * 1000, 3)
+            try:
+                await ProfileStore(state.arq_pool, settings.profiling_ttl_seconds).save(profile)
+            except RedisError as e:
+                logger.warning("Failed to store profile for request %s: %s", request_id, e)
+
+
+class _ResponseCapture:
+    def __init__(self, send: Send) -> None:
+        self._send = send
+        self.status_code = 500
+        self.content_type: str | None = None
+        self.body: list[bytes] = []
+
+    async def __call__(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            self.status_code = message["status"]
+            self.content_type = Headers(raw=message["headers"]).get("content-type")
+        elif message["type"] == "http.response.body":
+            self.body.append(message.get("body", b""))
+        await self._send(message)
+
+
+async def _buffer_body(receive: Receive) -> tuple[bytes, Receive]:
+    chunks = []
+    while True:
+        message = await receive()
+        if message["type"] != "http.request":
+            break
+        chunks.append(message.get("body", b""))
+        if not message.get("more_body", False):
+            break
+    body = b"".join(chunks)
+    replayed = False
+
+    async def replay() -> Message:
+        nonlocal replayed
+        if replayed:
+            return await receive()
+        replayed = True
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    return body, replay
+
+
+def _fingerprint(scope: Scope, body: bytes) -> str:
+    # Query parameters change what a request does (e.g. `on_duplicate`), so they count too.
+    digest = hashlib.sha256(f"{scope['method']}?".encode())
+    digest.update(scope.get("query_string", b""))
+    digest.update(b"\n")
+    digest.update(body)
+    return digest.hexdigest()
+
+
+def _store(redis: Redis, settings: Settings) -> IdempotencyStore:
+    return IdempotencyStore(
+        redis,
+        ttl=settings.idempotency_ttl_seconds,
+        lock_ttl=settings.idempotency_lock_seconds,
+        wait_timeout=settings.idempotency_wait_seconds,
+    )
+
+
+def _error(status_code: int, code: str, detail: str) -> JSONResponse:
+    return JSONResponse(status_code=status_code, content={"detail": detail, "code": code})
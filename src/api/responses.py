@@ -0,0 +1,16 @@
+from fastapi.responses import Response
+from pydantic import BaseModel
+
+
+class PydanticResponse(Response):
+    """JSON response encoded by pydantic-core straight from a validated model.
+
+    Returning a `Response` makes FastAPI skip `response_model` re-validation and
+    `jsonable_encoder`, so an ORM object is validated once and serialized once. Keep
+    `response_model=` on the route so the OpenAPI schema is unchanged.
+    """
+
+    media_type = "application/json"
+
+    def render(self, content: BaseModel) -> bytes:
+        return content.model_dump_json().encode()
@@ -1,8 +1,11 @@
 from fastapi import APIRouter
 
-from src.api.routes import addresses, health
+from src.api.routes import addresses, health, metrics, profiles, webhooks
 
 api_router = APIRouter()
 
 api_router.include_router(health.router, tags=["Health"])
+api_router.include_router(metrics.router, tags=["Metrics"])
 api_router.include_router(addresses.router, prefix="/addresses", tags=["Addresses"])
+api_router.include_router(webhooks.router, prefix="/webhooks", tags=["Webhooks"])
+api_router.include_router(profiles.router, prefix="/profiles", tags=["Profiling"])
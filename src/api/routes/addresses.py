@@ -1,28 +1,73 @@
+import asyncio
+from collections import Counter
+from collections.abc import AsyncGenerator
 from typing import Annotated
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Query, status
+from fastapi import APIRouter, Depends, Query, Request, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.api.dependencies.services import get_address_service
+from src.api.dependencies.database import get_db
+from src.api.dependencies.services import get_address_service, get_status_broadcaster
+from src.api.responses import PydanticResponse
+from src.core.enums import DuplicatePolicy, ValidationStatus
+from src.core.exceptions import ValidationError
 from src.schemas.address import (
+    ADDRESS_FIELDS,
     AddressCreate,
     AddressListResponse,
     AddressResponse,
+    AddressStatsItem,
+    AddressStatsResponse,
     AddressUpdate,
+    BulkDeleteRequest,
+    BulkDeleteResponse,
+    BulkValidationRequest,
+    BulkValidationResponse,
+    sparse_address_models,
 )
 from src.schemas.common import MessageResponse
 from src.services.address_service import AddressService
+from src.services.status_stream import StatusBroadcaster, StatusEvent, StatusFilter, Subscription
 
 router = APIRouter()
 
+SSE_KEEPALIVE_SECONDS = 15.0
 
-@router.post("", response_model=AddressResponse, status_code=status.HTTP_201_CREATED)
+
+def get_address_fields(
+    fields: Annotated[
+        str | None,
+        Query(description="Comma-separated response fields, e.g. `id,validation_status`"),
+    ] = None,
+) -> frozenset[str] | None:
+    if fields is None:
+        return None
+    requested = frozenset(f.strip() for f in fields.split(",") if f.strip())
+    unknown = requested - ADDRESS_FIELDS
+    if unknown:
+        raise ValidationError("fields", f"unknown field(s): {', '.join(sorted(unknown))}")
+    return requested | {"id"}
+
+
+@router.post(
+    "",
+    response_model=AddressResponse,
+    status_code=status.HTTP_201_CREATED,
+    responses={status.HTTP_200_OK: {"model": AddressResponse}},
+)
 async def create_address(
     data: AddressCreate,
     service: Annotated[AddressService, Depends(get_address_service)],
-) -> AddressResponse:
-    address = await service.create(data)
-    return AddressResponse.model_validate(address)
+    on_duplicate: DuplicatePolicy = DuplicatePolicy.CREATE,
+) -> PydanticResponse:
+    address, created = await service.create(data, duplicate_policy=on_duplicate)
+    return PydanticResponse(
+        AddressResponse.model_validate(address),
+        # `on_duplicate=return` hands back an existing row instead of inserting one.
+        status_code=status.HTTP_201_CREATED if created else status.HTTP_200_OK,
+    )
 
 
 @router.get("", response_model=AddressListResponse)
@@ -30,23 +75,154 @@ async def list_addresses(
     service: Annotated[AddressService, Depends(get_address_service)],
     limit: Annotated[int, Query(ge=1, le=100)] = 20,
     offset: Annotated[int, Query(ge=0)] = 0,
-) -> AddressListResponse:
-    addresses, total = await service.get_list(limit=limit, offset=offset)
-    return AddressListResponse(
-        items=[AddressResponse.model_validate(a) for a in addresses],
-        total=total,
-        limit=limit,
-        offset=offset,
+    fields: Annotated[frozenset[str] | None, Depends(get_address_fields)] = None,
+) -> PydanticResponse:
+    addresses, total = await service.get_list(limit=limit, offset=offset, fields=fields)
+    if fields is None:
+        return PydanticResponse(
+            AddressListResponse(
+                items=[AddressResponse.model_validate(a) for a in addresses],
+                total=total,
+                limit=limit,
+                offset=offset,
+            )
+        )
+
+    item_model, page_model = sparse_address_models(fields)
+    return PydanticResponse(
+        page_model(
+            items=[item_model.model_validate(a) for a in addresses],
+            total=total,
+            limit=limit,
+            offset=offset,
+        )
+    )
+
+
+@router.get("/stats", response_model=AddressStatsResponse)
+async def get_address_stats(
+    service: Annotated[AddressService, Depends(get_address_service)],
+) -> AddressStatsResponse:
+    counts = await service.get_stats()
+    by_status: Counter[ValidationStatus] = Counter()
+    by_country: Counter[str] = Counter()
+    for (validation_status, country_code), count in counts.items():
+        by_status[validation_status] += count
+        by_country[country_code] += count
+
+    return AddressStatsResponse(
+        total=sum(counts.values()),
+        by_status=dict(by_status),
+        by_country=dict(by_country),
+        items=[
+            AddressStatsItem(validation_status=s, country_code=c, count=n)
+            for (s, c), n in sorted(counts.items())
+        ],
+    )
+
+
+@router.get("/events", response_class=StreamingResponse)
+async def stream_status_events(
+    request: Request,
+    session: Annotated[AsyncSession, Depends(get_db)],
+    service: Annotated[AddressService, Depends(get_address_service)],
+    broadcaster: Annotated[StatusBroadcaster, Depends(get_status_broadcaster)],
+    address_id: Annotated[list[UUID] | None, Query()] = None,
+    validation_status: Annotated[list[ValidationStatus] | None, Query()] = None,
+    country_code: Annotated[list[str] | None, Query()] = None,
+) -> StreamingResponse:
+    """Server-Sent Events stream of validation status changes.
+
+    Subscribing to explicit `address_id`s first replays their current status, so a client
+    never misses a transition that happened before the stream opened.
+    """
+    subscription = broadcaster.subscribe(
+        StatusFilter(
+            address_ids=frozenset(str(a) for a in address_id or ()),
+            statuses=frozenset(validation_status or ()),
+            country_codes=frozenset(c.upper() for c in country_code or ()),
+        )
     )
+    snapshot = await service.get_status_snapshot(address_id) if address_id else []
+    # Release the pooled connection now instead of holding it for the stream's lifetime.
+    await session.commit()
+
+    return StreamingResponse(
+        _sse_events(request, broadcaster, subscription, snapshot),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+async def _sse_events(
+    request: Request,
+    broadcaster: StatusBroadcaster,
+    subscription: Subscription,
+    snapshot: list[StatusEvent],
+) -> AsyncGenerator[str, None]:
+    try:
+        for event in snapshot:
+            if subscription.status_filter.matches(event):
+                yield f"event: status\ndata: {event.to_json()}\n\n"
+
+        while not await request.is_disconnected():
+            try:
+                event = await asyncio.wait_for(
+                    subscription.queue.get(), timeout=SSE_KEEPALIVE_SECONDS
+                )
+            except TimeoutError:
+                yield ": keepalive\n\n"
+                continue
+            yield f"event: status\ndata: {event.to_json()}\n\n"
+    finally:
+        broadcaster.unsubscribe(subscription)
+
+
+@router.post(
+    "/validate",
+    response_model=BulkValidationResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+)
+async def validate_addresses(
+    criteria: BulkValidationRequest,
+    service: Annotated[AddressService, Depends(get_address_service)],
+) -> BulkValidationResponse:
+    """Revalidate every address matching the filter; poll the returned id for progress."""
+    progress = await service.validate_matching(criteria)
+    return BulkValidationResponse.model_validate(progress)
+
+
+@router.get("/validate/{bulk_id}", response_model=BulkValidationResponse)
+async def get_bulk_validation(
+    bulk_id: UUID,
+    service: Annotated[AddressService, Depends(get_address_service)],
+) -> BulkValidationResponse:
+    progress = await service.get_bulk_validation(bulk_id)
+    return BulkValidationResponse.model_validate(progress)
+
+
+@router.post("/delete", response_model=BulkDeleteResponse)
+async def delete_addresses(
+    criteria: BulkDeleteRequest,
+    service: Annotated[AddressService, Depends(get_address_service)],
+) -> BulkDeleteResponse:
+    """Delete the listed ids and/or every address matching the filter, in bounded chunks."""
+    deleted = await service.delete_matching(criteria)
+    return BulkDeleteResponse(deleted=deleted)
 
 
 @router.get("/{address_id}", response_model=AddressResponse)
 async def get_address(
     address_id: UUID,
     service: Annotated[AddressService, Depends(get_address_service)],
-) -> AddressResponse:
-    address = await service.get_by_id(address_id)
-    return AddressResponse.model_validate(address)
+    fields: Annotated[frozenset[str] | None, Depends(get_address_fields)] = None,
+) -> PydanticResponse:
+    address = await service.get_by_id(address_id, fields=fields)
+    if fields is None:
+        return PydanticResponse(AddressResponse.model_validate(address))
+
+    item_model, _page_model = sparse_address_models(fields)
+    return PydanticResponse(item_model.model_validate(address))
 
 
 @router.put("/{address_id}", response_model=AddressResponse)
@@ -54,9 +230,9 @@ async def update_address(
     address_id: UUID,
     data: AddressUpdate,
     service: Annotated[AddressService, Depends(get_address_service)],
-) -> AddressResponse:
+) -> PydanticResponse:
     address = await service.update(address_id, data)
-    return AddressResponse.model_validate(address)
+    return PydanticResponse(AddressResponse.model_validate(address))
 
 
 @router.delete("/{address_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -1,10 +1,10 @@
-from typing import Annotated
+import asyncio
 
-from fastapi import APIRouter, Depends
-from sqlalchemy import text
-from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi import APIRouter, Request, status
 
-from src.api.dependencies.database import get_db
+from src.api.responses import PydanticResponse
+from src.schemas.health import ReadinessResponse
+from src.services.readiness import ERROR, OK, check_database, check_redis
 
 router = APIRouter()
 
@@ -14,10 +14,36 @@ async def health() -> dict[str, str]:
     return {"status": "ok"}
 
 
-@router.get("/health/ready")
-async def ready(db: Annotated[AsyncSession, Depends(get_db)]) -> dict[str, str]:
-    try:
-        await db.execute(text("SELECT 1"))
-        return {"status": "ok", "database": "ok"}
-    except Exception as e:
-        return {"status": "error", "database": str(e)}
+@router.get(
+    "/health/ready",
+    response_model=ReadinessResponse,
+    responses={status.HTTP_503_SERVICE_UNAVAILABLE: {"model": ReadinessResponse}},
+)
+async def ready(request: Request) -> PydanticResponse:
+    """Returns 503 when any database or Redis is unreachable, slow, or a DB pool is nearly full."""
+    state = request.app.state
+    settings = state.settings
+    engines = state.engines or [state.engine]
+    redis, *databases = await asyncio.gather(
+        check_redis(state.arq_pool, settings.readiness_timeout),
+        *(
+            check_database(
+                engine,
+                settings.readiness_timeout,
+                capacity=settings.db_pool_size + settings.db_max_overflow,
+                max_usage=settings.readiness_max_pool_usage,
+            )
+            for engine in engines
+        ),
+    )
+    # Shards after the first are reported as `database_1`, `database_2`, ...
+    checks = {
+        "database" if shard == 0 else f"database_{shard}": check
+        for shard, check in enumerate(databases)
+    }
+    checks["redis"] = redis
+    healthy = all(check.status == OK for check in checks.values())
+    return PydanticResponse(
+        ReadinessResponse(status=OK if healthy else ERROR, checks=checks),
+        status_code=status.HTTP_200_OK if healthy else status.HTTP_503_SERVICE_UNAVAILABLE,
+    )
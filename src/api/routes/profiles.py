@@ -0,0 +1,35 @@
+from typing import Annotated
+
+from fastapi import APIRouter, Depends
+from fastapi.responses import PlainTextResponse
+
+from src.api.dependencies.services import get_profile_store
+from src.core.exceptions import ProfileNotFoundError
+from src.schemas.profile import ProfileResponse
+from src.services.profiler import ProfileStore, RequestProfile
+
+router = APIRouter()
+
+
+async def _get(request_id: str, store: ProfileStore) -> RequestProfile:
+    profile = await store.get(request_id)
+    if profile is None:
+        raise ProfileNotFoundError(request_id)
+    return profile
+
+
+@router.get("/{request_id}", response_model=ProfileResponse)
+async def get_profile(
+    request_id: str,
+    store: Annotated[ProfileStore, Depends(get_profile_store)],
+) -> ProfileResponse:
+    return ProfileResponse.model_validate(await _get(request_id, store))
+
+
+@router.get("/{request_id}/collapsed", response_class=PlainTextResponse)
+async def get_profile_collapsed(
+    request_id: str,
+    store: Annotated[ProfileStore, Depends(get_profile_store)],
+) -> str:
+    """Folded stacks for `flamegraph.pl` or speedscope."""
+    return (await _get(request_id, store)).collapsed()
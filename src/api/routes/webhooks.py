@@ -0,0 +1,36 @@
+from typing import Annotated
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, status
+
+from src.api.dependencies.services import get_webhook_service
+from src.schemas.webhook import WebhookCreate, WebhookResponse
+from src.services.webhook_service import WebhookService
+
+router = APIRouter()
+
+
+@router.post("", response_model=WebhookResponse, status_code=status.HTTP_201_CREATED)
+async def register_webhook(
+    data: WebhookCreate,
+    service: Annotated[WebhookService, Depends(get_webhook_service)],
+) -> WebhookResponse:
+    endpoint = await service.register(data)
+    return WebhookResponse.model_validate(endpoint)
+
+
+@router.get("", response_model=list[WebhookResponse])
+async def list_webhooks(
+    client_id: str,
+    service: Annotated[WebhookService, Depends(get_webhook_service)],
+) -> list[WebhookResponse]:
+    endpoints = await service.get_by_client(client_id)
+    return [WebhookResponse.model_validate(e) for e in endpoints]
+
+
+@router.delete("/{webhook_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_webhook(
+    webhook_id: UUID,
+    service: Annotated[WebhookService, Depends(get_webhook_service)],
+) -> None:
+    await service.delete(webhook_id)
@@ -0,0 +1,262 @@
+"""Bulk-load addresses from CSV: `python -m src.cli.load_addresses addresses.csv --validate`.
+
+Rows are checked like `POST /addresses` and streamed into `addresses` with COPY FROM STDIN,
+one transaction per `--batch-size` rows (per shard when sharded). Unlike the API there is
+no duplicate detection.
+"""
+
+import argparse
+import asyncio
+import contextlib
+import csv
+import logging
+import sys
+import time
+import uuid
+from collections import Counter, defaultdict
+from collections.abc import Iterable, Iterator, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+import asyncpg
+from arq import ArqRedis, create_pool
+from arq.connections import RedisSettings
+from pydantic import ValidationError
+
+from src.config import get_settings
+from src.core.enums import ValidationStatus
+from src.db.sharding import shard_for
+from src.schemas.address import AddressCreate
+from src.services.address_service import BULK_VALIDATION_CHUNK_SIZE
+from src.services.address_stats import AddressStatsCounter
+from src.services.bulk_validation import BulkValidationTracker
+from src.services.shipengine_client import ShipEngineClient
+from src.workers.serialization import deserialize, serialize
+
+logger = logging.getLogger(__name__)
+
+ADDRESS_FIELDS = tuple(AddressCreate.model_fields)
+COLUMNS = ("id", *ADDRESS_FIELDS, "fingerprint", "validation_status")
+MAX_LOGGED_REJECTS = 20
+
+
+@dataclass
+class LoadReport:
+    loaded: int = 0
+    rejected: int = 0
+    seconds: float = 0.0
+    bulk_id: uuid.UUID | None = None
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.loaded / self.seconds if self.seconds else 0.0
+
+
+class AddressLoader:
+    """Streams CSV rows into `addresses` with the COPY protocol, `batch_size` rows per commit.
+
+    Rows that fail `AddressCreate` validation are skipped and counted. After each committed
+    batch the stats hash is updated and, with `validate`, the new ids are handed to
+    `enqueue_validation_batch_task` under one bulk id, so progress can be followed with
+    `GET /addresses/validate/{bulk_id}`.
+
+    `conns` has one connection per shard, in `DATABASE_SHARD_URLS` order. Each batch is
+    split by id and copied to every shard in its own transaction, so a failure can leave a
+    batch loaded on some shards only.
+    """
+
+    def __init__(
+        self,
+        conns: Sequence[asyncpg.Connection],
+        redis: ArqRedis | None = None,
+        *,
+        batch_size: int = 50_000,
+        fingerprint: bool = False,
+        validate: bool = False,
+    ) -> None:
+        if validate and redis is None:
+            raise ValueError("Enqueueing validation needs Redis")
+        self._conns = conns
+        self._redis = redis
+        self._batch_size = batch_size
+        self._client = ShipEngineClient() if fingerprint else None
+        self._validate = validate
+
+    async def load(self, rows: Iterable[dict[str, str]]) -> LoadReport:
+        report = LoadReport()
+        if self._validate and self._redis:
+            report.bulk_id = uuid.uuid4()
+            await BulkValidationTracker(self._redis).start(report.bulk_id, total=0)
+
+        started = time.perf_counter()
+        batch: list[tuple[Any, ...]] = []
+        for record in self._records(rows, report):
+            batch.append(record)
+            if len(batch) >= self._batch_size:
+                await self._write(batch, report)
+                batch = []
+                report.seconds = time.perf_counter() - started
+                logger.info("Loaded %d rows (%.0f rows/s)", report.loaded, report.rows_per_second)
+        if batch:
+            await self._write(batch, report)
+        report.seconds = time.perf_counter() - started
+        return report
+
+    def _records(
+        self, rows: Iterable[dict[str, str]], report: LoadReport
+    ) -> Iterator[tuple[Any, ...]]:
+        # Line 1 is the header.
+        for line, row in enumerate(rows, start=2):
+            try:
+                data = AddressCreate.model_validate(
+                    {name: row.get(name) or None for name in ADDRESS_FIELDS}
+                )
+            except ValidationError as e:
+                report.rejected += 1
+                if report.rejected <= MAX_LOGGED_REJECTS:
+                    logger.warning("Line %d rejected: %s", line, _first_error(e))
+                continue
+
+            yield (
+                uuid.uuid4(),
+                *(getattr(data, name) for name in ADDRESS_FIELDS),
+                self._client.fingerprint(data) if self._client else None,
+                ValidationStatus.PENDING.value,
+            )
+
+    async def _write(self, batch: list[tuple[Any, ...]], report: LoadReport) -> None:
+        by_shard: defaultdict[str, list[tuple[Any, ...]]] = defaultdict(list)
+        for record in batch:
+            by_shard[shard_for(record[0], len(self._conns))].append(record)
+        for shard, records in by_shard.items():
+            conn = self._conns[int(shard)]
+            async with conn.transaction():
+                await conn.copy_records_to_table("addresses", records=records, columns=COLUMNS)
+        report.loaded += len(batch)
+        if self._redis is None:
+            return
+
+        country = COLUMNS.index("country_code")
+        await AddressStatsCounter(self._redis).apply(
+            Counter((ValidationStatus.PENDING, record[country]) for record in batch)
+        )
+        if report.bulk_id is not None:
+            await self._enqueue_validation(report.bulk_id, [str(record[0]) for record in batch])
+
+    async def _enqueue_validation(self, bulk_id: uuid.UUID, ids: list[str]) -> None:
+        assert self._redis is not None
+        await BulkValidationTracker(self._redis).record_total(bulk_id, len(ids))
+        for start in range(0, len(ids), BULK_VALIDATION_CHUNK_SIZE):
+            await self._redis.enqueue_job(
+                "enqueue_validation_batch_task",
+                str(bulk_id),
+                ids[start : start + BULK_VALIDATION_CHUNK_SIZE],
+            )
+
+
+def _first_error(e: ValidationError) -> str:
+    error = e.errors()[0]
+    location = ".".join(str(part) for part in error["loc"])
+    return f"{location}: {error['msg']}"
+
+
+def _dsn(database_url: str) -> str:
+    # asyncpg takes a plain libpq URL, without SQLAlchemy's driver suffix.
+    return database_url.replace("postgresql+asyncpg://", "postgresql://", 1)
+
+
+def missing_columns(fieldnames: Sequence[str] | None) -> list[str]:
+    """Required address fields absent from the CSV header."""
+    present = set(fieldnames or ())
+    return [
+        name
+        for name, info in AddressCreate.model_fields.items()
+        if info.is_required() and name not in present
+    ]
+
+
+async def run(
+    rows: Iterable[dict[str, str]],
+    *,
+    batch_size: int,
+    fingerprint: bool,
+    validate: bool,
+    use_redis: bool,
+) -> LoadReport:
+    settings = get_settings()
+    conns = [await asyncpg.connect(_dsn(url)) for url in settings.database_urls]
+    redis = (
+        await create_pool(
+            RedisSettings.from_dsn(settings.redis_url),
+            job_serializer=serialize,
+            job_deserializer=deserialize,
+        )
+        if use_redis
+        else None
+    )
+    try:
+        loader = AddressLoader(
+            conns, redis, batch_size=batch_size, fingerprint=fingerprint, validate=validate
+        )
+        return await loader.load(rows)
+    finally:
+        for conn in conns:
+            await conn.close()
+        if redis is not None:
+            await redis.aclose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog="python -m src.cli.load_addresses", description=__doc__)
+    parser.add_argument(
+        "source",
+        help="CSV with a header row naming address fields; '-' for stdin",
+    )
+    parser.add_argument("--batch-size", type=int, default=50_000, help="Rows per COPY/commit")
+    parser.add_argument(
+        "--fingerprint",
+        action="store_true",
+        help="Compute fingerprints so loaded rows take part in duplicate detection",
+    )
+    parser.add_argument(
+        "--validate",
+        action="store_true",
+        help="Enqueue validation of the loaded rows in batches after each commit",
+    )
+    parser.add_argument(
+        "--no-redis",
+        action="store_true",
+        help="Skip Redis; stats are corrected by the next reconcile run",
+    )
+    args = parser.parse_args()
+    if args.validate and args.no_redis:
+        parser.error("--validate needs Redis")
+    with (
+        contextlib.nullcontext(sys.stdin)
+        if args.source == "-"
+        else open(args.source, encoding="utf-8", newline="")
+    ) as source:
+        reader = csv.DictReader(source)
+        if missing := missing_columns(reader.fieldnames):
+            parser.error(f"CSV header lacks required columns: {', '.join(missing)}")
+
+        logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+        report = asyncio.run(
+            run(
+                reader,
+                batch_size=args.batch_size,
+                fingerprint=args.fingerprint,
+                validate=args.validate,
+                use_redis=not args.no_redis,
+            )
+        )
+    sys.stdout.write(
+        f"Loaded {report.loaded} rows in {report.seconds:.1f}s "
+        f"({report.rows_per_second:.0f} rows/s), rejected {report.rejected}\n"
+    )
+    if report.bulk_id:
+        sys.stdout.write(f"Validation bulk id: {report.bulk_id}\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+"""Redis memory footprint per ARQ queue: `python -m src.cli.redis_memory --output report.json`.
+
+Walks the keyspace with SCAN and sizes every key with MEMORY USAGE, so run it against a
+replica when the keyspace is large.
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+from collections import defaultdict
+from dataclasses import asdict, dataclass, field
+from typing import Any
+
+from arq.constants import default_queue_name, job_key_prefix, result_key_prefix
+from redis.asyncio import Redis
+
+from src.config import get_settings
+from src.workers.serialization import deserialize
+
+ARQ_PREFIX = "arq:"
+
+
+@dataclass
+class Footprint:
+    keys: int = 0
+    bytes: int = 0
+
+    def add(self, size: int | None) -> None:
+        self.keys += 1
+        self.bytes += size or 0
+
+
+@dataclass
+class QueueFootprint:
+    queued: int = 0
+    index: Footprint = field(default_factory=Footprint)
+    jobs: Footprint = field(default_factory=Footprint)
+    results: defaultdict[str, Footprint] = field(default_factory=lambda: defaultdict(Footprint))
+
+
+@dataclass
+class MemoryReport:
+    queues: defaultdict[str, QueueFootprint] = field(
+        default_factory=lambda: defaultdict(QueueFootprint)
+    )
+    other: defaultdict[str, Footprint] = field(default_factory=lambda: defaultdict(Footprint))
+
+    @property
+    def total_bytes(self) -> int:
+        queued = sum(
+            q.index.bytes + q.jobs.bytes + sum(r.bytes for r in q.results.values())
+            for q in self.queues.values()
+        )
+        return queued + sum(f.bytes for f in self.other.values())
+
+    def to_dict(self) -> dict[str, Any]:
+        return {**asdict(self), "total_bytes": self.total_bytes}
+
+
+async def memory_report(
+    redis: Redis,
+    *,
+    scan_count: int = 1000,
+) -> MemoryReport:
+    """Bytes held by each queue's index, queued jobs and kept results (per task), plus the
+    application's own keys grouped by prefix.
+
+    Jobs are attributed to the queue whose sorted set holds their id; results name their
+    queue and task themselves.
+    """
+    report = MemoryReport()
+    queue_of: dict[str, str] = {}
+    async for raw_key in redis.scan_iter(match=f"{default_queue_name}*", _type="zset"):
+        queue = raw_key.decode()
+        async for job_id, _score in redis.zscan_iter(queue):
+            queue_of[job_id.decode()] = queue
+            report.queues[queue].queued += 1
+
+    batch: list[str] = []
+    async for raw_key in redis.scan_iter(count=scan_count):
+        batch.append(raw_key.decode())
+        if len(batch) >= scan_count:
+            await _measure(redis, batch, queue_of, report)
+            batch = []
+    if batch:
+        await _measure(redis, batch, queue_of, report)
+    return report
+
+
+async def _measure(
+    redis: Redis,
+    keys: list[str],
+    queue_of: dict[str, str],
+    report: MemoryReport,
+) -> None:
+    results = [key for key in keys if key.startswith(result_key_prefix)]
+    async with redis.pipeline(transaction=False) as pipe:
+        for key in keys:
+            pipe.memory_usage(key)
+        for key in results:
+            pipe.get(key)
+        replies = await pipe.execute()
+    sizes = dict(zip(keys, replies[: len(keys)], strict=True))
+    payloads = dict(zip(results, replies[len(keys) :], strict=True))
+
+    for key, size in sizes.items():
+        if key in report.queues:
+            report.queues[key].index.add(size)
+        elif key.startswith(job_key_prefix):
+            queue = queue_of.get(key.removeprefix(job_key_prefix), default_queue_name)
+            report.queues[queue].jobs.add(size)
+        elif key.startswith(result_key_prefix):
+            queue, function = _result_owner(payloads[key])
+            report.queues[queue].results[function].add(size)
+        elif key.startswith(ARQ_PREFIX):
+            report.other["arq"].add(size)  # in-progress markers, retry counters, health checks
+        else:
+            report.other[key.split(":", 1)[0]].add(size)
+
+
+def _result_owner(payload: bytes | None) -> tuple[str, str]:
+    if payload is None:
+        return default_queue_name, "unknown"  # expired between SCAN and GET
+    try:
+        data = deserialize(payload)
+    except Exception:
+        return default_queue_name, "unknown"
+    return data.get("q") or default_queue_name, data.get("f", "unknown")
+
+
+async def run(scan_count: int) -> MemoryReport:
+    redis = Redis.from_url(get_settings().redis_url)
+    try:
+        return await memory_report(redis, scan_count=scan_count)
+    finally:
+        await redis.aclose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog="python -m src.cli.redis_memory", description=__doc__)
+    parser.add_argument("--scan-count", type=int, default=1000, help="Keys per SCAN and pipeline")
+    parser.add_argument("--output", help="Write the JSON report here instead of stdout")
+    args = parser.parse_args()
+
+    report = json.dumps(asyncio.run(run(args.scan_count)).to_dict(), indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(report + "\n")
+    else:
+        sys.stdout.write(report + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,6 @@
 from functools import lru_cache
 
+from pydantic import field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -15,9 +16,105 @@ class Settings(BaseSettings):
     postgres_user: str = "app"
     postgres_password: str = "secret"
     postgres_db: str = "shipengine"
+    db_pool_size: int = 5
+    db_max_overflow: int = 10  # per database when sharded
+    # Shard addresses across these databases by id hash (JSON list of asyncpg URLs).
+    # Empty keeps everything in the database above; the first shard holds unsharded tables.
+    database_shard_urls: list[str] = []
+
+    # Slow query log; 0 disables it
+    slow_query_threshold_ms: float = 500.0
+    slow_query_explain_sample_rate: float = 0.0  # share of slow queries whose plan is captured
+    slow_query_explain_timeout_ms: float = 5000.0  # statement_timeout for the EXPLAIN itself
 
     # Redis
     redis_url: str = "redis://localhost:6379/0"
+    redis_reconnect_seconds: float = 5.0  # retry interval after Redis was down at startup
+
+    # Idempotency-Key
+    idempotency_ttl_seconds: float = 86400.0  # how long a stored response is replayed
+    idempotency_lock_seconds: float = 60.0  # claim expiry if the first request dies
+    idempotency_wait_seconds: float = 10.0  # how long a duplicate waits for the first
+
+    # Request profiling, for staging; requests are profiled only when enabled
+    profiling_enabled: bool = False
+    profiling_header: str = "X-Profile"  # requests carrying it are always profiled
+    profiling_sample_rate: float = 0.0  # share of the other requests that is profiled
+    profiling_interval_ms: float = 5.0  # stack sampling interval
+    profiling_ttl_seconds: float = 86400.0  # how long a profile can be fetched
+
+    # Readiness
+    readiness_timeout: float = 1.0
+    readiness_max_pool_usage: float = 0.9  # fraction of db_pool_size + db_max_overflow
+
+    # ShipEngine
+    shipengine_rate_limit: float = 10.0  # upstream requests per second across all workers
+    shipengine_call_timeout: float = 10.0  # deadline for one upstream attempt
+    shipengine_total_timeout: float = 25.0  # budget across all attempts of one validation
+    shipengine_max_attempts: int = 3
+    shipengine_hedge_enabled: bool = False
+    shipengine_hedge_percentile: float = 95.0
+    shipengine_hedge_window: int = 200
+    shipengine_hedge_min_samples: int = 20
+
+    # Circuit breaker (per worker process, around ShipEngine calls)
+    circuit_breaker_window: int = 20
+    circuit_breaker_min_calls: int = 10
+    circuit_breaker_failure_rate: float = 0.5
+    circuit_breaker_slow_call_seconds: float = 5.0
+    circuit_breaker_slow_call_rate: float = 0.5
+    circuit_breaker_open_seconds: float = 30.0
+    circuit_breaker_defer_jitter_seconds: float = 30.0
+
+    # Revalidation
+    revalidation_max_age_days: int = 180
+    revalidation_interval_minutes: int = 10
+    revalidation_chunk_size: int = 500
+    revalidation_budget_share: float = 0.2  # fraction of shipengine_rate_limit
+
+    # Pending sweeper
+    pending_sweep_threshold_minutes: int = 15
+    pending_sweep_interval_minutes: int = 5
+    pending_sweep_batch_size: int = 1000
+
+    # Stats
+    stats_reconcile_interval_minutes: int = 15
+
+    # Webhooks
+    webhook_batch_size: int = 100
+    webhook_timeout: float = 10.0
+    webhook_max_attempts: int = 6
+    webhook_backoff_base: float = 2.0
+    webhook_max_concurrency: int = 20
+    webhook_endpoint_concurrency: int = 2
+
+    # Worker
+    worker_metrics_port: int | None = 9100
+    # Batch validation results per worker process instead of one transaction per job
+    result_buffer_enabled: bool = False
+    result_buffer_max_items: int = 10  # flush when this many outcomes wait (<= max_jobs)
+    result_buffer_flush_ms: int = 20  # or this long after the first one arrived
+    # ARQ job results: nothing reads them back, they are only kept for debugging
+    job_keep_result_seconds: int = 3600  # default for every task
+    job_keep_result: dict[str, int] = {  # per-task override, JSON in the environment
+        "validate_address_task": 0,
+        "enqueue_validation_batch_task": 0,
+    }
+
+    @field_validator(
+        "revalidation_interval_minutes",
+        "pending_sweep_interval_minutes",
+        "stats_reconcile_interval_minutes",
+    )
+    @classmethod
+    def divides_hour(cls, value: int) -> int:
+        # Cron jobs run on `range(0, 60, value)`; anything else spaces runs unevenly, and the
+        # revalidation budget assumes exactly `value` minutes between runs.
+        if not 0 < value < 60 or 60 % value:
+            raise ValueError(
+                "must be a divisor of 60 below 60 (1, 2, 3, 4, 5, 6, 10, 12, 15, 20, 30)"
+            )
+        return value
 
     @property
     def database_url(self) -> str:
@@ -26,6 +123,10 @@ class Settings(BaseSettings):
             f"@{self.postgres_host}:{self.postgres_port}/{self.postgres_db}"
         )
 
+    @property
+    def database_urls(self) -> list[str]:
+        return self.database_shard_urls or [self.database_url]
+
     @property
     def database_url_sync(self) -> str:
         return (
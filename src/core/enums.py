@@ -10,3 +10,17 @@ class ValidationStatus(str, Enum):
 
     def is_final(self) -> bool:
         return self != ValidationStatus.PENDING
+
+
+class DuplicatePolicy(str, Enum):
+    """What `AddressService.create` does when a validated twin already exists."""
+
+    CREATE = "create"
+    RETURN_EXISTING = "return"
+    LINK = "link"
+
+
+class CircuitState(str, Enum):
+    CLOSED = "closed"
+    HALF_OPEN = "half_open"
+    OPEN = "open"
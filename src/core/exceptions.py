@@ -18,6 +18,39 @@ class ValidationError(DomainError):
         super().__init__(f"{field}: {message}")
 
 
+class ServiceUnavailableError(DomainError):
+    def __init__(self, service: str) -> None:
+        self.service = service
+        super().__init__(f"{service} is unavailable")
+
+
+class CircuitOpenError(ServiceUnavailableError):
+    def __init__(self, service: str, retry_after: float) -> None:
+        self.retry_after = retry_after
+        super().__init__(service)
+
+
+class UpstreamTimeoutError(ServiceUnavailableError):
+    def __init__(self, service: str, budget: float) -> None:
+        self.budget = budget
+        super().__init__(service)
+
+
 class AddressNotFoundError(NotFoundError):
     def __init__(self, address_id: UUID) -> None:
         super().__init__("Address", address_id)
+
+
+class WebhookNotFoundError(NotFoundError):
+    def __init__(self, webhook_id: UUID) -> None:
+        super().__init__("Webhook", webhook_id)
+
+
+class BulkValidationNotFoundError(NotFoundError):
+    def __init__(self, bulk_id: UUID) -> None:
+        super().__init__("Bulk validation", bulk_id)
+
+
+class ProfileNotFoundError(NotFoundError):
+    def __init__(self, request_id: str) -> None:
+        super().__init__("Profile", request_id)
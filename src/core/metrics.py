@@ -0,0 +1,53 @@
+from prometheus_client import Counter, Gauge, Histogram
+
+PENDING_SWEEP_STUCK = Gauge(
+    "address_pending_sweep_stuck",
+    "PENDING addresses past the sweep threshold with no queued job, as of the last sweep",
+)
+PENDING_SWEEP_RECOVERED = Counter(
+    "address_pending_sweep_recovered_total",
+    "PENDING addresses re-enqueued by the sweeper",
+)
+
+CIRCUIT_STATE = Gauge(
+    "circuit_breaker_state",
+    "Circuit breaker state: 0 closed, 1 half-open, 2 open",
+    ["name"],
+)
+CIRCUIT_REJECTED = Counter(
+    "circuit_breaker_rejected_total",
+    "Calls rejected without reaching the dependency because the circuit was open",
+    ["name"],
+)
+CIRCUIT_TRANSITIONS = Counter(
+    "circuit_breaker_transitions_total",
+    "Circuit breaker state changes",
+    ["name", "state"],
+)
+VALIDATION_DEFERRED = Counter(
+    "address_validation_deferred_total",
+    "Validation jobs re-enqueued with a delay because the upstream circuit was open",
+)
+VALIDATION_REJECTED_LOCALLY = Counter(
+    "address_validation_rejected_locally_total",
+    "Addresses failed by local field and country rules without an upstream call",
+)
+UPSTREAM_TIMEOUTS = Counter(
+    "shipengine_attempt_timeouts_total",
+    "ShipEngine attempts abandoned at the per-call deadline",
+)
+UPSTREAM_HEDGED = Counter(
+    "shipengine_hedged_requests_total",
+    "Backup ShipEngine requests sent because the first one exceeded the hedge delay",
+)
+
+JOB_QUEUE_WAIT = Histogram(
+    "arq_job_queue_wait_seconds",
+    "Time from a job becoming due to a worker starting it",
+    buckets=(0.01, 0.05, 0.1, 0.5, 1, 5, 10, 30, 60, 300, 900),
+)
+VALIDATION_PHASE_SECONDS = Histogram(
+    "address_validation_phase_seconds",
+    "Time spent per phase of validate_address_task; `total` includes recording the result",
+    ["phase"],
+)
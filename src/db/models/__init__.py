@@ -0,0 +1,11 @@
+from src.db.models.address import Address, ValidationResult
+from src.db.models.base import Base
+from src.db.models.webhook import WebhookDeadLetter, WebhookEndpoint
+
+__all__ = [
+    "Address",
+    "Base",
+    "ValidationResult",
+    "WebhookDeadLetter",
+    "WebhookEndpoint",
+]
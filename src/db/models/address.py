@@ -2,7 +2,7 @@ import uuid
 from datetime import datetime
 from typing import Any
 
-from sqlalchemy import JSON, DateTime, ForeignKey, String, func
+from sqlalchemy import JSON, DateTime, ForeignKey, Index, String, func, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -12,6 +12,16 @@ from src.db.models.base import Base
 
 class Address(Base):
     __tablename__ = "addresses"
+    __table_args__ = (
+        Index("ix_addresses_validated_at_id", "validated_at", "id"),
+        Index(
+            "ix_addresses_pending_since",
+            text("coalesce(updated_at, created_at)"),
+            "id",
+            postgresql_where=text("validation_status = 'pending'"),
+            sqlite_where=text("validation_status = 'pending'"),
+        ),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
@@ -28,6 +38,9 @@ class Address(Base):
     state_province: Mapped[str] = mapped_column(String(100))
     postal_code: Mapped[str] = mapped_column(String(50))
     country_code: Mapped[str] = mapped_column(String(2))
+    # Webhook endpoints registered under this client receive the address's outcomes.
+    client_id: Mapped[str | None] = mapped_column(String(255))
+    fingerprint: Mapped[str | None] = mapped_column(String(64), index=True)
     validation_status: Mapped[ValidationStatus] = mapped_column(
         String(20),
         default=ValidationStatus.PENDING,
@@ -44,6 +57,8 @@ class Address(Base):
     validation_results: Mapped[list["ValidationResult"]] = relationship(
         back_populates="address",
         cascade="all, delete-orphan",
+        # ON DELETE CASCADE removes the results; don't load them just to delete them.
+        passive_deletes=True,
         order_by="desc(ValidationResult.created_at)",
     )
 
@@ -62,6 +77,7 @@ class ValidationResult(Base):
     address_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         ForeignKey("addresses.id", ondelete="CASCADE"),
+        index=True,
     )
     status: Mapped[ValidationStatus] = mapped_column(String(20))
     matched_address: Mapped[dict[str, Any] | None] = mapped_column(JSON)
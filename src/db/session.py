@@ -1,33 +1,86 @@
+import asyncio
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
 
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
     AsyncSession,
     async_sessionmaker,
     create_async_engine,
 )
 
-from src.config import get_settings
+from src.config import Settings, get_settings
+from src.db.sharding import create_sharded_session_maker
+from src.db.slow_query import SlowQueryLog
 
-settings = get_settings()
+_engines: list[AsyncEngine] = []
+_session_maker: async_sessionmaker[AsyncSession] | None = None
 
-engine = create_async_engine(
-    settings.database_url,
-    echo=settings.debug,
-    pool_size=5,
-    max_overflow=10,
-)
 
-async_session_maker = async_sessionmaker(
-    engine,
-    class_=AsyncSession,
-    expire_on_commit=False,
-)
+def create_engine(settings: Settings, url: str | None = None) -> AsyncEngine:
+    engine = create_async_engine(
+        url or settings.database_url,
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+    )
+    if settings.slow_query_threshold_ms > 0:
+        SlowQueryLog(
+            engine,
+            settings.slow_query_threshold_ms / 1000,
+            explain_sample_rate=settings.slow_query_explain_sample_rate,
+            explain_timeout=settings.slow_query_explain_timeout_ms / 1000,
+        ).install()
+    return engine
+
+
+def create_engines(settings: Settings) -> list[AsyncEngine]:
+    """One engine per database; the first also holds every table that isn't sharded."""
+    return [create_engine(settings, url) for url in settings.database_urls]
+
+
+def create_session_maker(*engines: AsyncEngine) -> async_sessionmaker[AsyncSession]:
+    """Sessions on one database, or sessions routing addresses across several shards."""
+    if len(engines) > 1:
+        return create_sharded_session_maker(engines)
+    engine = engines[0]
+    return async_sessionmaker(
+        engine,
+        class_=AsyncSession,
+        expire_on_commit=False,
+    )
+
+
+async def prewarm(engine: AsyncEngine, connections: int) -> None:
+    """Open `connections` pooled connections up front so first requests skip the handshake."""
+
+    async def ping() -> None:
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+
+    await asyncio.gather(*(ping() for _ in range(connections)))
+
+
+def get_session_maker() -> async_sessionmaker[AsyncSession]:
+    """Process-wide session maker for workers and scripts, created on first use."""
+    global _engines, _session_maker
+    if _session_maker is None:
+        _engines = create_engines(get_settings())
+        _session_maker = create_session_maker(*_engines)
+    return _session_maker
+
+
+async def dispose_engine() -> None:
+    global _engines, _session_maker
+    for engine in _engines:
+        await engine.dispose()
+    _engines = []
+    _session_maker = None
 
 
 @asynccontextmanager
 async def get_session() -> AsyncGenerator[AsyncSession, None]:
-    async with async_session_maker() as session:
+    async with get_session_maker()() as session:
         try:
             yield session
             await session.commit()
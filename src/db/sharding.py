@@ -0,0 +1,82 @@
+"""Hash sharding of `addresses` and `validation_results` across several databases.
+
+An address lives on the shard picked by hashing its id, and its validation results live
+with it. Every other table (webhooks) lives on the first shard only. The number of shards
+decides where every existing row lives, so it can't change without moving rows.
+"""
+
+import hashlib
+import uuid
+from collections.abc import Iterable, Sequence
+from typing import Any
+
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+from sqlalchemy.ext.horizontal_shard import ShardedSession
+from sqlalchemy.orm import Mapper, ORMExecuteState
+
+from src.db.models.address import Address, ValidationResult
+
+PRIMARY_SHARD = "0"
+SHARD_COUNT_KEY = "shard_count"
+
+
+def shard_for(address_id: uuid.UUID, shard_count: int) -> str:
+    # Hashed rather than `id.int % n` so the spread doesn't depend on how ids are generated.
+    digest = hashlib.blake2b(address_id.bytes, digest_size=8).digest()
+    return str(int.from_bytes(digest, "big") % shard_count)
+
+
+def shard_count(session: AsyncSession) -> int:
+    count: int = session.info.get(SHARD_COUNT_KEY, 1)
+    return count
+
+
+def create_sharded_session_maker(
+    engines: Sequence[AsyncEngine],
+) -> async_sessionmaker[AsyncSession]:
+    count = len(engines)
+    all_shards = [str(shard) for shard in range(count)]
+
+    def shard_chooser(_mapper: Mapper[Any] | None, instance: Any, **_kw: Any) -> str:
+        if isinstance(instance, Address):
+            # The column default is only applied on INSERT, after the shard is chosen.
+            if instance.id is None:
+                instance.id = uuid.uuid4()
+            return shard_for(instance.id, count)
+        if isinstance(instance, ValidationResult):
+            return shard_for(instance.address_id, count)
+        return PRIMARY_SHARD
+
+    def identity_chooser(
+        mapper: Mapper[Any],
+        primary_key: Sequence[Any],
+        *,
+        lazy_loaded_from: Any,
+        **_kw: Any,
+    ) -> Iterable[str]:
+        if lazy_loaded_from is not None:
+            return [str(lazy_loaded_from.identity_token)]
+        if mapper.class_ is Address:
+            return [shard_for(primary_key[0], count)]
+        if mapper.class_ is ValidationResult:
+            return all_shards
+        return [PRIMARY_SHARD]
+
+    def execute_chooser(context: ORMExecuteState) -> Iterable[str]:
+        if context.is_select and context.lazy_loaded_from is not None:
+            return [str(context.lazy_loaded_from.identity_token)]
+        mapper = context.bind_mapper
+        if mapper is not None and mapper.class_ not in (Address, ValidationResult):
+            return [PRIMARY_SHARD]
+        return all_shards
+
+    return async_sessionmaker(
+        class_=AsyncSession,
+        sync_session_class=ShardedSession,
+        shards={str(shard): engine.sync_engine for shard, engine in enumerate(engines)},
+        shard_chooser=shard_chooser,
+        identity_chooser=identity_chooser,
+        execute_chooser=execute_chooser,
+        expire_on_commit=False,
+        info={SHARD_COUNT_KEY: count},
+    )
@@ -0,0 +1,135 @@
+import asyncio
+import logging
+import random
+import re
+import time
+from collections.abc import Mapping
+from contextvars import ContextVar
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import Connection
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+logger = logging.getLogger(__name__)
+
+MAX_LOGGED_PARAMETERS = 20
+MAX_STATEMENT_LENGTH = 2000
+
+_QUERY_START = "slow_query_start"
+_LOCKING_CLAUSE = re.compile(r"\bFOR\s+(?:NO\s+KEY\s+UPDATE|UPDATE|KEY\s+SHARE|SHARE)\b", re.I)
+_origin: ContextVar[str | None] = ContextVar("query_origin", default=None)
+
+
+def set_query_origin(label: str) -> None:
+    """Name the route or task that statements run by the current asyncio task belong to."""
+    _origin.set(label)
+
+
+def redact(parameters: Any) -> Any:
+    """Keep the shape and types of bound parameters, never their values (addresses are PII)."""
+    if parameters is None:
+        return None
+    if isinstance(parameters, Mapping):
+        return {key: redact(value) for key, value in parameters.items()}
+    if isinstance(parameters, list | tuple):
+        shown = [redact(value) for value in parameters[:MAX_LOGGED_PARAMETERS]]
+        if len(parameters) > MAX_LOGGED_PARAMETERS:
+            shown.append(f"... {len(parameters) - MAX_LOGGED_PARAMETERS} more")
+        return shown
+    return f"<{type(parameters).__name__}>"
+
+
+def explain_statement(statement: str) -> str:
+    # ANALYZE executes the statement again, so writes and locking reads (which would take
+    # their row locks again) only get their estimated plan.
+    if statement.lstrip()[:6].upper() == "SELECT" and not _LOCKING_CLAUSE.search(statement):
+        return f"EXPLAIN (ANALYZE, BUFFERS) {statement}"
+    return f"EXPLAIN {statement}"
+
+
+class SlowQueryLog:
+    """Logs statements slower than `threshold` seconds, with redacted parameters and origin.
+
+    A `explain_sample_rate` share of slow statements also gets its plan captured on a separate
+    connection in a background task, at most one at a time, so the slow request is not held up
+    by its own diagnosis. Plans are only captured on PostgreSQL.
+    """
+
+    def __init__(
+        self,
+        engine: AsyncEngine,
+        threshold: float,
+        *,
+        explain_sample_rate: float = 0.0,
+        explain_timeout: float = 5.0,
+    ) -> None:
+        self._engine = engine
+        self._threshold = threshold
+        self._explain_sample_rate = explain_sample_rate
+        self._explain_timeout = explain_timeout
+        self._explaining: asyncio.Task[None] | None = None
+
+    def install(self) -> None:
+        event.listen(self._engine.sync_engine, "before_cursor_execute", self._before)
+        event.listen(self._engine.sync_engine, "after_cursor_execute", self._after)
+
+    def _before(self, conn: Connection, *_args: Any) -> None:
+        conn.info[_QUERY_START] = time.perf_counter()
+
+    def _after(
+        self,
+        conn: Connection,
+        _cursor: Any,
+        statement: str,
+        parameters: Any,
+        _context: Any,
+        executemany: bool,
+    ) -> None:
+        elapsed = time.perf_counter() - conn.info.pop(_QUERY_START, time.perf_counter())
+        if elapsed < self._threshold or statement.startswith("EXPLAIN"):
+            return
+
+        origin = _origin.get() or "-"
+        details = {
+            "duration_ms": round(elapsed * 1000, 1),
+            "origin": origin,
+            "statement": " ".join(statement.split())[:MAX_STATEMENT_LENGTH],
+            "parameters": redact(parameters),
+            "executemany": executemany,
+        }
+        logger.warning(
+            "Slow query %.1fms origin=%s parameters=%s statement=%s",
+            details["duration_ms"],
+            origin,
+            details["parameters"],
+            details["statement"],
+            extra={"slow_query": details},
+        )
+        if not executemany and self._should_explain():
+            self._explaining = asyncio.get_running_loop().create_task(
+                self._explain(statement, parameters, origin)
+            )
+
+    def _should_explain(self) -> bool:
+        return (
+            self._engine.dialect.name == "postgresql"
+            and (self._explaining is None or self._explaining.done())
+            and random.random() < self._explain_sample_rate
+        )
+
+    async def _explain(self, statement: str, parameters: Any, origin: str) -> None:
+        try:
+            async with self._engine.connect() as conn:
+                timeout_ms = int(self._explain_timeout * 1000)
+                await conn.exec_driver_sql(f"SET LOCAL statement_timeout = {timeout_ms}")
+                result = await conn.exec_driver_sql(explain_statement(statement), parameters)
+                plan = "\n".join(row[0] for row in result)
+                await conn.rollback()
+        except SQLAlchemyError as e:
+            logger.warning("Failed to explain slow query from %s: %s", origin, e)
+            return
+        logger.warning(
+            "Slow query plan origin=%s\n%s", origin, plan, extra={"slow_query_plan": plan}
+        )
@@ -1,6 +1,9 @@
+import asyncio
+import contextlib
 import logging
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
+from typing import Any
 
 from arq import create_pool
 from arq.connections import RedisSettings
@@ -8,71 +11,166 @@ from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 
-from src.api.dependencies.services import set_arq_pool
+from src.api.middleware import IdempotencyMiddleware, ProfilingMiddleware
 from src.api.routes import api_router
-from src.config import get_settings
-from src.core.exceptions import DomainError, NotFoundError
-from src.db.session import engine
+from src.config import Settings, get_settings
+from src.core.exceptions import DomainError, NotFoundError, ServiceUnavailableError
+from src.db.session import create_engines, create_session_maker, prewarm
+from src.services.profiler import install_sql_capture
+from src.services.status_stream import StatusBroadcaster
+from src.workers.serialization import deserialize, serialize
 
 logger = logging.getLogger(__name__)
-settings = get_settings()
 
 
 @asynccontextmanager
-async def lifespan(_app: FastAPI) -> AsyncGenerator[None, None]:
+async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     logger.info("Starting application...")
+    settings: Settings = app.state.settings
+
+    engines = create_engines(settings)
+    app.state.engines = engines
+    app.state.engine = engines[0]
+    app.state.session_maker = create_session_maker(*engines)
+    if settings.profiling_enabled:
+        for engine in engines:
+            install_sql_capture(engine)
+    try:
+        await asyncio.gather(*(prewarm(engine, settings.db_pool_size) for engine in engines))
+        logger.info(
+            "Database pools pre-warmed with %d connections each (%d databases)",
+            settings.db_pool_size,
+            len(engines),
+        )
+    except Exception as e:
+        logger.warning("Failed to pre-warm database pool: %s", e)
 
+    reconnect: asyncio.Task[None] | None = None
     try:
-        arq_pool = await create_pool(RedisSettings.from_dsn(settings.redis_url))
-        set_arq_pool(arq_pool)
-        logger.info("ARQ pool initialized")
+        await _connect_redis(app, settings)
     except Exception as e:
-        logger.warning("Failed to connect to Redis: %s", e)
-        set_arq_pool(None)
+        logger.warning("Failed to connect to Redis, retrying in the background: %s", e)
+        reconnect = asyncio.create_task(_reconnect_redis(app, settings))
 
     yield
 
     logger.info("Shutting down...")
-    await engine.dispose()
-
-
-app = FastAPI(
-    title="ShipEngine Address Validation Service",
-    description="CRUD API for address validation with background processing",
-    version="1.0.0",
-    lifespan=lifespan,
-    docs_url="/docs" if settings.debug else None,
-    redoc_url="/redoc" if settings.debug else None,
-)
-
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+    if reconnect:
+        reconnect.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await reconnect
+    if app.state.status_broadcaster:
+        await app.state.status_broadcaster.stop()
+    if app.state.arq_pool:
+        await app.state.arq_pool.aclose()
+    for engine in engines:
+        await engine.dispose()
+
+
+async def _connect_redis(app: FastAPI, settings: Settings) -> None:
+    arq_pool = await create_pool(
+        RedisSettings.from_dsn(settings.redis_url),
+        job_serializer=serialize,
+        job_deserializer=deserialize,
+    )
+    broadcaster = StatusBroadcaster(arq_pool)
+    try:
+        await broadcaster.start()
+    except Exception:
+        await arq_pool.aclose()
+        raise
+    app.state.arq_pool = arq_pool
+    app.state.status_broadcaster = broadcaster
+    logger.info("ARQ pool initialized")
+
+
+async def _reconnect_redis(app: FastAPI, settings: Settings) -> None:
+    """Retry until Redis is reachable, so an instance started during an outage becomes
+    ready without a restart. Once created, the pool reconnects by itself."""
+    while True:
+        await asyncio.sleep(settings.redis_reconnect_seconds)
+        try:
+            await _connect_redis(app, settings)
+        except Exception as e:
+            logger.warning("Still unable to connect to Redis: %s", e)
+        else:
+            return
 
 
-@app.exception_handler(NotFoundError)
 async def not_found_handler(_request: Request, exc: NotFoundError) -> JSONResponse:
     return JSONResponse(status_code=404, content={"detail": str(exc), "code": "NOT_FOUND"})
 
 
-@app.exception_handler(DomainError)
 async def domain_error_handler(_request: Request, exc: DomainError) -> JSONResponse:
     return JSONResponse(status_code=400, content={"detail": str(exc), "code": "DOMAIN_ERROR"})
 
 
-app.include_router(api_router, prefix="/api/v1")
+async def service_unavailable_handler(
+    _request: Request, exc: ServiceUnavailableError
+) -> JSONResponse:
+    return JSONResponse(
+        status_code=503, content={"detail": str(exc), "code": "SERVICE_UNAVAILABLE"}
+    )
+
+
+def create_app(settings: Settings | None = None) -> FastAPI:
+    """Build the API. Connections are opened in `lifespan`, never at import or build time."""
+    settings = settings or get_settings()
+
+    app = FastAPI(
+        title="ShipEngine Address Validation Service",
+        description="CRUD API for address validation with background processing",
+        version="1.0.0",
+        lifespan=lifespan,
+        docs_url="/docs" if settings.debug else None,
+        redoc_url="/redoc" if settings.debug else None,
+    )
+    app.state.settings = settings
+    app.state.engines = []
+    app.state.engine = None
+    app.state.session_maker = None
+    app.state.arq_pool = None
+    app.state.status_broadcaster = None
+
+    app.add_middleware(IdempotencyMiddleware)
+    if settings.profiling_enabled:
+        # Outermost of ours, so replayed idempotent responses are profiled too.
+        app.add_middleware(ProfilingMiddleware)
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=["*"],
+        allow_credentials=True,
+        allow_methods=["*"],
+        allow_headers=["*"],
+    )
+
+    app.add_exception_handler(NotFoundError, not_found_handler)  # type: ignore[arg-type]
+    app.add_exception_handler(DomainError, domain_error_handler)  # type: ignore[arg-type]
+    app.add_exception_handler(
+        ServiceUnavailableError,
+        service_unavailable_handler,  # type: ignore[arg-type]
+    )
+
+    app.include_router(api_router, prefix="/api/v1")
+    return app
+
+
+def __getattr__(name: str) -> Any:
+    # `uvicorn src.main:app` keeps working without building the app on import.
+    if name == "app":
+        app = create_app()
+        globals()["app"] = app
+        return app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 if __name__ == "__main__":
     import uvicorn
 
     uvicorn.run(
-        "src.main:app",
+        "src.main:create_app",
+        factory=True,
         host="0.0.0.0",
         port=8000,
-        reload=settings.debug,
+        reload=get_settings().debug,
     )
@@ -1,47 +1,327 @@
+import heapq
+from collections import Counter
+from collections.abc import Sequence, Set
+from datetime import datetime
+from itertools import islice
+from operator import attrgetter
+from typing import Any, cast
 from uuid import UUID
 
-from sqlalchemy import select
-from sqlalchemy.orm import selectinload
+from sqlalchemy import (
+    ColumnElement,
+    Table,
+    bindparam,
+    delete,
+    func,
+    insert,
+    literal,
+    select,
+    tuple_,
+    update,
+)
+from sqlalchemy.orm import load_only, selectinload
+from sqlalchemy.sql.base import ExecutableOption
 
 from src.core.enums import ValidationStatus
 from src.db.models.address import Address, ValidationResult
+from src.db.sharding import shard_count
 from src.repositories.base import BaseRepository
 
+# Executemany writes use Core tables: ORM bulk statements can't be routed to a shard.
+_addresses = cast(Table, Address.__table__)
+_results = cast(Table, ValidationResult.__table__)
+
 
 class AddressRepository(BaseRepository[Address]):
     model = Address
 
-    async def get_by_id_with_results(self, address_id: UUID) -> Address | None:
+    async def get_by_id_with_results(
+        self, address_id: UUID, fields: Set[str] | None = None
+    ) -> Address | None:
+        stmt = select(Address).where(Address.id == address_id).options(*_projection(fields))
+        result = await self._session.execute(stmt, bind_arguments=self._shard_of(address_id))
+        return result.scalar_one_or_none()
+
+    async def get_all_with_results(
+        self, limit: int = 100, offset: int = 0, fields: Set[str] | None = None
+    ) -> list[Address]:
+        stmt = select(Address).options(*_projection(fields)).order_by(Address.created_at.desc())
+        shards = shard_count(self._session)
+        if shards == 1:
+            result = await self._session.execute(stmt.limit(limit).offset(offset))
+            return list(result.scalars().all())
+
+        # The page is among the first `offset + limit` rows of each shard: read those from
+        # every shard and merge them newest first. Deep offsets cost that on every shard.
+        pages = []
+        for shard in range(shards):
+            result = await self._session.execute(
+                stmt.limit(offset + limit), bind_arguments={"shard_id": str(shard)}
+            )
+            pages.append(result.scalars().all())
+        merged = heapq.merge(*pages, key=attrgetter("created_at"), reverse=True)
+        return list(islice(merged, offset, offset + limit))
+
+    async def get_by_status(self, status: ValidationStatus, limit: int = 100) -> list[Address]:
         stmt = (
             select(Address)
-            .where(Address.id == address_id)
-            .options(selectinload(Address.validation_results))
+            .where(Address.validation_status == status)
+            .order_by(Address.created_at.desc())
+            .limit(limit)
         )
         result = await self._session.execute(stmt)
-        return result.scalar_one_or_none()
+        # Sharded, each shard returns up to `limit` rows; keep the newest overall.
+        return sorted(result.scalars(), key=attrgetter("created_at"), reverse=True)[:limit]
 
-    async def get_all_with_results(self, limit: int = 100, offset: int = 0) -> list[Address]:
+    async def get_validated_by_fingerprint(self, fingerprint: str) -> Address | None:
         stmt = (
             select(Address)
+            .where(Address.fingerprint == fingerprint, Address.validated_at.is_not(None))
             .options(selectinload(Address.validation_results))
-            .order_by(Address.created_at.desc())
-            .limit(limit)
-            .offset(offset)
+            .order_by(Address.validated_at.desc())
+            .limit(1)
         )
         result = await self._session.execute(stmt)
-        return list(result.scalars().all())
+        # Sharded, there is one candidate per shard.
+        return max(result.scalars(), key=attrgetter("validated_at"), default=None)
 
-    async def get_by_status(self, status: ValidationStatus, limit: int = 100) -> list[Address]:
+    async def get_without_fingerprint(self, limit: int = 1000) -> list[Address]:
         stmt = (
             select(Address)
-            .where(Address.validation_status == status)
-            .order_by(Address.created_at.desc())
+            .where(Address.fingerprint.is_(None))
+            .options(
+                load_only(
+                    Address.address_line1,
+                    Address.address_line2,
+                    Address.address_line3,
+                    Address.city_locality,
+                    Address.state_province,
+                    Address.postal_code,
+                    Address.country_code,
+                )
+            )
             .limit(limit)
         )
         result = await self._session.execute(stmt)
         return list(result.scalars().all())
 
+    async def set_fingerprints(self, fingerprints: dict[UUID, str]) -> None:
+        stmt = (
+            update(_addresses)
+            .where(_addresses.c.id == bindparam("b_id"))
+            .values(fingerprint=bindparam("b_fingerprint"))
+        )
+        await self._execute_by_address(
+            stmt,
+            [{"b_id": address_id, "b_fingerprint": fp} for address_id, fp in fingerprints.items()],
+            key="b_id",
+        )
+
+    async def set_validation_statuses(
+        self, statuses: dict[UUID, tuple[ValidationStatus, datetime]]
+    ) -> None:
+        stmt = (
+            update(_addresses)
+            .where(_addresses.c.id == bindparam("b_id"))
+            .values(
+                validation_status=bindparam("b_status"),
+                validated_at=bindparam("b_validated_at"),
+            )
+        )
+        await self._execute_by_address(
+            stmt,
+            [
+                {"b_id": address_id, "b_status": status, "b_validated_at": validated_at}
+                for address_id, (status, validated_at) in statuses.items()
+            ],
+            key="b_id",
+        )
+
+    async def get_stale_keys(
+        self,
+        validated_before: datetime,
+        after: tuple[datetime, UUID] | None = None,
+        limit: int = 500,
+    ) -> list[tuple[datetime, UUID]]:
+        """Keyset page of `(validated_at, id)` for addresses validated before a cutoff."""
+        stmt = select(Address.validated_at, Address.id).where(
+            Address.validated_at < validated_before
+        )
+        if after:
+            stmt = stmt.where(tuple_(Address.validated_at, Address.id) > after)
+        stmt = stmt.order_by(Address.validated_at, Address.id).limit(limit)
+        result = await self._session.execute(stmt)
+        keys = [
+            (validated_at, address_id)
+            for validated_at, address_id in result.tuples()
+            if validated_at is not None
+        ]
+        # Sharded, merge the shards' pages so the last key is a valid cursor for the next.
+        return sorted(keys)[:limit]
+
+    async def get_pending_keys(
+        self,
+        pending_before: datetime,
+        after: tuple[datetime, UUID] | None = None,
+        limit: int = 1000,
+    ) -> list[tuple[datetime, UUID]]:
+        """Keyset page of `(pending since, id)` for addresses PENDING since before a cutoff."""
+        pending_since = func.coalesce(Address.updated_at, Address.created_at)
+        # Rendered inline so generic plans can still match ix_addresses_pending_since.
+        pending = literal(ValidationStatus.PENDING.value, literal_execute=True)
+        stmt = select(pending_since, Address.id).where(
+            Address.validation_status == pending,
+            pending_since < pending_before,
+        )
+        if after:
+            stmt = stmt.where(tuple_(pending_since, Address.id) > after)
+        stmt = stmt.order_by(pending_since, Address.id).limit(limit)
+        result = await self._session.execute(stmt)
+        # Sharded, merge the shards' pages so the last key is a valid cursor for the next.
+        return sorted(result.tuples())[:limit]
+
+    async def get_by_ids(self, address_ids: list[UUID]) -> list[Address]:
+        addresses: list[Address] = []
+        for shard_ids in self._group_by_shard(address_ids):
+            stmt = (
+                select(Address)
+                .where(Address.id.in_(shard_ids))
+                .options(
+                    load_only(
+                        Address.validation_status,
+                        Address.country_code,
+                        Address.validated_at,
+                    )
+                )
+            )
+            result = await self._session.execute(stmt, bind_arguments=self._shard_of(shard_ids[0]))
+            addresses.extend(result.scalars())
+        return addresses
+
+    async def lock_existing_ids(self, address_ids: Sequence[UUID]) -> set[UUID]:
+        """Those of `address_ids` that still exist, kept from being deleted until commit."""
+        existing: set[UUID] = set()
+        for shard_ids in self._group_by_shard(address_ids):
+            # KEY SHARE blocks DELETE but not the UPDATE of the same rows that follows.
+            stmt = (
+                select(Address.id).where(Address.id.in_(shard_ids)).with_for_update(key_share=True)
+            )
+            result = await self._session.execute(stmt, bind_arguments=self._shard_of(shard_ids[0]))
+            existing.update(result.scalars())
+        return existing
+
+    async def reset_validation(
+        self,
+        *,
+        statuses: Sequence[ValidationStatus] = (),
+        country_codes: Sequence[str] = (),
+        validated_before: datetime | None = None,
+    ) -> list[tuple[UUID, str, str]]:
+        """Set every matching non-PENDING address back to PENDING in one statement.
+
+        Returns `(id, previous_status, country_code)` for each reset row. Rows already
+        PENDING are skipped: they have a validation job queued.
+        """
+        conditions = [
+            Address.validation_status != ValidationStatus.PENDING,
+            *_filter_conditions(statuses, country_codes, validated_before),
+        ]
+
+        previous = select(Address.id, Address.validation_status).where(*conditions).subquery()
+        stmt = (
+            update(Address)
+            .where(Address.id == previous.c.id)
+            .values(validation_status=ValidationStatus.PENDING, validated_at=None)
+            .returning(Address.id, previous.c.validation_status, Address.country_code)
+            .execution_options(synchronize_session=False)
+        )
+        result = await self._session.execute(stmt)
+        return [(address_id, status, country) for address_id, status, country in result.tuples()]
+
+    async def delete_chunk(
+        self,
+        *,
+        ids: Sequence[UUID] = (),
+        statuses: Sequence[ValidationStatus] = (),
+        country_codes: Sequence[str] = (),
+        validated_before: datetime | None = None,
+        after: UUID | None = None,
+        limit: int = 1000,
+    ) -> list[tuple[UUID, str, str]]:
+        """Delete up to `limit` matching addresses with ids above `after`, in id order.
+
+        Validation results go with them through `ON DELETE CASCADE`. Returns
+        `(id, validation_status, country_code)` of each deleted row.
+        """
+        conditions = _filter_conditions(statuses, country_codes, validated_before)
+        if ids:
+            conditions.append(Address.id.in_(ids))
+        if after:
+            conditions.append(Address.id > after)
+
+        chunk = select(Address.id).where(*conditions).order_by(Address.id).limit(limit)
+        if shard_count(self._session) > 1:
+            # Each shard would delete its own first `limit` ids, so the highest deleted id
+            # would skip rows on the others. Pick the overall first `limit` ids instead.
+            ids = sorted((await self._session.execute(chunk)).scalars())[:limit]
+            if not ids:
+                return []
+            chunk = select(Address.id).where(Address.id.in_(ids))
+        stmt = (
+            delete(Address)
+            .where(Address.id.in_(chunk.scalar_subquery()))
+            .returning(Address.id, Address.validation_status, Address.country_code)
+            .execution_options(synchronize_session=False)
+        )
+        result = await self._session.execute(stmt)
+        return [(address_id, status, country) for address_id, status, country in result.tuples()]
+
+    async def count_by_status_and_country(self) -> list[tuple[str, str, int]]:
+        # Country codes are stored as submitted; the stats hash keys them upper case.
+        country = func.upper(Address.country_code)
+        stmt = select(Address.validation_status, country, func.count()).group_by(
+            Address.validation_status, country
+        )
+        result = await self._session.execute(stmt)
+        # Sharded, the same group appears once per shard.
+        counts: Counter[tuple[str, str]] = Counter()
+        for status, country, count in result.tuples():
+            counts[status, country] += count
+        return [(status, country, count) for (status, country), count in counts.items()]
+
     async def add_validation_result(self, validation: ValidationResult) -> ValidationResult:
         self._session.add(validation)
         await self._session.flush()
         return validation
+
+    async def add_validation_results(self, rows: Sequence[dict[str, Any]]) -> None:
+        """Insert many results in one multi-row INSERT (per shard), without loading them."""
+        await self._execute_by_address(insert(_results), rows, key="address_id")
+
+
+def _filter_conditions(
+    statuses: Sequence[ValidationStatus],
+    country_codes: Sequence[str],
+    validated_before: datetime | None,
+) -> list[ColumnElement[bool]]:
+    conditions: list[ColumnElement[bool]] = []
+    if statuses:
+        conditions.append(Address.validation_status.in_(statuses))
+    if country_codes:
+        conditions.append(func.upper(Address.country_code).in_(country_codes))
+    if validated_before:
+        conditions.append(Address.validated_at < validated_before)
+    return conditions
+
+
+def _projection(fields: Set[str] | None) -> list[ExecutableOption]:
+    """Loader options reading only `fields`; `None` loads every column and the results."""
+    if fields is None:
+        return [selectinload(Address.validation_results)]
+
+    columns = [getattr(Address, f) for f in fields if f != "validation_results"]
+    # `created_at` orders list pages, and merging pages from shards reads it.
+    options: list[ExecutableOption] = [load_only(Address.id, Address.created_at, *columns)]
+    if "validation_results" in fields:
+        options.append(selectinload(Address.validation_results))
+    return options
@@ -1,9 +1,13 @@
+from collections import defaultdict
+from collections.abc import Sequence
+from typing import Any
 from uuid import UUID
 
-from sqlalchemy import func, select
+from sqlalchemy import Executable, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.db.models.base import Base
+from src.db.sharding import shard_count, shard_for
 
 
 class BaseRepository[T: Base]:
@@ -33,7 +37,40 @@ class BaseRepository[T: Base]:
         await self._session.delete(entity)
         await self._session.flush()
 
+    async def commit(self) -> None:
+        await self._session.commit()
+
     async def count(self) -> int:
         stmt = select(func.count()).select_from(self.model)
         result = await self._session.execute(stmt)
-        return result.scalar() or 0
+        # One row per shard when sharded.
+        return sum(result.scalars())
+
+    def _shard_of(self, address_id: UUID) -> dict[str, Any] | None:
+        """Bind arguments that send a statement only to the shard holding `address_id`."""
+        shards = shard_count(self._session)
+        return {"shard_id": shard_for(address_id, shards)} if shards > 1 else None
+
+    def _group_by_shard(self, address_ids: Sequence[UUID]) -> list[list[UUID]]:
+        """`address_ids` split by the shard holding them; one group when not sharded."""
+        shards = shard_count(self._session)
+        if shards == 1:
+            return [list(address_ids)] if address_ids else []
+        groups: defaultdict[str, list[UUID]] = defaultdict(list)
+        for address_id in address_ids:
+            groups[shard_for(address_id, shards)].append(address_id)
+        return list(groups.values())
+
+    async def _execute_by_address(
+        self, stmt: Executable, rows: Sequence[dict[str, Any]], key: str
+    ) -> None:
+        """Executemany `stmt`, sending each row to the shard of the address id in `row[key]`."""
+        shards = shard_count(self._session)
+        if shards == 1:
+            await self._session.execute(stmt, rows)
+            return
+        by_shard: defaultdict[str, list[dict[str, Any]]] = defaultdict(list)
+        for row in rows:
+            by_shard[shard_for(row[key], shards)].append(row)
+        for shard, shard_rows in by_shard.items():
+            await self._session.execute(stmt, shard_rows, bind_arguments={"shard_id": shard})
@@ -0,0 +1,27 @@
+from sqlalchemy import select
+
+from src.db.models.webhook import WebhookDeadLetter, WebhookEndpoint
+from src.repositories.base import BaseRepository
+
+
+class WebhookRepository(BaseRepository[WebhookEndpoint]):
+    model = WebhookEndpoint
+
+    async def get_by_client(self, client_id: str) -> list[WebhookEndpoint]:
+        stmt = (
+            select(WebhookEndpoint)
+            .where(WebhookEndpoint.client_id == client_id)
+            .order_by(WebhookEndpoint.created_at)
+        )
+        result = await self._session.execute(stmt)
+        return list(result.scalars().all())
+
+    async def get_active(self) -> list[WebhookEndpoint]:
+        stmt = select(WebhookEndpoint).where(WebhookEndpoint.is_active.is_(True))
+        result = await self._session.execute(stmt)
+        return list(result.scalars().all())
+
+    async def add_dead_letter(self, dead_letter: WebhookDeadLetter) -> WebhookDeadLetter:
+        self._session.add(dead_letter)
+        await self._session.flush()
+        return dead_letter
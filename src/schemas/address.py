@@ -1,8 +1,9 @@
 from datetime import datetime
+from functools import lru_cache
 from typing import Any
 from uuid import UUID
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, create_model, field_validator, model_validator
 
 from src.core.enums import ValidationStatus
 
@@ -23,7 +24,12 @@ class AddressBase(BaseModel):
 
 
 class AddressCreate(AddressBase):
-    pass
+    client_id: str | None = Field(
+        None,
+        max_length=255,
+        examples=["acme"],
+        description="Owner; only this client's webhooks receive the validation outcome",
+    )
 
 
 class AddressUpdate(BaseModel):
@@ -65,3 +71,93 @@ class AddressListResponse(BaseModel):
     total: int
     limit: int
     offset: int
+
+
+ADDRESS_FIELDS = frozenset(AddressResponse.model_fields)
+
+
+@lru_cache(maxsize=128)
+def sparse_address_models(
+    fields: frozenset[str],
+) -> tuple[type[BaseModel], type[BaseModel]]:
+    """`AddressResponse` and `AddressListResponse` restricted to `fields`, built once per set."""
+    item: type[BaseModel] = create_model(  # type: ignore[call-overload]
+        "SparseAddressResponse",
+        __config__=ConfigDict(from_attributes=True),
+        **{
+            name: (info.annotation, info)
+            for name, info in AddressResponse.model_fields.items()
+            if name in fields
+        },
+    )
+    page: type[BaseModel] = create_model(
+        "SparseAddressListResponse",
+        items=(list[item], ...),  # type: ignore[valid-type]
+        total=(int, ...),
+        limit=(int, ...),
+        offset=(int, ...),
+    )
+    return item, page
+
+
+class AddressStatsItem(BaseModel):
+    validation_status: ValidationStatus
+    country_code: str
+    count: int
+
+
+class AddressStatsResponse(BaseModel):
+    total: int
+    by_status: dict[ValidationStatus, int]
+    by_country: dict[str, int]
+    items: list[AddressStatsItem]
+
+
+class AddressFilter(BaseModel):
+    """Bulk operations act on addresses matching every given criterion."""
+
+    validation_status: list[ValidationStatus] = Field(default_factory=list, examples=[["warning"]])
+    country_code: list[str] = Field(default_factory=list, examples=[["US"]])
+    validated_before: datetime | None = None
+
+    @field_validator("country_code")
+    @classmethod
+    def upper_country_codes(cls, value: list[str]) -> list[str]:
+        return [code.strip().upper() for code in value]
+
+    def has_criteria(self) -> bool:
+        return bool(self.validation_status or self.country_code or self.validated_before)
+
+
+class BulkValidationRequest(AddressFilter):
+    @model_validator(mode="after")
+    def require_criterion(self) -> "BulkValidationRequest":
+        if not self.has_criteria():
+            raise ValueError("at least one filter criterion is required")
+        return self
+
+
+class BulkValidationResponse(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: UUID
+    total: int
+    enqueued: int
+    completed: int
+    by_status: dict[ValidationStatus, int]
+
+
+class BulkDeleteRequest(AddressFilter):
+    """Deletes the listed `ids`, the addresses matching the filter, or with both their overlap."""
+
+    ids: list[UUID] = Field(default_factory=list, max_length=10_000)
+
+    @model_validator(mode="after")
+    def require_ids_or_criterion(self) -> "BulkDeleteRequest":
+        if not (self.ids or self.has_criteria()):
+            raise ValueError("ids or at least one filter criterion is required")
+        return self
+
+
+class BulkDeleteResponse(BaseModel):
+    deleted: int
@@ -0,0 +1,18 @@
+from pydantic import BaseModel
+
+
+class PoolUsage(BaseModel):
+    checked_out: int
+    capacity: int
+
+
+class DependencyCheck(BaseModel):
+    status: str
+    latency_ms: float | None = None
+    error: str | None = None
+    pool: PoolUsage | None = None
+
+
+class ReadinessResponse(BaseModel):
+    status: str
+    checks: dict[str, DependencyCheck]
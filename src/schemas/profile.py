@@ -0,0 +1,24 @@
+from datetime import datetime
+
+from pydantic import BaseModel, ConfigDict
+
+
+class ProfiledQueryResponse(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    statement: str
+    duration_ms: float
+
+
+class ProfileResponse(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    request_id: str
+    client_request_id: str | None
+    method: str
+    path: str
+    started_at: datetime
+    duration_ms: float
+    samples: dict[str, int]
+    queries: list[ProfiledQueryResponse]
+    queries_dropped: int
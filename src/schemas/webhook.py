@@ -0,0 +1,24 @@
+from datetime import datetime
+from uuid import UUID
+
+from pydantic import AnyHttpUrl, BaseModel, ConfigDict, Field
+
+
+class WebhookCreate(BaseModel):
+    client_id: str = Field(..., max_length=255, examples=["acme"])
+    url: AnyHttpUrl = Field(..., examples=["https://example.com/hooks/address-validation"])
+    secret: str | None = Field(
+        None,
+        max_length=255,
+        description="Signs each batch as X-Webhook-Signature: sha256=<hmac>",
+    )
+
+
+class WebhookResponse(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: UUID
+    client_id: str
+    url: str
+    is_active: bool
+    created_at: datetime
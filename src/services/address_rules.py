@@ -0,0 +1,93 @@
+import json
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Self
+
+from src.db.models.address import Address
+
+RULES_PATH = Path(__file__).resolve().parent.parent / "data" / "address_rules.json"
+
+
+@dataclass(frozen=True, slots=True)
+class CountryRules:
+    postal_code: re.Pattern[str] | None = None
+    postal_code_example: str | None = None
+    subdivisions: frozenset[str] = frozenset()
+    required: tuple[str, ...] = ()
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> Self:
+        subdivisions: dict[str, str] = data.get("subdivisions", {})
+        pattern = data.get("postal_code")
+        return cls(
+            postal_code=re.compile(pattern) if pattern else None,
+            postal_code_example=data.get("postal_code_example"),
+            # Codes and full names both pass, matched case-insensitively.
+            subdivisions=frozenset(key.upper() for item in subdivisions.items() for key in item),
+            required=tuple(data.get("required", ())),
+        )
+
+
+class AddressRules:
+    """Country-specific checks that reject implausible addresses without a network call.
+
+    Rules are compiled once per process. Countries without an entry are not checked.
+    """
+
+    def __init__(self, countries: dict[str, CountryRules]) -> None:
+        self._countries = countries
+
+    @classmethod
+    def load(cls, path: Path = RULES_PATH) -> Self:
+        raw: dict[str, dict[str, Any]] = json.loads(path.read_text())
+        return cls({code.upper(): CountryRules.from_dict(data) for code, data in raw.items()})
+
+    def check(self, address: Address) -> list[dict[str, Any]]:
+        country = address.country_code.strip().upper()
+        rules = self._countries.get(country)
+        if rules is None:
+            return []
+
+        errors: list[dict[str, Any]] = []
+
+        for field in rules.required:
+            if not (getattr(address, field) or "").strip():
+                errors.append(
+                    {
+                        "code": f"{field}_required",
+                        "type": "error",
+                        "message": f"{field.replace('_', ' ').capitalize()} is required for {country}",
+                    }
+                )
+
+        postal_code = address.postal_code.strip().upper()
+        if rules.postal_code and not rules.postal_code.match(postal_code):
+            errors.append(
+                {
+                    "code": "invalid_postal_code_format",
+                    "type": "error",
+                    "message": (
+                        f"Postal code '{address.postal_code}' is not valid for {country}"
+                        f" (expected e.g. {rules.postal_code_example})"
+                    ),
+                }
+            )
+
+        state = " ".join((address.state_province or "").split()).upper()
+        if state and rules.subdivisions and state not in rules.subdivisions:
+            errors.append(
+                {
+                    "code": "invalid_state_province",
+                    "type": "error",
+                    "message": f"'{address.state_province}' is not a known state or province of {country}",
+                }
+            )
+
+        return errors
+
+
+@lru_cache
+def get_address_rules() -> AddressRules:
+    return AddressRules.load()
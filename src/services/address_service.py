@@ -1,22 +1,63 @@
+from collections import Counter
+from collections.abc import Set
 from datetime import UTC, datetime
 from typing import Any
-from uuid import UUID
+from uuid import UUID, uuid4
 
 from arq import ArqRedis
 
-from src.core.enums import ValidationStatus
-from src.core.exceptions import AddressNotFoundError
+from src.core.enums import DuplicatePolicy, ValidationStatus
+from src.core.exceptions import (
+    AddressNotFoundError,
+    BulkValidationNotFoundError,
+    ServiceUnavailableError,
+)
 from src.db.models.address import Address, ValidationResult
 from src.repositories.address_repository import AddressRepository
-from src.schemas.address import AddressCreate, AddressUpdate
+from src.schemas.address import (
+    AddressCreate,
+    AddressUpdate,
+    BulkDeleteRequest,
+    BulkValidationRequest,
+)
+from src.services.address_stats import AddressStatsCounter, StatsKey
+from src.services.bulk_validation import BulkValidationProgress, BulkValidationTracker
+from src.services.shipengine_client import ShipEngineClient
+from src.services.status_stream import StatusEvent
+from src.services.validation_queue import enqueue_validation
+
+BULK_VALIDATION_CHUNK_SIZE = 500
+BULK_DELETE_CHUNK_SIZE = 1000
 
 
 class AddressService:
-    def __init__(self, repo: AddressRepository, arq: ArqRedis | None = None) -> None:
+    def __init__(
+        self,
+        repo: AddressRepository,
+        arq: ArqRedis | None = None,
+        stats: AddressStatsCounter | None = None,
+        bulk: BulkValidationTracker | None = None,
+    ) -> None:
         self._repo = repo
         self._arq = arq
+        self._stats = stats
+        self._bulk = bulk
+        self._client = ShipEngineClient()
+
+    async def create(
+        self,
+        data: AddressCreate,
+        duplicate_policy: DuplicatePolicy = DuplicatePolicy.CREATE,
+    ) -> tuple[Address, bool]:
+        """The address and whether it was inserted (False when an existing twin is returned)."""
+        fingerprint = self._client.fingerprint(data)
+
+        twin: Address | None = None
+        if duplicate_policy != DuplicatePolicy.CREATE:
+            twin = await self._repo.get_validated_by_fingerprint(fingerprint)
+            if twin and duplicate_policy == DuplicatePolicy.RETURN_EXISTING:
+                return twin, False
 
-    async def create(self, data: AddressCreate) -> Address:
         address = Address(
             name=data.name,
             company_name=data.company_name,
@@ -28,41 +69,72 @@ class AddressService:
             state_province=data.state_province,
             postal_code=data.postal_code,
             country_code=data.country_code,
-            validation_status=ValidationStatus.PENDING,
+            client_id=data.client_id,
+            fingerprint=fingerprint,
+            validation_status=twin.validation_status if twin else ValidationStatus.PENDING,
+            validated_at=twin.validated_at if twin else None,
         )
         address = await self._repo.create(address)
+        await self._record_stats((_stats_key(address), 1))
 
-        if self._arq:
-            await self._arq.enqueue_job("validate_address_task", str(address.id))
+        if twin:
+            await self._copy_latest_result(twin, address)
+        elif self._arq:
+            await enqueue_validation(self._arq, str(address.id))
 
-        return await self._repo.get_by_id_with_results(address.id)  # type: ignore[return-value]
+        created = await self._repo.get_by_id_with_results(address.id)
+        return created, True  # type: ignore[return-value]
 
-    async def get_by_id(self, address_id: UUID) -> Address:
-        address = await self._repo.get_by_id_with_results(address_id)
+    async def get_by_id(self, address_id: UUID, fields: Set[str] | None = None) -> Address:
+        address = await self._repo.get_by_id_with_results(address_id, fields=fields)
         if not address:
             raise AddressNotFoundError(address_id)
         return address
 
-    async def get_list(self, limit: int = 20, offset: int = 0) -> tuple[list[Address], int]:
-        addresses = await self._repo.get_all_with_results(limit=limit, offset=offset)
+    async def get_list(
+        self, limit: int = 20, offset: int = 0, fields: Set[str] | None = None
+    ) -> tuple[list[Address], int]:
+        addresses = await self._repo.get_all_with_results(limit=limit, offset=offset, fields=fields)
         total = await self._repo.count()
         return addresses, total
 
+    async def get_stats(self) -> dict[StatsKey, int]:
+        if self._stats:
+            return await self._stats.read()
+        rows = await self._repo.count_by_status_and_country()
+        return {(ValidationStatus(status), country): count for status, country, count in rows}
+
+    async def get_status_snapshot(self, address_ids: list[UUID]) -> list[StatusEvent]:
+        addresses = await self._repo.get_by_ids(address_ids)
+        return [
+            StatusEvent(
+                address_id=str(a.id),
+                validation_status=ValidationStatus(a.validation_status),
+                country_code=a.country_code.upper(),
+                validated_at=a.validated_at,
+                client_id=a.client_id,
+            )
+            for a in addresses
+        ]
+
     async def update(self, address_id: UUID, data: AddressUpdate) -> Address:
         address = await self._repo.get_by_id(address_id)
         if not address:
             raise AddressNotFoundError(address_id)
 
+        previous = _stats_key(address)
         update_data = data.model_dump(exclude_unset=True)
         for field, value in update_data.items():
             setattr(address, field, value)
 
+        address.fingerprint = self._client.fingerprint(address)
         address.validation_status = ValidationStatus.PENDING
         address.validated_at = None
         await self._repo.update(address)
+        await self._record_stats((previous, -1), (_stats_key(address), 1))
 
         if self._arq:
-            await self._arq.enqueue_job("validate_address_task", str(address.id))
+            await enqueue_validation(self._arq, str(address.id))
 
         return await self._repo.get_by_id_with_results(address.id)  # type: ignore[return-value]
 
@@ -71,21 +143,94 @@ class AddressService:
         if not address:
             raise AddressNotFoundError(address_id)
         await self._repo.delete(address)
+        await self._record_stats((_stats_key(address), -1))
+
+    async def delete_matching(self, criteria: BulkDeleteRequest) -> int:
+        """Delete in id-ordered chunks, committing each so row locks are held only briefly.
+
+        A failure part-way leaves earlier chunks deleted; repeating the request finishes
+        the job.
+        """
+        deleted = 0
+        after: UUID | None = None
+        while True:
+            rows = await self._repo.delete_chunk(
+                ids=criteria.ids,
+                statuses=criteria.validation_status,
+                country_codes=criteria.country_code,
+                validated_before=criteria.validated_before,
+                after=after,
+                limit=BULK_DELETE_CHUNK_SIZE,
+            )
+            if not rows:
+                return deleted
+
+            await self._repo.commit()
+            await self._record_stats(
+                *(
+                    ((ValidationStatus(status), country.upper()), -1)
+                    for _id, status, country in rows
+                )
+            )
+            deleted += len(rows)
+            after = max(address_id for address_id, _status, _country in rows)
 
     async def validate(self, address_id: UUID) -> Address:
         address = await self._repo.get_by_id(address_id)
         if not address:
             raise AddressNotFoundError(address_id)
 
+        previous = _stats_key(address)
         address.validation_status = ValidationStatus.PENDING
         address.validated_at = None
         await self._repo.update(address)
+        await self._record_stats((previous, -1), (_stats_key(address), 1))
 
         if self._arq:
-            await self._arq.enqueue_job("validate_address_task", str(address.id))
+            await enqueue_validation(self._arq, str(address.id))
 
         return await self._repo.get_by_id_with_results(address.id)  # type: ignore[return-value]
 
+    async def validate_matching(self, criteria: BulkValidationRequest) -> BulkValidationProgress:
+        """Reset every matching address to PENDING and queue it, without loading any row.
+
+        Ids are handed to the worker in chunks; each batch job fans out into per-address
+        validation jobs, so the request cost does not grow with the number of rows. The
+        reset is committed before anything is queued or counted, so a rollback cannot leave
+        jobs and stats behind for rows that were never reset.
+        """
+        if not (self._arq and self._bulk):
+            raise ServiceUnavailableError("Task queue")
+
+        rows = await self._repo.reset_validation(
+            statuses=criteria.validation_status,
+            country_codes=criteria.country_code,
+            validated_before=criteria.validated_before,
+        )
+        await self._repo.commit()
+        changes: list[tuple[StatsKey, int]] = []
+        for _address_id, previous, country_code in rows:
+            changes.append(((ValidationStatus(previous), country_code.upper()), -1))
+            changes.append(((ValidationStatus.PENDING, country_code.upper()), 1))
+        await self._record_stats(*changes)
+
+        bulk_id = uuid4()
+        progress = await self._bulk.start(bulk_id, total=len(rows))
+        ids = [str(address_id) for address_id, _previous, _country_code in rows]
+        for start in range(0, len(ids), BULK_VALIDATION_CHUNK_SIZE):
+            await self._arq.enqueue_job(
+                "enqueue_validation_batch_task",
+                str(bulk_id),
+                ids[start : start + BULK_VALIDATION_CHUNK_SIZE],
+            )
+        return progress
+
+    async def get_bulk_validation(self, bulk_id: UUID) -> BulkValidationProgress:
+        progress = await self._bulk.get(bulk_id) if self._bulk else None
+        if progress is None:
+            raise BulkValidationNotFoundError(bulk_id)
+        return progress
+
     async def save_validation_result(
         self,
         address_id: UUID,
@@ -105,8 +250,45 @@ class AddressService:
         )
         result = await self._repo.add_validation_result(result)
 
+        previous = _stats_key(address)
         address.validation_status = status
         address.validated_at = datetime.now(UTC)
         await self._repo.update(address)
+        await self._record_stats((previous, -1), (_stats_key(address), 1))
 
         return result
+
+    async def _record_stats(self, *changes: tuple[StatsKey, int]) -> None:
+        if not self._stats:
+            return
+        deltas: Counter[StatsKey] = Counter()
+        for key, delta in changes:
+            deltas[key] += delta
+        await self._stats.apply(deltas)
+
+    async def _copy_latest_result(self, twin: Address, address: Address) -> None:
+        if not twin.validation_results:
+            return
+
+        latest = twin.validation_results[0]
+        matched_address = latest.matched_address
+        if matched_address is not None:
+            matched_address = {
+                **matched_address,
+                "name": address.name,
+                "company_name": address.company_name,
+                "phone": address.phone,
+            }
+
+        await self._repo.add_validation_result(
+            ValidationResult(
+                address_id=address.id,
+                status=latest.status,
+                matched_address=matched_address,
+                messages=latest.messages,
+            )
+        )
+
+
+def _stats_key(address: Address) -> StatsKey:
+    return ValidationStatus(address.validation_status), address.country_code.upper()
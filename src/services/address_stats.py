@@ -0,0 +1,57 @@
+from collections import Counter
+from collections.abc import Iterable
+
+from redis.asyncio import Redis
+
+from src.core.enums import ValidationStatus
+
+ADDRESS_STATS_KEY = "address:stats"
+
+StatsKey = tuple[ValidationStatus, str]
+
+
+class AddressStatsCounter:
+    """Address counts per `(validation_status, country_code)`, kept in one Redis hash.
+
+    Writers apply deltas with HINCRBY as rows are created, deleted or change status, so
+    reads never touch Postgres. Increments are not transactional with the database;
+    `reconcile_address_stats_task` periodically replaces the hash from a GROUP BY.
+    """
+
+    def __init__(self, redis: Redis) -> None:
+        self._redis = redis
+
+    async def apply(self, deltas: Counter[StatsKey]) -> None:
+        changes = {key: delta for key, delta in deltas.items() if delta}
+        if not changes:
+            return
+
+        async with self._redis.pipeline(transaction=False) as pipe:
+            for key, delta in changes.items():
+                pipe.hincrby(ADDRESS_STATS_KEY, _field(key), delta)
+            await pipe.execute()
+
+    async def read(self) -> dict[StatsKey, int]:
+        raw = await self._redis.hgetall(ADDRESS_STATS_KEY)  # type: ignore[misc]
+        counts: dict[StatsKey, int] = {}
+        for field, value in raw.items():
+            status, country_code = field.decode().split(":", 1)
+            count = int(value)
+            if count:
+                counts[(ValidationStatus(status), country_code)] = count
+        return counts
+
+    async def replace(self, counts: Iterable[tuple[StatsKey, int]]) -> None:
+        mapping: Counter[str] = Counter()
+        for key, count in counts:
+            mapping[_field(key)] += count
+        async with self._redis.pipeline(transaction=True) as pipe:
+            pipe.delete(ADDRESS_STATS_KEY)
+            if mapping:
+                pipe.hset(ADDRESS_STATS_KEY, mapping=dict(mapping))
+            await pipe.execute()
+
+
+def _field(key: StatsKey) -> str:
+    status, country_code = key
+    return f"{ValidationStatus(status).value}:{country_code.upper()}"
@@ -0,0 +1,81 @@
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import timedelta
+from uuid import UUID
+
+from redis.asyncio import Redis
+
+from src.core.enums import ValidationStatus
+
+BULK_VALIDATION_KEY = "bulk-validation:{}"
+BULK_VALIDATION_TTL = timedelta(days=1)
+
+
+@dataclass
+class BulkValidationProgress:
+    id: UUID
+    total: int
+    enqueued: int = 0
+    completed: int = 0
+    by_status: Counter[ValidationStatus] = field(default_factory=Counter)
+
+
+class BulkValidationTracker:
+    """Progress counters of one bulk revalidation, kept in a Redis hash that expires a day
+    after its last update.
+
+    The API records `total`, batch jobs add to `enqueued` as they fan out, and each
+    `validate_address_task` carrying the bulk id adds to `completed` and its status. Every
+    update renews the expiry, so an increment landing after the hash expired cannot
+    recreate it without one.
+    """
+
+    def __init__(self, redis: Redis, ttl: timedelta = BULK_VALIDATION_TTL) -> None:
+        self._redis = redis
+        self._ttl = ttl
+
+    async def start(self, bulk_id: UUID, total: int) -> BulkValidationProgress:
+        key = BULK_VALIDATION_KEY.format(bulk_id)
+        async with self._redis.pipeline(transaction=True) as pipe:
+            pipe.hset(key, mapping={"total": total, "enqueued": 0, "completed": 0})
+            pipe.expire(key, self._ttl)
+            await pipe.execute()
+        return BulkValidationProgress(id=bulk_id, total=total)
+
+    async def record_total(self, bulk_id: UUID, count: int) -> None:
+        """Grow `total` for a bulk whose size is only known as it is produced."""
+        await self._increment(bulk_id, {"total": count})
+
+    async def record_enqueued(self, bulk_id: UUID, count: int) -> None:
+        await self._increment(bulk_id, {"enqueued": count})
+
+    async def record_result(self, bulk_id: UUID, status: ValidationStatus) -> None:
+        await self._increment(bulk_id, {"completed": 1, f"status:{status.value}": 1})
+
+    async def _increment(self, bulk_id: UUID, amounts: dict[str, int]) -> None:
+        key = BULK_VALIDATION_KEY.format(bulk_id)
+        async with self._redis.pipeline(transaction=True) as pipe:
+            for name, amount in amounts.items():
+                pipe.hincrby(key, name, amount)
+            pipe.expire(key, self._ttl)
+            await pipe.execute()
+
+    async def get(self, bulk_id: UUID) -> BulkValidationProgress | None:
+        raw = await self._redis.hgetall(BULK_VALIDATION_KEY.format(bulk_id))  # type: ignore[misc]
+        if not raw:
+            return None
+
+        values = {name.decode(): int(value) for name, value in raw.items()}
+        return BulkValidationProgress(
+            id=bulk_id,
+            total=values.get("total", 0),
+            enqueued=values.get("enqueued", 0),
+            completed=values.get("completed", 0),
+            by_status=Counter(
+                {
+                    ValidationStatus(name.removeprefix("status:")): count
+                    for name, count in values.items()
+                    if name.startswith("status:")
+                }
+            ),
+        )
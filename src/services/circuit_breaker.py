@@ -0,0 +1,144 @@
+import asyncio
+import logging
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable
+
+from src.core.enums import CircuitState
+from src.core.exceptions import CircuitOpenError
+from src.core.metrics import CIRCUIT_REJECTED, CIRCUIT_STATE, CIRCUIT_TRANSITIONS
+
+logger = logging.getLogger(__name__)
+
+_STATE_VALUES = {CircuitState.CLOSED: 0, CircuitState.HALF_OPEN: 1, CircuitState.OPEN: 2}
+
+
+class CircuitBreaker:
+    """Count-based circuit breaker tripping on error rate or slow-call rate.
+
+    Over the last `window_size` calls (once at least `min_calls` were seen), the circuit
+    opens when the share of failures or of calls slower than `slow_call_seconds` reaches
+    its threshold. While open, calls fail fast with `CircuitOpenError`. After
+    `open_seconds` up to `half_open_max_calls` probes go through; one bad probe reopens the
+    circuit and a good one closes it with a fresh window. Every transition starts a new
+    generation, and a call's outcome only counts in the generation it started in, so a call
+    still running from before the circuit opened cannot take a probe's place. A cancelled
+    call (a job timeout, a losing hedge) says nothing about the upstream: it is not
+    recorded, but it gives its probe slot back.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        window_size: int = 20,
+        min_calls: int = 10,
+        failure_rate_threshold: float = 0.5,
+        slow_call_seconds: float = 5.0,
+        slow_call_rate_threshold: float = 0.5,
+        open_seconds: float = 30.0,
+        half_open_max_calls: int = 1,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.name = name
+        self._min_calls = min_calls
+        self._failure_rate_threshold = failure_rate_threshold
+        self._slow_call_seconds = slow_call_seconds
+        self._slow_call_rate_threshold = slow_call_rate_threshold
+        self._open_seconds = open_seconds
+        self._half_open_max_calls = half_open_max_calls
+        self._clock = clock
+        self._outcomes: deque[tuple[bool, bool]] = deque(maxlen=window_size)
+        self._state = CircuitState.CLOSED
+        self._opened_at = 0.0
+        self._half_open_calls = 0
+        self._generation = 0
+        CIRCUIT_STATE.labels(name).set(_STATE_VALUES[self._state])
+
+    @property
+    def state(self) -> CircuitState:
+        if (
+            self._state == CircuitState.OPEN
+            and self._clock() - self._opened_at >= self._open_seconds
+        ):
+            self._transition(CircuitState.HALF_OPEN)
+        return self._state
+
+    def retry_after(self) -> float:
+        """Seconds until the circuit lets probes through again."""
+        if self.state != CircuitState.OPEN:
+            return 0.0
+        return self._opened_at + self._open_seconds - self._clock()
+
+    async def call[T](self, func: Callable[[], Awaitable[T]]) -> T:
+        generation = self._acquire()
+        started_at = self._clock()
+        try:
+            result = await func()
+        except asyncio.CancelledError:
+            self._release(generation)
+            raise
+        except Exception:
+            self._record(generation, failed=True, elapsed=self._clock() - started_at)
+            raise
+        self._record(generation, failed=False, elapsed=self._clock() - started_at)
+        return result
+
+    def _acquire(self) -> int:
+        state = self.state
+        if state == CircuitState.OPEN or (
+            state == CircuitState.HALF_OPEN and self._half_open_calls >= self._half_open_max_calls
+        ):
+            CIRCUIT_REJECTED.labels(self.name).inc()
+            raise CircuitOpenError(self.name, self.retry_after())
+        if state == CircuitState.HALF_OPEN:
+            self._half_open_calls += 1
+        return self._generation
+
+    def _release(self, generation: int) -> None:
+        if generation == self._generation and self._state == CircuitState.HALF_OPEN:
+            self._half_open_calls -= 1
+
+    def _record(self, generation: int, *, failed: bool, elapsed: float) -> None:
+        if generation != self._generation:
+            return
+        slow = elapsed >= self._slow_call_seconds
+        if self._state == CircuitState.HALF_OPEN:
+            self._half_open_calls -= 1
+            self._transition(CircuitState.OPEN if failed or slow else CircuitState.CLOSED)
+            return
+        if self._state == CircuitState.OPEN:
+            return
+
+        self._outcomes.append((failed, slow))
+        calls = len(self._outcomes)
+        if calls < self._min_calls:
+            return
+        failure_rate = sum(f for f, _ in self._outcomes) / calls
+        slow_rate = sum(s for _, s in self._outcomes) / calls
+        if (
+            failure_rate >= self._failure_rate_threshold
+            or slow_rate >= self._slow_call_rate_threshold
+        ):
+            logger.warning(
+                "Circuit %s opened: failure rate %.0f%%, slow-call rate %.0f%% over %d calls",
+                self.name,
+                failure_rate * 100,
+                slow_rate * 100,
+                calls,
+            )
+            self._transition(CircuitState.OPEN)
+
+    def _transition(self, state: CircuitState) -> None:
+        if state == self._state:
+            return
+        self._state = state
+        self._generation += 1
+        if state == CircuitState.OPEN:
+            self._opened_at = self._clock()
+        elif state == CircuitState.CLOSED:
+            self._outcomes.clear()
+        if state != CircuitState.HALF_OPEN:
+            self._half_open_calls = 0
+        CIRCUIT_STATE.labels(self.name).set(_STATE_VALUES[state])
+        CIRCUIT_TRANSITIONS.labels(self.name, state.value).inc()
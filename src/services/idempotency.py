@@ -0,0 +1,98 @@
+import asyncio
+import json
+import time
+from dataclasses import asdict, dataclass
+
+from redis.asyncio import Redis
+
+IDEMPOTENCY_KEY = "idempotency:{}"
+
+
+class IdempotencyKeyReusedError(Exception):
+    """The key was first used with a different request body."""
+
+
+class IdempotencyInProgressError(Exception):
+    """The first request with this key did not finish within the wait limit."""
+
+
+@dataclass(frozen=True)
+class StoredResponse:
+    status_code: int
+    content_type: str | None
+    body: str
+
+
+@dataclass(frozen=True)
+class _Record:
+    fingerprint: str
+    response: StoredResponse | None = None
+
+    def to_json(self) -> str:
+        return json.dumps(asdict(self))
+
+    @classmethod
+    def from_json(cls, raw: str | bytes) -> "_Record":
+        data = json.loads(raw)
+        response = data["response"]
+        return cls(
+            fingerprint=data["fingerprint"],
+            response=StoredResponse(**response) if response else None,
+        )
+
+
+class IdempotencyStore:
+    """Responses of requests carrying an `Idempotency-Key`, kept in Redis for `ttl` seconds.
+
+    The first request claims the key with `SET NX` and a short `lock_ttl`, so a crashed
+    request does not block its key forever. Duplicates arriving while it runs poll until the
+    response is stored, then replay it. A released key (failed first request) lets the next
+    duplicate claim it and run.
+    """
+
+    def __init__(
+        self,
+        redis: Redis,
+        *,
+        ttl: float = 86400.0,
+        lock_ttl: float = 60.0,
+        wait_timeout: float = 10.0,
+        poll_interval: float = 0.05,
+    ) -> None:
+        self._redis = redis
+        self._ttl = ttl
+        self._lock_ttl = lock_ttl
+        self._wait_timeout = wait_timeout
+        self._poll_interval = poll_interval
+
+    async def claim(self, key: str, fingerprint: str) -> StoredResponse | None:
+        """Return the stored response of a finished duplicate, or `None` once `key` is ours."""
+        redis_key = IDEMPOTENCY_KEY.format(key)
+        pending = _Record(fingerprint).to_json()
+        deadline = time.monotonic() + self._wait_timeout
+
+        while True:
+            if await self._redis.set(redis_key, pending, nx=True, px=int(self._lock_ttl * 1000)):
+                return None
+
+            raw = await self._redis.get(redis_key)
+            if raw is None:
+                continue  # released or expired since SET NX; try to claim again
+            record = _Record.from_json(raw)
+            if record.fingerprint != fingerprint:
+                raise IdempotencyKeyReusedError(key)
+            if record.response is not None:
+                return record.response
+            if time.monotonic() >= deadline:
+                raise IdempotencyInProgressError(key)
+            await asyncio.sleep(self._poll_interval)
+
+    async def complete(self, key: str, fingerprint: str, response: StoredResponse) -> None:
+        await self._redis.set(
+            IDEMPOTENCY_KEY.format(key),
+            _Record(fingerprint, response).to_json(),
+            px=int(self._ttl * 1000),
+        )
+
+    async def release(self, key: str) -> None:
+        await self._redis.delete(IDEMPOTENCY_KEY.format(key))
@@ -0,0 +1,186 @@
+import asyncio
+import json
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from collections.abc import Coroutine, Generator, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from types import FrameType
+from typing import Any
+
+from redis.asyncio import Redis
+from sqlalchemy import event
+from sqlalchemy.engine import Connection
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+PROFILE_KEY = "profile:{}"
+MAX_QUERIES = 1000
+WAITING_FRAME = "<await>"
+
+_QUERY_STARTS = "profiler_query_starts"
+_current_profile: ContextVar["RequestProfile | None"] = ContextVar("profile", default=None)
+
+
+@dataclass
+class ProfiledQuery:
+    statement: str
+    duration_ms: float
+
+
+@dataclass
+class RequestProfile:
+    request_id: str
+    method: str
+    path: str
+    started_at: datetime
+    duration_ms: float = 0.0
+    samples: dict[str, int] = field(default_factory=dict)
+    queries: list[ProfiledQuery] = field(default_factory=list)
+    queries_dropped: int = 0
+    # The caller's X-Request-ID; never used as the storage key.
+    client_request_id: str | None = None
+
+    def record_query(self, statement: str, seconds: float) -> None:
+        if len(self.queries) >= MAX_QUERIES:
+            self.queries_dropped += 1
+            return
+        self.queries.append(ProfiledQuery(statement, round(seconds * 1000, 3)))
+
+    def collapsed(self) -> str:
+        """Folded stacks, one `root;...;leaf count` line each, for flamegraph.pl or speedscope."""
+        return "".join(f"{stack} {count}\n" for stack, count in sorted(self.samples.items()))
+
+    def to_json(self) -> str:
+        return json.dumps({**asdict(self), "started_at": self.started_at.isoformat()})
+
+    @classmethod
+    def from_json(cls, raw: str | bytes) -> "RequestProfile":
+        data = json.loads(raw)
+        return cls(
+            **{
+                **data,
+                "started_at": datetime.fromisoformat(data["started_at"]),
+                "queries": [ProfiledQuery(**q) for q in data["queries"]],
+            }
+        )
+
+
+class StackSampler:
+    """Samples where one asyncio task is, every `interval` seconds, from a background thread.
+
+    While the task runs on the loop the thread's real stack is taken, which shows CPU time.
+    While it is suspended its chain of awaiting coroutines is taken, ending in `<await>`, which
+    shows time spent waiting on the database or upstream. Other requests on the same loop are
+    never attributed to it.
+    """
+
+    def __init__(self, task: asyncio.Task[Any], interval: float) -> None:
+        self._task = task
+        self._interval = interval
+        self._loop_thread = threading.get_ident()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="request-profiler", daemon=True)
+        self.samples: Counter[str] = Counter()
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> dict[str, int]:
+        self._stop.set()
+        self._thread.join()
+        return dict(self.samples)
+
+    def _run(self) -> None:
+        while not self._stop.wait(self._interval):
+            self._sample()
+
+    def _sample(self) -> None:
+        coro = self._task.get_coro()
+        if coro is None or self._task.done():
+            return
+        root = getattr(coro, "cr_frame", None)
+        frame = sys._current_frames().get(self._loop_thread)
+        stack = _running_stack(frame, root)
+        if stack is None:
+            stack = [*_awaiting_stack(coro), WAITING_FRAME]
+        self.samples[";".join(stack)] += 1
+
+
+def _running_stack(frame: FrameType | None, root: FrameType | None) -> list[str] | None:
+    stack: list[str] = []
+    while frame is not None and root is not None:
+        stack.append(_label(frame))
+        if frame is root:
+            return stack[::-1]
+        frame = frame.f_back
+    return None
+
+
+def _awaiting_stack(awaitable: Coroutine[Any, Any, Any] | Generator[Any, Any, Any]) -> list[str]:
+    stack: list[str] = []
+    current: Any = awaitable
+    while current is not None:
+        frame = getattr(current, "cr_frame", None) or getattr(current, "gi_frame", None)
+        if frame is None:
+            break
+        stack.append(_label(frame))
+        current = getattr(current, "cr_await", None) or getattr(current, "gi_yieldfrom", None)
+    return stack
+
+
+def _label(frame: FrameType) -> str:
+    code = frame.f_code
+    path = code.co_filename
+    if "site-packages" + os.sep in path:
+        path = path.rsplit("site-packages" + os.sep, 1)[1]
+    else:
+        path = os.path.relpath(path)
+    return f"{code.co_qualname} ({path}:{code.co_firstlineno})"
+
+
+@contextmanager
+def capture_queries(profile: RequestProfile) -> Iterator[None]:
+    """Attribute SQL run in this context (the request's task) to `profile`."""
+    token = _current_profile.set(profile)
+    try:
+        yield
+    finally:
+        _current_profile.reset(token)
+
+
+def install_sql_capture(engine: AsyncEngine) -> None:
+    """Record statements run while a request is being profiled, with their duration."""
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def before_cursor_execute(conn: Connection, *_args: Any) -> None:
+        if _current_profile.get() is not None:
+            conn.info.setdefault(_QUERY_STARTS, []).append(time.perf_counter())
+
+    @event.listens_for(engine.sync_engine, "after_cursor_execute")
+    def after_cursor_execute(conn: Connection, _cursor: Any, statement: str, *_args: Any) -> None:
+        profile = _current_profile.get()
+        starts = conn.info.get(_QUERY_STARTS)
+        if profile is not None and starts:
+            profile.record_query(statement, time.perf_counter() - starts.pop())
+
+
+class ProfileStore:
+    """Finished request profiles in Redis, looked up by request id until they expire."""
+
+    def __init__(self, redis: Redis, ttl: float) -> None:
+        self._redis = redis
+        self._ttl = ttl
+
+    async def save(self, profile: RequestProfile) -> None:
+        await self._redis.set(
+            PROFILE_KEY.format(profile.request_id), profile.to_json(), px=int(self._ttl * 1000)
+        )
+
+    async def get(self, request_id: str) -> RequestProfile | None:
+        raw = await self._redis.get(PROFILE_KEY.format(request_id))
+        return RequestProfile.from_json(raw) if raw else None
@@ -0,0 +1,58 @@
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+
+from redis.asyncio import Redis
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import QueuePool
+
+from src.schemas.health import DependencyCheck, PoolUsage
+
+OK = "ok"
+ERROR = "error"
+
+
+async def check_database(
+    engine: AsyncEngine | None, timeout: float, capacity: int, max_usage: float
+) -> DependencyCheck:
+    """Ping Postgres on a pooled connection; fail early once the pool is nearly exhausted."""
+    if engine is None:
+        return DependencyCheck(status=ERROR, error="not initialized")
+
+    pool = None
+    if isinstance(engine.pool, QueuePool):
+        pool = PoolUsage(checked_out=engine.pool.checkedout(), capacity=capacity)
+        if pool.checked_out >= capacity * max_usage:
+            return DependencyCheck(status=ERROR, error="connection pool saturated", pool=pool)
+
+    async def ping() -> None:
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+
+    check = await _timed(ping, timeout)
+    check.pool = pool
+    return check
+
+
+async def check_redis(redis: Redis | None, timeout: float) -> DependencyCheck:
+    if redis is None:
+        return DependencyCheck(status=ERROR, error="not initialized")
+
+    async def ping() -> None:
+        await redis.ping()
+
+    return await _timed(ping, timeout)
+
+
+async def _timed(probe: Callable[[], Awaitable[None]], timeout: float) -> DependencyCheck:
+    started_at = time.perf_counter()
+    try:
+        async with asyncio.timeout(timeout):
+            await probe()
+    except TimeoutError:
+        return DependencyCheck(status=ERROR, error=f"timed out after {timeout}s")
+    except Exception as e:
+        return DependencyCheck(status=ERROR, error=str(e) or type(e).__name__)
+    latency_ms = round((time.perf_counter() - started_at) * 1000, 2)
+    return DependencyCheck(status=OK, latency_ms=latency_ms)
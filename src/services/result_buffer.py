@@ -0,0 +1,154 @@
+import asyncio
+import logging
+from collections import Counter
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+from uuid import UUID
+
+from src.core.enums import ValidationStatus
+from src.repositories.address_repository import AddressRepository
+from src.services.address_stats import AddressStatsCounter, StatsKey
+from src.services.webhook_dispatcher import SessionFactory
+
+logger = logging.getLogger(__name__)
+
+
+class ResultWriteError(Exception):
+    """The batch an outcome was in could not be written; the job should run again."""
+
+
+@dataclass(frozen=True)
+class ValidationOutcome:
+    address_id: UUID
+    status: ValidationStatus
+    previous_status: ValidationStatus
+    country_code: str
+    validated_at: datetime
+    matched_address: dict[str, Any] | None = None
+    messages: list[dict[str, Any]] | None = None
+
+
+class ValidationResultBuffer:
+    """Collects the validation outcomes of one worker process and writes them in batches.
+
+    A batch is written once `max_items` outcomes are waiting or `flush_interval` seconds
+    after the first one arrived, in a single transaction: one multi-row INSERT of results
+    and one bulk UPDATE of the addresses. `save` returns only after that transaction has
+    committed, so a job is acknowledged only once its result is durable; if the write
+    fails, every job in the batch gets a `ResultWriteError`, which the task turns into an
+    ARQ `Retry`. Outcomes of
+    addresses deleted while their job ran are dropped, so one of them cannot fail the
+    batch on the results' foreign key.
+    """
+
+    def __init__(
+        self,
+        session_factory: SessionFactory,
+        stats: AddressStatsCounter | None = None,
+        *,
+        max_items: int = 10,
+        flush_interval: float = 0.02,
+    ) -> None:
+        self._session_factory = session_factory
+        self._stats = stats
+        self._max_items = max_items
+        self._flush_interval = flush_interval
+        self._pending: list[tuple[ValidationOutcome, asyncio.Future[bool]]] = []
+        self._timer: asyncio.TimerHandle | None = None
+        self._flushes: set[asyncio.Task[None]] = set()
+        # Batches commit one at a time so two outcomes of one address keep their order.
+        self._write_lock = asyncio.Lock()
+
+    async def save(self, outcome: ValidationOutcome) -> bool:
+        """Wait until `outcome` is written; False if it was dropped for a deleted address."""
+        loop = asyncio.get_running_loop()
+        done: asyncio.Future[bool] = loop.create_future()
+        self._pending.append((outcome, done))
+
+        if len(self._pending) >= self._max_items:
+            self._start_flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self._flush_interval, self._start_flush)
+        return await done
+
+    async def close(self) -> None:
+        """Write whatever is still waiting; called on worker shutdown."""
+        if self._pending:
+            self._start_flush()
+        await asyncio.gather(*self._flushes, return_exceptions=True)
+
+    def _start_flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+
+        task = asyncio.create_task(self._flush(batch))
+        self._flushes.add(task)
+        task.add_done_callback(self._flushes.discard)
+
+    async def _flush(self, batch: list[tuple[ValidationOutcome, asyncio.Future[bool]]]) -> None:
+        outcomes = [outcome for outcome, _done in batch]
+        try:
+            async with self._write_lock:
+                written = await self._write(outcomes)
+        except Exception as e:
+            logger.exception("Failed to write %d validation results", len(outcomes))
+            for _outcome, done in batch:
+                if not done.done():
+                    error = ResultWriteError(f"Failed to write {len(outcomes)} validation results")
+                    error.__cause__ = e
+                    done.set_exception(error)
+            return
+
+        try:
+            await self._record_stats(written)
+        except Exception:
+            # The hash is corrected by the next reconcile run; the results are committed.
+            logger.exception("Failed to record stats for %d validation results", len(outcomes))
+        written_ids = {o.address_id for o in written}
+        for outcome, done in batch:
+            if not done.done():
+                done.set_result(outcome.address_id in written_ids)
+
+    async def _write(self, outcomes: list[ValidationOutcome]) -> list[ValidationOutcome]:
+        async with self._session_factory() as session:
+            repo = AddressRepository(session)
+            existing = await repo.lock_existing_ids([o.address_id for o in outcomes])
+            written = [o for o in outcomes if o.address_id in existing]
+            if len(written) < len(outcomes):
+                logger.info(
+                    "Dropped %d validation results of deleted addresses",
+                    len(outcomes) - len(written),
+                )
+            if not written:
+                return written
+
+            await repo.add_validation_results(
+                [
+                    {
+                        "address_id": o.address_id,
+                        "status": o.status,
+                        "matched_address": o.matched_address,
+                        "messages": o.messages,
+                    }
+                    for o in written
+                ]
+            )
+            await repo.set_validation_statuses(
+                {o.address_id: (o.status, o.validated_at) for o in written}
+            )
+        logger.debug("Wrote %d validation results in one transaction", len(written))
+        return written
+
+    async def _record_stats(self, outcomes: list[ValidationOutcome]) -> None:
+        if not self._stats:
+            return
+        deltas: Counter[StatsKey] = Counter()
+        for o in outcomes:
+            deltas[(o.previous_status, o.country_code)] -= 1
+            deltas[(o.status, o.country_code)] += 1
+        await self._stats.apply(deltas)
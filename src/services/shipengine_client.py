@@ -1,9 +1,20 @@
 import asyncio
+import hashlib
+import logging
 from dataclasses import dataclass
+from functools import partial
 from typing import Any
 
 from src.core.enums import ValidationStatus
+from src.core.exceptions import UpstreamTimeoutError
+from src.core.metrics import UPSTREAM_HEDGED, UPSTREAM_TIMEOUTS, VALIDATION_REJECTED_LOCALLY
 from src.db.models.address import Address
+from src.schemas.address import AddressBase
+from src.services.address_rules import AddressRules, get_address_rules
+from src.services.circuit_breaker import CircuitBreaker
+from src.services.hedging import HedgePolicy
+
+logger = logging.getLogger(__name__)
 
 
 @dataclass
@@ -14,17 +25,97 @@ class ValidationResponse:
 
 
 class ShipEngineClient:
+    def __init__(
+        self,
+        latency: float = 0.5,
+        breaker: CircuitBreaker | None = None,
+        rules: AddressRules | None = None,
+        hedge: HedgePolicy | None = None,
+        call_timeout: float = 10.0,
+        total_timeout: float = 25.0,
+        max_attempts: int = 3,
+    ) -> None:
+        self._latency = latency
+        self._breaker = breaker
+        self._rules = rules or get_address_rules()
+        self._hedge = hedge
+        self._call_timeout = call_timeout
+        self._total_timeout = total_timeout
+        self._max_attempts = max_attempts
+
     async def validate_address(self, address: Address) -> ValidationResponse:
-        await asyncio.sleep(0.5)
+        """Rejects implausible addresses locally; only the rest reach upstream.
 
+        Each upstream attempt gets `call_timeout`, and timed-out attempts are retried while
+        `total_timeout` and `max_attempts` allow; then `UpstreamTimeoutError` is raised.
+        Raises `CircuitOpenError` without calling upstream while the breaker is open.
+        """
         errors = self._validate_fields(address)
-
         if errors:
+            VALIDATION_REJECTED_LOCALLY.inc()
             return ValidationResponse(
                 status=ValidationStatus.ERROR,
                 messages=errors,
             )
 
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self._total_timeout
+        for attempt in range(1, self._max_attempts + 1):
+            timeout = min(self._call_timeout, deadline - loop.time())
+            if timeout <= 0:
+                break
+            call = partial(self._attempt, address, timeout)
+            try:
+                if self._breaker:
+                    return await self._breaker.call(call)
+                return await call()
+            except TimeoutError:
+                UPSTREAM_TIMEOUTS.inc()
+                logger.warning(
+                    "ShipEngine attempt %d for address %s timed out after %.1fs",
+                    attempt,
+                    address.id,
+                    timeout,
+                )
+        raise UpstreamTimeoutError("ShipEngine", self._total_timeout)
+
+    async def _attempt(self, address: Address, timeout: float) -> ValidationResponse:
+        async with asyncio.timeout(timeout):
+            if self._hedge is None:
+                return await self._call_upstream(address)
+            return await self._hedged(address, self._hedge)
+
+    async def _hedged(self, address: Address, hedge: HedgePolicy) -> ValidationResponse:
+        """Sends a backup request once the first is slower than the hedge delay; first wins."""
+        calls = {asyncio.create_task(self._observed(address, hedge))}
+        try:
+            delay = hedge.delay()
+            if delay is not None:
+                done, _ = await asyncio.wait(calls, timeout=delay)
+                if not done:
+                    UPSTREAM_HEDGED.inc()
+                    calls.add(asyncio.create_task(self._observed(address, hedge)))
+
+            while True:
+                done, calls = await asyncio.wait(calls, return_when=asyncio.FIRST_COMPLETED)
+                succeeded = [c for c in done if c.exception() is None]
+                # A failed call only decides the outcome once no other call is in flight.
+                if succeeded or not calls:
+                    return (succeeded or list(done))[0].result()
+        finally:
+            for call in calls:
+                call.cancel()
+
+    async def _observed(self, address: Address, hedge: HedgePolicy) -> ValidationResponse:
+        loop = asyncio.get_running_loop()
+        started_at = loop.time()
+        result = await self._call_upstream(address)
+        hedge.observe(loop.time() - started_at)
+        return result
+
+    async def _call_upstream(self, address: Address) -> ValidationResponse:
+        await asyncio.sleep(self._latency)
+
         warnings: list[dict[str, Any]] = []
         if address.address_line1 and "PO BOX" in address.address_line1.upper():
             warnings.append(
@@ -55,6 +146,19 @@ class ShipEngineClient:
             messages=warnings or None,
         )
 
+    def fingerprint(self, address: Address | AddressBase) -> str:
+        """Hash of the normalized location fields, stable across case, spacing and suffixes."""
+        parts = [
+            self._normalize_street(_squash(address.address_line1)),
+            self._normalize_street(_squash(address.address_line2)),
+            self._normalize_street(_squash(address.address_line3)),
+            _squash(address.city_locality).upper(),
+            _squash(address.state_province).upper(),
+            self._normalize_postal_code(address.postal_code, address.country_code),
+            address.country_code.strip().upper(),
+        ]
+        return hashlib.sha256("|".join(parts).encode()).hexdigest()
+
     def _validate_fields(self, address: Address) -> list[dict[str, Any]]:
         errors: list[dict[str, Any]] = []
 
@@ -94,7 +198,8 @@ class ShipEngineClient:
                 }
             )
 
-        return errors
+        # Country rules assume the basic fields are present and well-formed.
+        return errors or self._rules.check(address)
 
     def _normalize_street(self, street: str) -> str:
         replacements = {
@@ -117,3 +222,7 @@ class ShipEngineClient:
             return cleaned
 
         return cleaned
+
+
+def _squash(value: str | None) -> str:
+    return " ".join((value or "").split())
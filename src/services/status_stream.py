@@ -0,0 +1,149 @@
+import asyncio
+import contextlib
+import json
+import logging
+from collections import defaultdict
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from typing import Any
+
+from redis.asyncio import Redis
+
+from src.core.enums import ValidationStatus
+
+logger = logging.getLogger(__name__)
+
+STATUS_CHANNEL = "address-status"
+
+
+@dataclass(frozen=True)
+class StatusEvent:
+    address_id: str
+    validation_status: ValidationStatus
+    country_code: str
+    validated_at: datetime | None = None
+    client_id: str | None = None
+
+    def to_json(self) -> str:
+        data = asdict(self)
+        data["validated_at"] = self.validated_at.isoformat() if self.validated_at else None
+        return json.dumps(data)
+
+    @classmethod
+    def from_json(cls, raw: str | bytes) -> "StatusEvent":
+        data = json.loads(raw)
+        return cls(
+            address_id=data["address_id"],
+            validation_status=ValidationStatus(data["validation_status"]),
+            country_code=data["country_code"],
+            validated_at=(
+                datetime.fromisoformat(data["validated_at"]) if data["validated_at"] else None
+            ),
+            client_id=data.get("client_id"),
+        )
+
+
+@dataclass(frozen=True)
+class StatusFilter:
+    """Empty criteria match everything; non-empty ones must all match."""
+
+    address_ids: frozenset[str] = frozenset()
+    statuses: frozenset[ValidationStatus] = frozenset()
+    country_codes: frozenset[str] = frozenset()
+
+    def matches(self, event: StatusEvent) -> bool:
+        return (
+            (not self.address_ids or event.address_id in self.address_ids)
+            and (not self.statuses or event.validation_status in self.statuses)
+            and (not self.country_codes or event.country_code in self.country_codes)
+        )
+
+
+@dataclass(eq=False)
+class Subscription:
+    status_filter: StatusFilter
+    queue: asyncio.Queue[StatusEvent] = field(default_factory=lambda: asyncio.Queue(maxsize=100))
+    dropped: int = 0
+
+    def push(self, event: StatusEvent) -> None:
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            self.dropped += 1
+
+
+async def publish_status(redis: Redis, event: StatusEvent) -> None:
+    await redis.publish(STATUS_CHANNEL, event.to_json())
+
+
+class StatusBroadcaster:
+    """Single Redis subscription per process, fanned out to in-process subscribers.
+
+    Subscriptions naming explicit addresses are indexed by id so an event only touches the
+    clients watching it; filter-only subscriptions are checked for every event. A client
+    that stops reading loses events instead of stalling the others.
+    """
+
+    def __init__(self, redis: Redis, reconnect_delay: float = 1.0) -> None:
+        self._redis = redis
+        self._reconnect_delay = reconnect_delay
+        self._by_address: defaultdict[str, set[Subscription]] = defaultdict(set)
+        self._by_filter: set[Subscription] = set()
+        self._task: asyncio.Task[None] | None = None
+
+    async def start(self) -> None:
+        self._task = asyncio.create_task(self._listen())
+
+    async def stop(self) -> None:
+        if self._task:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
+    def subscribe(self, status_filter: StatusFilter) -> Subscription:
+        subscription = Subscription(status_filter)
+        if status_filter.address_ids:
+            for address_id in status_filter.address_ids:
+                self._by_address[address_id].add(subscription)
+        else:
+            self._by_filter.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        for address_id in subscription.status_filter.address_ids:
+            subscribers = self._by_address.get(address_id)
+            if subscribers is not None:
+                subscribers.discard(subscription)
+                if not subscribers:
+                    del self._by_address[address_id]
+        self._by_filter.discard(subscription)
+
+    def dispatch(self, event: StatusEvent) -> None:
+        for subscription in self._by_address.get(event.address_id, ()):
+            if subscription.status_filter.matches(event):
+                subscription.push(event)
+        for subscription in self._by_filter:
+            if subscription.status_filter.matches(event):
+                subscription.push(event)
+
+    async def _listen(self) -> None:
+        while True:
+            try:
+                async with self._redis.pubsub(ignore_subscribe_messages=True) as pubsub:
+                    await pubsub.subscribe(STATUS_CHANNEL)
+                    async for message in pubsub.listen():
+                        self._handle(message)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning("Status stream subscription lost: %s", e)
+                await asyncio.sleep(self._reconnect_delay)
+
+    def _handle(self, message: dict[str, Any]) -> None:
+        try:
+            event = StatusEvent.from_json(message["data"])
+        except (KeyError, TypeError, ValueError):
+            logger.warning("Ignoring malformed status message: %r", message)
+            return
+        self.dispatch(event)
@@ -0,0 +1,52 @@
+from collections.abc import Sequence
+from datetime import timedelta
+from typing import Any
+
+from arq import ArqRedis
+from arq.constants import job_key_prefix
+
+VALIDATION_JOB_KEY = "validation:job:{}"
+# ARQ keeps a job's key until the job finishes, or this long past its scheduled time.
+JOB_KEY_EXPIRY = timedelta(days=1)
+
+
+async def enqueue_validation(
+    redis: ArqRedis,
+    address_id: str,
+    *,
+    bulk_id: str | None = None,
+    defer_by: timedelta | None = None,
+) -> None:
+    """Queue `validate_address_task` and remember its job id under the address.
+
+    ARQ job ids are random, so telling whether an address still has a job waiting would
+    otherwise mean reading every job in the queue.
+    """
+    kwargs: dict[str, Any] = {}
+    if bulk_id is not None:
+        kwargs["bulk_id"] = bulk_id
+    if defer_by is not None:
+        kwargs["_defer_by"] = defer_by
+    job = await redis.enqueue_job("validate_address_task", address_id, **kwargs)
+    if job is not None:
+        expiry = (defer_by or timedelta()) + JOB_KEY_EXPIRY
+        await redis.set(VALIDATION_JOB_KEY.format(address_id), job.job_id, ex=expiry)
+
+
+async def queued_validations(redis: ArqRedis, address_ids: Sequence[str]) -> set[str]:
+    """The subset of `address_ids` whose last validation job is still queued or running."""
+    if not address_ids:
+        return set()
+    job_ids = await redis.mget([VALIDATION_JOB_KEY.format(a) for a in address_ids])
+    known = [
+        (address_id, job_id.decode())
+        for address_id, job_id in zip(address_ids, job_ids, strict=True)
+        if job_id is not None
+    ]
+    async with redis.pipeline(transaction=False) as pipe:
+        for _address_id, job_id in known:
+            pipe.exists(job_key_prefix + job_id)
+        alive = await pipe.execute()
+    return {
+        address_id for (address_id, _job_id), exists in zip(known, alive, strict=True) if exists
+    }
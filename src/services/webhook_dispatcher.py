@@ -0,0 +1,359 @@
+import asyncio
+import hashlib
+import hmac
+import json
+import logging
+import random
+import time
+from collections import Counter, defaultdict
+from collections.abc import Callable
+from contextlib import AbstractAsyncContextManager
+from dataclasses import asdict, dataclass, field
+from typing import Any
+from uuid import UUID, uuid4
+
+import httpx
+from redis.asyncio import Redis
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.db.models.webhook import WebhookDeadLetter
+from src.repositories.webhook_repository import WebhookRepository
+from src.services.status_stream import StatusEvent
+
+logger = logging.getLogger(__name__)
+
+WEBHOOK_EVENTS_KEY = "webhooks:events"
+WEBHOOK_DELIVERIES_KEY = "webhooks:deliveries:{}"
+WEBHOOK_CLAIM_KEY = "webhooks:claim:{}"
+WEBHOOK_PROCESSING_KEY = "webhooks:processing:{}"
+WEBHOOK_LEASE_KEY = "webhooks:lease:{}"
+
+SessionFactory = Callable[[], AbstractAsyncContextManager[AsyncSession]]
+
+
+async def enqueue_webhook_event(redis: Redis, event: StatusEvent) -> None:
+    await redis.rpush(WEBHOOK_EVENTS_KEY, event.to_json())  # type: ignore[misc]
+
+
+@dataclass(frozen=True)
+class WebhookTarget:
+    id: str
+    client_id: str
+    url: str
+    secret: str | None
+
+
+@dataclass
+class Delivery:
+    endpoint_id: str
+    events: list[dict[str, Any]]
+    attempt: int = 0
+    id: str = field(default_factory=lambda: uuid4().hex)
+
+    def to_json(self) -> str:
+        return json.dumps(asdict(self))
+
+    @classmethod
+    def from_json(cls, raw: str | bytes) -> "Delivery":
+        return cls(**json.loads(raw))
+
+
+class WebhookDispatcher:
+    """Delivers validation outcomes to registered endpoints off the validation path.
+
+    Workers only append events to a Redis list. The dispatcher drains it in batches and turns
+    each batch into one delivery per endpoint, carrying only the events of addresses whose
+    `client_id` matches the endpoint's. Deliveries wait in a Redis sorted set per endpoint,
+    scored by when they are due, until they are sent or written to `webhook_dead_letters`
+    after `max_attempts`; a failed attempt only moves the delivery's score back.
+
+    Events are moved, not popped, into a processing list owned by this dispatcher and only
+    dropped from it in the transaction that queues their deliveries. The owner renews a
+    lease while it runs; a processing list whose lease has expired (the worker crashed or
+    was killed) is moved back onto the events list by whichever dispatcher finds it.
+
+    Each delivery is sent by its own task, at most `endpoint_concurrency` per endpoint and
+    `max_concurrency` in all, so a slow endpoint only holds up its own queue. Sending
+    claims the delivery for `lease_ttl` seconds; if the dispatcher dies, the claim expires
+    and another one sends it again, so delivery is at least once.
+    """
+
+    def __init__(
+        self,
+        redis: Redis,
+        http: httpx.AsyncClient,
+        session_factory: SessionFactory,
+        *,
+        batch_size: int = 100,
+        max_attempts: int = 6,
+        backoff_base: float = 2.0,
+        max_concurrency: int = 20,
+        endpoint_concurrency: int = 2,
+        poll_interval: float = 1.0,
+        endpoint_cache_ttl: float = 30.0,
+        lease_ttl: float = 120.0,
+    ) -> None:
+        self._redis = redis
+        self._http = http
+        self._session_factory = session_factory
+        self._batch_size = batch_size
+        self._max_attempts = max_attempts
+        self._backoff_base = backoff_base
+        self._max_concurrency = max_concurrency
+        self._endpoint_concurrency = endpoint_concurrency
+        self._poll_interval = poll_interval
+        self._endpoint_cache_ttl = endpoint_cache_ttl
+        self._targets: dict[str, WebhookTarget] = {}
+        self._targets_loaded_at = float("-inf")
+        self._lease_ttl = lease_ttl
+        self._id = uuid4().hex
+        self._processing_key = WEBHOOK_PROCESSING_KEY.format(self._id)
+        self._lease_key = WEBHOOK_LEASE_KEY.format(self._id)
+        self._recovered_at = float("-inf")
+        self._sending: dict[asyncio.Task[None], tuple[bytes, Delivery]] = {}
+
+    async def run(self) -> None:
+        while True:
+            try:
+                if time.monotonic() - self._recovered_at >= self._lease_ttl:
+                    await self.recover_orphaned_events()
+                    self._recovered_at = time.monotonic()
+                handled = await self.dispatch_once()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Webhook dispatch failed")
+                handled = 0
+            if not handled:
+                await asyncio.sleep(self._poll_interval)
+
+    async def release(self) -> None:
+        """Stop sending and hand claimed deliveries and events back to the other dispatchers."""
+        sending = list(self._sending.items())
+        for task, _claimed in sending:
+            task.cancel()
+        await asyncio.gather(*(task for task, _claimed in sending), return_exceptions=True)
+        if sending:
+            now = time.time()
+            async with self._redis.pipeline(transaction=False) as pipe:
+                for _task, (raw, delivery) in sending:
+                    pipe.zadd(
+                        WEBHOOK_DELIVERIES_KEY.format(delivery.endpoint_id), {raw: now}, xx=True
+                    )
+                    pipe.delete(WEBHOOK_CLAIM_KEY.format(delivery.id))
+                await pipe.execute()
+        await self._requeue(self._processing_key)
+        await self._redis.delete(self._lease_key)
+
+    async def join(self) -> None:
+        """Wait until the deliveries started so far have been sent or rescheduled."""
+        await asyncio.gather(*self._sending, return_exceptions=True)
+
+    async def recover_orphaned_events(self) -> int:
+        """Requeue the processing lists of dispatchers whose lease has expired."""
+        recovered = 0
+        pattern = WEBHOOK_PROCESSING_KEY.format("*")
+        async for raw_key in self._redis.scan_iter(match=pattern, _type="list"):
+            key = raw_key.decode() if isinstance(raw_key, bytes) else raw_key
+            owner = key.rsplit(":", 1)[1]
+            # Between batches our own list is only non-empty if queueing its deliveries failed.
+            if owner != self._id and await self._redis.exists(WEBHOOK_LEASE_KEY.format(owner)):
+                continue
+            recovered += await self._requeue(key)
+        if recovered:
+            logger.warning("Requeued %d webhook events from interrupted batches", recovered)
+        return recovered
+
+    async def dispatch_once(self) -> int:
+        """Queue the deliveries of one batch of events and start sending the due ones.
+
+        Returns how many events were taken and deliveries started; sending goes on in the
+        background.
+        """
+        await self._redis.set(self._lease_key, self._id, ex=int(self._lease_ttl))
+        targets = await self._active_targets()
+        queued = await self._queue_deliveries(targets)
+        started = await self._start_due_deliveries(targets)
+        return queued + started
+
+    async def _queue_deliveries(self, targets: dict[str, WebhookTarget]) -> int:
+        raw_events = await self._claim_events()
+        if not raw_events:
+            return 0
+
+        # Unowned addresses have no subscribers.
+        by_client: defaultdict[str, list[dict[str, Any]]] = defaultdict(list)
+        for raw in raw_events:
+            event = json.loads(raw)
+            if event.get("client_id"):
+                by_client[event["client_id"]].append(event)
+        now = time.time()
+        try:
+            async with self._redis.pipeline(transaction=True) as pipe:
+                for target in targets.values():
+                    if target.client_id in by_client:
+                        delivery = Delivery(target.id, by_client[target.client_id])
+                        pipe.zadd(
+                            WEBHOOK_DELIVERIES_KEY.format(target.id), {delivery.to_json(): now}
+                        )
+                pipe.delete(self._processing_key)
+                await pipe.execute()
+        except Exception:
+            # Nothing was queued; put the events back before the next batch is claimed.
+            await self._requeue(self._processing_key)
+            raise
+        return len(raw_events)
+
+    async def _start_due_deliveries(self, targets: dict[str, WebhookTarget]) -> int:
+        sending = Counter(delivery.endpoint_id for _raw, delivery in self._sending.values())
+        free = {
+            endpoint_id: self._endpoint_concurrency - sending[endpoint_id]
+            for endpoint_id in targets
+            if sending[endpoint_id] < self._endpoint_concurrency
+        }
+        if not free or len(self._sending) >= self._max_concurrency:
+            return 0
+
+        now = time.time()
+        async with self._redis.pipeline(transaction=False) as pipe:
+            for endpoint_id, slots in free.items():
+                pipe.zrangebyscore(
+                    WEBHOOK_DELIVERIES_KEY.format(endpoint_id), 0, now, start=0, num=slots
+                )
+            due = await pipe.execute()
+
+        started = 0
+        for endpoint_id, raws in zip(free, due, strict=True):
+            for raw in raws:
+                if len(self._sending) >= self._max_concurrency:
+                    return started
+                delivery = Delivery.from_json(raw)
+                if not await self._claim(raw, delivery):
+                    continue
+                task = asyncio.create_task(self._send(raw, delivery, targets[endpoint_id]))
+                self._sending[task] = (raw, delivery)
+                task.add_done_callback(self._sending.pop)
+                started += 1
+        return started
+
+    async def _claim(self, raw: bytes, delivery: Delivery) -> bool:
+        """Take `delivery` for one attempt, unless another dispatcher already has."""
+        claim_key = WEBHOOK_CLAIM_KEY.format(delivery.id)
+        if not await self._redis.set(claim_key, self._id, nx=True, ex=int(self._lease_ttl)):
+            return False
+        # Not due again before the claim expires, so it no longer fills the endpoint's slots.
+        moved = await self._redis.zadd(
+            WEBHOOK_DELIVERIES_KEY.format(delivery.endpoint_id),
+            {raw: time.time() + self._lease_ttl},
+            xx=True,
+            ch=True,
+        )
+        if not moved:
+            # Another dispatcher finished it between our read and our claim.
+            await self._redis.delete(claim_key)
+            return False
+        return True
+
+    async def _claim_events(self) -> list[bytes]:
+        first = await self._redis.lmove(WEBHOOK_EVENTS_KEY, self._processing_key, "LEFT", "RIGHT")
+        if first is None:
+            return []
+        async with self._redis.pipeline(transaction=False) as pipe:
+            for _ in range(self._batch_size - 1):
+                pipe.lmove(WEBHOOK_EVENTS_KEY, self._processing_key, "LEFT", "RIGHT")
+            rest = await pipe.execute()
+        return [first, *(raw for raw in rest if raw is not None)]
+
+    async def _requeue(self, key: str) -> int:
+        # Right to left, so the events go back to the front of the queue in their old order.
+        moved = 0
+        while await self._redis.lmove(key, WEBHOOK_EVENTS_KEY, "RIGHT", "LEFT") is not None:
+            moved += 1
+        return moved
+
+    async def _active_targets(self) -> dict[str, WebhookTarget]:
+        if time.monotonic() - self._targets_loaded_at < self._endpoint_cache_ttl:
+            return self._targets
+
+        async with self._session_factory() as session:
+            endpoints = await WebhookRepository(session).get_active()
+        targets = {
+            str(e.id): WebhookTarget(
+                id=str(e.id), client_id=e.client_id, url=e.url, secret=e.secret
+            )
+            for e in endpoints
+        }
+        removed = self._targets.keys() - targets.keys()
+        if removed:
+            # Deliveries to removed or deactivated endpoints are dropped.
+            await self._redis.delete(*(WEBHOOK_DELIVERIES_KEY.format(r) for r in removed))
+        self._targets = targets
+        self._targets_loaded_at = time.monotonic()
+        return self._targets
+
+    async def _send(self, raw: bytes, delivery: Delivery, target: WebhookTarget) -> None:
+        body = json.dumps({"events": delivery.events}).encode()
+        headers = {"Content-Type": "application/json"}
+        if target.secret:
+            digest = hmac.new(target.secret.encode(), body, hashlib.sha256).hexdigest()
+            headers["X-Webhook-Signature"] = f"sha256={digest}"
+
+        try:
+            response = await self._http.post(target.url, content=body, headers=headers)
+            response.raise_for_status()
+        except httpx.HTTPError as e:
+            error: str | None = repr(e)
+        except Exception as e:
+            logger.exception("Unexpected error delivering webhook %s", delivery.endpoint_id)
+            error = repr(e)
+        else:
+            error = None
+
+        try:
+            if error is None:
+                await self._settle(raw, delivery)
+            else:
+                await self._retry_or_dead_letter(raw, delivery, error)
+        except Exception:
+            # Still queued; it is sent again once the claim expires.
+            logger.exception("Failed to settle webhook delivery to %s", delivery.endpoint_id)
+
+    async def _settle(self, raw: bytes, delivery: Delivery, retry: Delivery | None = None) -> None:
+        """Drop this attempt's entry and claim, queueing `retry` in the same transaction."""
+        key = WEBHOOK_DELIVERIES_KEY.format(delivery.endpoint_id)
+        async with self._redis.pipeline(transaction=True) as pipe:
+            pipe.zrem(key, raw)
+            if retry is not None:
+                delay = self._backoff_base * 2 ** (retry.attempt - 1)
+                delay += random.uniform(0, self._backoff_base)
+                pipe.zadd(key, {retry.to_json(): time.time() + delay})
+            pipe.delete(WEBHOOK_CLAIM_KEY.format(delivery.id))
+            await pipe.execute()
+
+    async def _retry_or_dead_letter(self, raw: bytes, delivery: Delivery, error: str) -> None:
+        retry = Delivery(delivery.endpoint_id, delivery.events, delivery.attempt + 1, delivery.id)
+        if retry.attempt < self._max_attempts:
+            await self._settle(raw, delivery, retry)
+            return
+
+        logger.warning(
+            "Webhook %s dead-lettered after %d attempts: %s",
+            delivery.endpoint_id,
+            retry.attempt,
+            error,
+        )
+        try:
+            async with self._session_factory() as session:
+                await WebhookRepository(session).add_dead_letter(
+                    WebhookDeadLetter(
+                        endpoint_id=UUID(delivery.endpoint_id),
+                        events=delivery.events,
+                        attempts=retry.attempt,
+                        last_error=error,
+                    )
+                )
+        except IntegrityError:
+            # The endpoint was deleted while its batch was being retried.
+            logger.warning("Dropped dead letter for removed webhook %s", delivery.endpoint_id)
+        await self._settle(raw, delivery)
@@ -0,0 +1,29 @@
+from uuid import UUID
+
+from src.core.exceptions import WebhookNotFoundError
+from src.db.models.webhook import WebhookEndpoint
+from src.repositories.webhook_repository import WebhookRepository
+from src.schemas.webhook import WebhookCreate
+
+
+class WebhookService:
+    def __init__(self, repo: WebhookRepository) -> None:
+        self._repo = repo
+
+    async def register(self, data: WebhookCreate) -> WebhookEndpoint:
+        endpoint = WebhookEndpoint(
+            client_id=data.client_id,
+            url=str(data.url),
+            secret=data.secret,
+            is_active=True,
+        )
+        return await self._repo.create(endpoint)
+
+    async def get_by_client(self, client_id: str) -> list[WebhookEndpoint]:
+        return await self._repo.get_by_client(client_id)
+
+    async def delete(self, webhook_id: UUID) -> None:
+        endpoint = await self._repo.get_by_id(webhook_id)
+        if not endpoint:
+            raise WebhookNotFoundError(webhook_id)
+        await self._repo.delete(endpoint)
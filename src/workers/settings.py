@@ -1,30 +1,164 @@
+import asyncio
+import contextlib
+import functools
 import logging
-from typing import Any
+from collections.abc import Callable, Coroutine
+from typing import Any, cast
 
+import httpx
+from arq import cron, func
 from arq.connections import RedisSettings
+from arq.typing import WorkerCoroutine
+from arq.worker import Function
+from prometheus_client import start_http_server
+from redis.exceptions import RedisError
 
 from src.config import get_settings
-from src.workers.tasks import validate_address_task
+from src.db.session import dispose_engine, get_session
+from src.db.slow_query import set_query_origin
+from src.services.address_stats import AddressStatsCounter
+from src.services.circuit_breaker import CircuitBreaker
+from src.services.hedging import HedgePolicy
+from src.services.result_buffer import ValidationResultBuffer
+from src.services.webhook_dispatcher import WebhookDispatcher
+from src.workers.serialization import deserialize, serialize
+from src.workers.tasks import (
+    backfill_fingerprints_task,
+    enqueue_validation_batch_task,
+    reconcile_address_stats_task,
+    revalidate_stale_addresses_task,
+    sweep_pending_addresses_task,
+    validate_address_task,
+)
+from src.workers.timing import after_job_end, on_job_start
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
 
 
-async def startup(_ctx: dict[str, Any]) -> None:
+async def startup(ctx: dict[str, Any]) -> None:
     logger.info("ARQ worker starting...")
+    if settings.worker_metrics_port is not None:
+        start_http_server(settings.worker_metrics_port)
+        logger.info("Worker metrics served on port %d", settings.worker_metrics_port)
 
+    ctx["shipengine_breaker"] = CircuitBreaker(
+        "shipengine",
+        window_size=settings.circuit_breaker_window,
+        min_calls=settings.circuit_breaker_min_calls,
+        failure_rate_threshold=settings.circuit_breaker_failure_rate,
+        slow_call_seconds=settings.circuit_breaker_slow_call_seconds,
+        slow_call_rate_threshold=settings.circuit_breaker_slow_call_rate,
+        open_seconds=settings.circuit_breaker_open_seconds,
+    )
+    ctx["shipengine_hedge"] = (
+        HedgePolicy(
+            percentile=settings.shipengine_hedge_percentile,
+            window_size=settings.shipengine_hedge_window,
+            min_samples=settings.shipengine_hedge_min_samples,
+        )
+        if settings.shipengine_hedge_enabled
+        else None
+    )
+    ctx["result_buffer"] = (
+        ValidationResultBuffer(
+            get_session,
+            AddressStatsCounter(ctx["redis"]),
+            max_items=settings.result_buffer_max_items,
+            flush_interval=settings.result_buffer_flush_ms / 1000,
+        )
+        if settings.result_buffer_enabled
+        else None
+    )
+    ctx["http"] = httpx.AsyncClient(
+        timeout=settings.webhook_timeout,
+        limits=httpx.Limits(max_connections=settings.webhook_max_concurrency),
+    )
+    dispatcher = WebhookDispatcher(
+        ctx["redis"],
+        ctx["http"],
+        get_session,
+        batch_size=settings.webhook_batch_size,
+        max_attempts=settings.webhook_max_attempts,
+        backoff_base=settings.webhook_backoff_base,
+        max_concurrency=settings.webhook_max_concurrency,
+        endpoint_concurrency=settings.webhook_endpoint_concurrency,
+    )
+    ctx["webhook_dispatcher"] = dispatcher
+    ctx["webhook_dispatcher_task"] = asyncio.create_task(dispatcher.run())
 
-async def shutdown(_ctx: dict[str, Any]) -> None:
+
+async def shutdown(ctx: dict[str, Any]) -> None:
     logger.info("ARQ worker shutting down...")
+    dispatcher_task: asyncio.Task[None] = ctx["webhook_dispatcher_task"]
+    dispatcher_task.cancel()
+    with contextlib.suppress(asyncio.CancelledError):
+        await dispatcher_task
+    try:
+        await ctx["webhook_dispatcher"].release()
+    except RedisError as e:
+        logger.warning("Could not requeue in-flight webhook events: %s", e)
+    await ctx["http"].aclose()
+    if ctx["result_buffer"] is not None:
+        await ctx["result_buffer"].close()
+    await dispose_engine()
+
+
+def _labelled(
+    coroutine: Callable[..., Coroutine[Any, Any, Any]],
+) -> Callable[..., Coroutine[Any, Any, Any]]:
+    # Each job runs in its own asyncio task, so the label covers exactly that job's queries.
+    @functools.wraps(coroutine)
+    async def run(ctx: dict[str, Any], *args: Any, **kwargs: Any) -> Any:
+        set_query_origin(f"task {coroutine.__qualname__}")
+        return await coroutine(ctx, *args, **kwargs)
+
+    return run
+
+
+def _task(coroutine: Callable[..., Coroutine[Any, Any, Any]]) -> Function:
+    # `None` falls back to the worker-wide `keep_result`.
+    return func(
+        cast(WorkerCoroutine, _labelled(coroutine)),
+        keep_result=settings.job_keep_result.get(coroutine.__qualname__),
+    )
 
 
 class WorkerSettings:
     redis_settings = RedisSettings.from_dsn(settings.redis_url)
-    functions = [validate_address_task]
+    functions = [
+        _task(validate_address_task),
+        _task(enqueue_validation_batch_task),
+        _task(backfill_fingerprints_task),
+    ]
+    cron_jobs = [
+        cron(
+            _labelled(revalidate_stale_addresses_task),
+            minute=set(range(0, 60, settings.revalidation_interval_minutes)),
+            unique=True,
+        ),
+        cron(
+            _labelled(sweep_pending_addresses_task),
+            minute=set(range(0, 60, settings.pending_sweep_interval_minutes)),
+            unique=True,
+        ),
+        cron(
+            _labelled(reconcile_address_stats_task),
+            minute=set(range(0, 60, settings.stats_reconcile_interval_minutes)),
+            unique=True,
+            run_at_startup=True,
+        ),
+    ]
     on_startup = startup
     on_shutdown = shutdown
+    on_job_start = on_job_start
+    after_job_end = after_job_end
+    # Also caps how many outcomes the result buffer can collect (RESULT_BUFFER_MAX_ITEMS).
     max_jobs = 10
-    job_timeout = 300
-    keep_result = 3600
+    # Backstop only: ShipEngine calls are bounded by SHIPENGINE_TOTAL_TIMEOUT.
+    job_timeout = 60
+    keep_result = settings.job_keep_result_seconds
+    job_serializer = serialize
+    job_deserializer = deserialize
     retry_jobs = True
     max_tries = 3
@@ -1,40 +1,287 @@
 import logging
+import random
+from datetime import UTC, datetime, timedelta
 from typing import Any
 from uuid import UUID
 
+from arq import ArqRedis, Retry
+
+from src.config import get_settings
+from src.core.enums import ValidationStatus
+from src.core.exceptions import CircuitOpenError, UpstreamTimeoutError
+from src.core.metrics import PENDING_SWEEP_RECOVERED, PENDING_SWEEP_STUCK, VALIDATION_DEFERRED
 from src.db.session import get_session
 from src.repositories.address_repository import AddressRepository
 from src.services.address_service import AddressService
+from src.services.address_stats import AddressStatsCounter
+from src.services.bulk_validation import BulkValidationTracker
+from src.services.result_buffer import ResultWriteError, ValidationOutcome, ValidationResultBuffer
 from src.services.shipengine_client import ShipEngineClient
+from src.services.status_stream import StatusEvent, publish_status
+from src.services.validation_queue import enqueue_validation, queued_validations
+from src.services.webhook_dispatcher import enqueue_webhook_event
+from src.workers.timing import job_timing
 
 logger = logging.getLogger(__name__)
+settings = get_settings()
+
+REVALIDATION_CURSOR_KEY = "revalidation:cursor"
+# Backoff per try after the result buffer failed to write a batch.
+RESULT_WRITE_RETRY_DELAY = timedelta(seconds=5)
 
 
-async def validate_address_task(_ctx: dict[str, Any], address_id: str) -> dict[str, str]:
+async def validate_address_task(
+    ctx: dict[str, Any], address_id: str, bulk_id: str | None = None
+) -> dict[str, str]:
     logger.info("Starting validation for address %s", address_id)
 
+    redis: ArqRedis | None = ctx.get("redis")
+    buffer: ValidationResultBuffer | None = ctx.get("result_buffer")
+    timing = job_timing(ctx)
+    timing.fields["address_id"] = address_id
+
     async with get_session() as session:
         repo = AddressRepository(session)
-        service = AddressService(repo)
-        client = ShipEngineClient()
+        service = AddressService(repo, stats=AddressStatsCounter(redis) if redis else None)
+        client = ShipEngineClient(
+            breaker=ctx.get("shipengine_breaker"),
+            hedge=ctx.get("shipengine_hedge"),
+            call_timeout=settings.shipengine_call_timeout,
+            total_timeout=settings.shipengine_total_timeout,
+            max_attempts=settings.shipengine_max_attempts,
+        )
 
-        address = await repo.get_by_id(UUID(address_id))
+        with timing.phase("load"):
+            address = await repo.get_by_id(UUID(address_id))
         if not address:
             error_msg = f"Address {address_id} not found"
             logger.error(error_msg)
             raise ValueError(error_msg)
 
         logger.info("Calling ShipEngine API for address %s", address_id)
-        result = await client.validate_address(address)
+        try:
+            with timing.phase("upstream"):
+                result = await client.validate_address(address)
+        except CircuitOpenError as e:
+            if not redis:
+                raise
+            return await _defer_validation(redis, address_id, e.retry_after, bulk_id)
+        except UpstreamTimeoutError as e:
+            # Unlike an open circuit this uses up one of the job's `max_tries`.
+            job_try: int = ctx.get("job_try", 1)
+            logger.warning("Validation of address %s ran out of its time budget", address_id)
+            raise Retry(defer=timedelta(seconds=e.budget * job_try)) from e
 
-        await service.save_validation_result(
-            address_id=address.id,
-            status=result.status,
-            matched_address=result.matched_address,
-            messages=result.messages,
+        if buffer is None:
+            with timing.phase("save"):
+                await service.save_validation_result(
+                    address_id=address.id,
+                    status=result.status,
+                    matched_address=result.matched_address,
+                    messages=result.messages,
+                )
+                # Commit here rather than on leaving the block so the phase includes it.
+                await session.commit()
+            validated_at = address.validated_at
+        else:
+            validated_at = datetime.now(UTC)
+            outcome = ValidationOutcome(
+                address_id=address.id,
+                status=result.status,
+                previous_status=ValidationStatus(address.validation_status),
+                country_code=address.country_code,
+                validated_at=validated_at,
+                matched_address=result.matched_address,
+                messages=result.messages,
+            )
+        event = StatusEvent(
+            address_id=address_id,
+            validation_status=result.status,
+            # Stored as submitted; stream filters, stats and bulk filters compare upper case.
+            country_code=address.country_code.upper(),
+            validated_at=validated_at,
+            client_id=address.client_id,
         )
 
-        logger.info(
-            "Validation completed for address %s with status %s", address_id, result.status.value
-        )
-        return {"status": result.status.value, "address_id": address_id}
+    if buffer is not None:
+        # Outside the session, so no connection is held while the batch fills up.
+        with timing.phase("save"):
+            try:
+                saved = await buffer.save(outcome)
+            except ResultWriteError as e:
+                # Any other exception would fail the job for good; Retry re-queues it.
+                job_try = ctx.get("job_try", 1)
+                logger.warning("Result of address %s was not written; retrying", address_id)
+                raise Retry(defer=RESULT_WRITE_RETRY_DELAY * job_try) from e
+        if not saved:
+            # Deleted while the job ran; there is no row to announce a status for.
+            logger.info("Address %s was deleted during validation", address_id)
+            return {"status": "dropped", "address_id": address_id}
+
+    if redis:
+        with timing.phase("publish"):
+            await publish_status(redis, event)
+            await enqueue_webhook_event(redis, event)
+            if bulk_id:
+                await BulkValidationTracker(redis).record_result(UUID(bulk_id), result.status)
+
+    logger.info(
+        "Validation completed for address %s with status %s", address_id, result.status.value
+    )
+    return {"status": result.status.value, "address_id": address_id}
+
+
+async def _defer_validation(
+    redis: ArqRedis, address_id: str, retry_after: float, bulk_id: str | None = None
+) -> dict[str, str]:
+    """Re-enqueue past the breaker's open window instead of burning one of the job's tries.
+
+    Jitter spreads the deferred jobs so they do not all probe the upstream at once.
+    """
+    delay = retry_after + random.uniform(0, settings.circuit_breaker_defer_jitter_seconds)
+    await enqueue_validation(redis, address_id, bulk_id=bulk_id, defer_by=timedelta(seconds=delay))
+    VALIDATION_DEFERRED.inc()
+    logger.warning("Upstream circuit open; deferred address %s by %.1fs", address_id, delay)
+    return {"status": "deferred", "address_id": address_id}
+
+
+async def enqueue_validation_batch_task(
+    ctx: dict[str, Any], bulk_id: str, address_ids: list[str]
+) -> dict[str, int]:
+    """Fan one chunk of a bulk revalidation out into per-address validation jobs."""
+    redis: ArqRedis = ctx["redis"]
+    for address_id in address_ids:
+        await enqueue_validation(redis, address_id, bulk_id=bulk_id)
+    await BulkValidationTracker(redis).record_enqueued(UUID(bulk_id), len(address_ids))
+    return {"enqueued": len(address_ids)}
+
+
+async def backfill_fingerprints_task(
+    _ctx: dict[str, Any], batch_size: int = 1000
+) -> dict[str, int]:
+    """One-off job filling `Address.fingerprint` for rows created before it existed."""
+    client = ShipEngineClient()
+    updated = 0
+
+    while True:
+        async with get_session() as session:
+            repo = AddressRepository(session)
+            addresses = await repo.get_without_fingerprint(limit=batch_size)
+            if not addresses:
+                break
+
+            await repo.set_fingerprints({a.id: client.fingerprint(a) for a in addresses})
+
+        updated += len(addresses)
+        logger.info("Backfilled fingerprints for %d addresses", updated)
+
+    return {"updated": updated}
+
+
+async def revalidate_stale_addresses_task(ctx: dict[str, Any]) -> dict[str, int]:
+    """Cron job re-enqueueing addresses whose last validation is older than the policy age.
+
+    Each run enqueues at most what its share of the upstream rate budget allows until the
+    next run, spacing jobs with `_defer_by` so workers never see a burst. The keyset cursor
+    is kept in Redis so the next run continues where this one stopped instead of picking
+    up rows whose deferred jobs have not executed yet.
+    """
+    redis: ArqRedis = ctx["redis"]
+    rate = settings.shipengine_rate_limit * settings.revalidation_budget_share
+    budget = int(rate * settings.revalidation_interval_minutes * 60)
+    cutoff = datetime.now(UTC) - timedelta(days=settings.revalidation_max_age_days)
+
+    cursor = await _load_revalidation_cursor(redis)
+    enqueued = 0
+
+    while enqueued < budget:
+        async with get_session() as session:
+            keys = await AddressRepository(session).get_stale_keys(
+                cutoff,
+                after=cursor,
+                limit=min(settings.revalidation_chunk_size, budget - enqueued),
+            )
+        if not keys:
+            cursor = None
+            break
+
+        for _validated_at, address_id in keys:
+            await enqueue_validation(
+                redis, str(address_id), defer_by=timedelta(seconds=enqueued / rate)
+            )
+            enqueued += 1
+        cursor = keys[-1]
+
+    await _save_revalidation_cursor(redis, cursor)
+    logger.info("Enqueued %d stale addresses for revalidation", enqueued)
+    return {"enqueued": enqueued}
+
+
+async def _load_revalidation_cursor(redis: ArqRedis) -> tuple[datetime, UUID] | None:
+    raw = await redis.get(REVALIDATION_CURSOR_KEY)
+    if not raw:
+        return None
+    validated_at, address_id = raw.decode().split("|")
+    return datetime.fromisoformat(validated_at), UUID(address_id)
+
+
+async def _save_revalidation_cursor(redis: ArqRedis, cursor: tuple[datetime, UUID] | None) -> None:
+    if cursor is None:
+        await redis.delete(REVALIDATION_CURSOR_KEY)
+        return
+    validated_at, address_id = cursor
+    await redis.set(REVALIDATION_CURSOR_KEY, f"{validated_at.isoformat()}|{address_id}")
+
+
+async def sweep_pending_addresses_task(ctx: dict[str, Any]) -> dict[str, int]:
+    """Cron job re-enqueueing addresses stuck in PENDING with no validation job queued.
+
+    Covers rows created while Redis was unavailable and jobs dropped after `max_tries`.
+    Pages through the PENDING rows oldest first until it has found a batch of stuck ones,
+    so rows that still have a job queued never hide the stuck rows behind them.
+    """
+    redis: ArqRedis = ctx["redis"]
+    batch_size = settings.pending_sweep_batch_size
+    cutoff = datetime.now(UTC) - timedelta(minutes=settings.pending_sweep_threshold_minutes)
+
+    cursor: tuple[datetime, UUID] | None = None
+    pending = 0
+    stuck: list[str] = []
+    while len(stuck) < batch_size:
+        async with get_session() as session:
+            keys = await AddressRepository(session).get_pending_keys(
+                cutoff, after=cursor, limit=batch_size
+            )
+        if not keys:
+            break
+
+        pending += len(keys)
+        candidates = [str(address_id) for _since, address_id in keys]
+        queued = await queued_validations(redis, candidates)
+        stuck.extend(address_id for address_id in candidates if address_id not in queued)
+        if len(keys) < batch_size:
+            break
+        cursor = keys[-1]
+
+    # The rest are still stuck at the next run.
+    stuck = stuck[:batch_size]
+    PENDING_SWEEP_STUCK.set(len(stuck))
+    for address_id in stuck:
+        await enqueue_validation(redis, address_id)
+    PENDING_SWEEP_RECOVERED.inc(len(stuck))
+
+    logger.info("Pending sweep: %d past threshold, %d re-enqueued", pending, len(stuck))
+    return {"pending": pending, "recovered": len(stuck)}
+
+
+async def reconcile_address_stats_task(ctx: dict[str, Any]) -> dict[str, int]:
+    """Cron job replacing the incrementally maintained stats hash with exact counts."""
+    async with get_session() as session:
+        rows = await AddressRepository(session).count_by_status_and_country()
+
+    await AddressStatsCounter(ctx["redis"]).replace(
+        ((ValidationStatus(status), country_code), count) for status, country_code, count in rows
+    )
+    total = sum(count for _status, _country_code, count in rows)
+    logger.info("Reconciled address stats: %d addresses in %d groups", total, len(rows))
+    return {"groups": len(rows), "total": total}
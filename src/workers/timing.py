@@ -0,0 +1,68 @@
+import logging
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any
+
+from src.core.metrics import JOB_QUEUE_WAIT, VALIDATION_PHASE_SECONDS
+
+logger = logging.getLogger(__name__)
+
+JOB_TIMING_KEY = "job_timing"
+
+
+@dataclass
+class JobTiming:
+    """Where one job's time went: queue wait plus named phases timed by the task itself."""
+
+    queue_wait: float = 0.0
+    started: float = field(default_factory=time.perf_counter)
+    phases: dict[str, float] = field(default_factory=dict)
+    fields: dict[str, str] = field(default_factory=dict)
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases[name] = self.phases.get(name, 0.0) + time.perf_counter() - start
+
+
+def job_timing(ctx: dict[str, Any]) -> JobTiming:
+    """The running job's timing, or a throwaway one when the task runs outside a worker."""
+    timing: JobTiming | None = ctx.get(JOB_TIMING_KEY)
+    return timing if timing is not None else JobTiming()
+
+
+async def on_job_start(ctx: dict[str, Any]) -> None:
+    # `score` is when the job became due, so deferred jobs don't count their delay as waiting.
+    queue_wait = max(time.time() - ctx["score"] / 1000, 0.0)
+    JOB_QUEUE_WAIT.observe(queue_wait)
+    ctx[JOB_TIMING_KEY] = JobTiming(queue_wait=queue_wait)
+
+
+async def after_job_end(ctx: dict[str, Any]) -> None:
+    """Export the phases once ARQ has recorded the job's outcome, so `total` includes it."""
+    timing: JobTiming | None = ctx.get(JOB_TIMING_KEY)
+    if timing is None or not timing.phases:
+        return
+
+    total = time.perf_counter() - timing.started
+    for name, seconds in timing.phases.items():
+        VALIDATION_PHASE_SECONDS.labels(phase=name).observe(seconds)
+    VALIDATION_PHASE_SECONDS.labels(phase="total").observe(total)
+
+    breakdown = {
+        "job_id": ctx["job_id"],
+        **timing.fields,
+        "queue_wait": round(timing.queue_wait, 4),
+        **{name: round(seconds, 4) for name, seconds in timing.phases.items()},
+        "total": round(total, 4),
+    }
+    logger.info(
+        "Job timing %s",
+        " ".join(f"{key}={value}" for key, value in breakdown.items()),
+        extra={"job_timing": breakdown},
+    )
@@ -0,0 +1,86 @@
+"""Micro-benchmarks: `python -m tests.benchmarks [--save | --compare] [--tolerance 0.25]`."""
+
+import argparse
+import asyncio
+import sys
+from pathlib import Path
+
+from tests.benchmarks import (
+    bench_repository,
+    bench_responses,
+    bench_schemas,
+    bench_shipengine_client,
+    bench_startup,
+)
+from tests.benchmarks.runner import (
+    DEFAULT_BASELINE,
+    DEFAULT_TOLERANCE,
+    Suite,
+    compare,
+    load_baseline,
+    run_suites,
+    save_baseline,
+)
+
+SUITES: list[Suite] = [
+    bench_shipengine_client.suite,
+    bench_schemas.suite,
+    bench_responses.suite,
+    bench_repository.suite,
+    bench_startup.suite,
+]
+
+
+async def collect(name_filter: str | None) -> dict[str, float]:
+    results: dict[str, float] = {}
+    async for name, ns in run_suites(SUITES, name_filter):
+        results[name] = ns
+        print(f"{name:<50} {ns / 1000:>12.2f} us")
+    return results
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(prog="python -m tests.benchmarks", description=__doc__)
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument("--save", action="store_true", help="Store results as the new baseline")
+    mode.add_argument(
+        "--compare", action="store_true", help="Fail if any benchmark regressed past tolerance"
+    )
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE)
+    parser.add_argument("-k", dest="name_filter", help="Only run benchmarks containing this")
+    args = parser.parse_args()
+
+    if args.compare and not args.baseline.exists():
+        # Baselines are machine-specific, so none is committed.
+        print(
+            f"No baseline at {args.baseline}. Record one on this machine with "
+            "`python -m tests.benchmarks --save` first.",
+            file=sys.stderr,
+        )
+        return 2
+
+    results = asyncio.run(collect(args.name_filter))
+
+    if args.save:
+        # Keep entries of benchmarks that were filtered out of this run.
+        previous = load_baseline(args.baseline) if args.baseline.exists() else {}
+        save_baseline(args.baseline, {**previous, **results})
+        print(f"Baseline written to {args.baseline}")
+        return 0
+
+    if args.compare:
+        regressions = compare(results, load_baseline(args.baseline), args.tolerance)
+        for r in regressions:
+            print(
+                f"REGRESSION {r.name}: {r.baseline_ns / 1000:.2f} us -> "
+                f"{r.current_ns / 1000:.2f} us ({r.ratio:.2f}x)",
+                file=sys.stderr,
+            )
+        return 1 if regressions else 0
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
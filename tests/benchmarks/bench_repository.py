@@ -0,0 +1,99 @@
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from datetime import UTC, datetime, timedelta
+
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from src.core.enums import ValidationStatus
+from src.db.models.address import Address, ValidationResult
+from src.db.models.base import Base
+from src.repositories.address_repository import AddressRepository
+from src.services.shipengine_client import ShipEngineClient
+from tests.benchmarks.runner import BenchmarkFn
+from tests.factories.address_factory import create_test_address
+
+DATABASE_URL = "sqlite+aiosqlite:///:memory:"
+SEED_ADDRESSES = 5000
+RESULTS_PER_ADDRESS = 5
+COUNTRIES = ("US", "CA", "GB", "DE", "FR")
+SPARSE_FIELDS = frozenset({"id", "validation_status", "postal_code"})
+STATUSES = (
+    ValidationStatus.VERIFIED,
+    ValidationStatus.WARNING,
+    ValidationStatus.ERROR,
+    ValidationStatus.PENDING,
+)
+
+
+def seed_rows() -> tuple[list[dict[str, object]], list[dict[str, object]]]:
+    client = ShipEngineClient()
+    now = datetime.now(UTC)
+    addresses: list[dict[str, object]] = []
+    results: list[dict[str, object]] = []
+    for i in range(SEED_ADDRESSES):
+        status = STATUSES[i % len(STATUSES)]
+        address = create_test_address(
+            address_line1=f"{i} Main Street",
+            country_code=COUNTRIES[i % len(COUNTRIES)],
+            validation_status=status,
+            validated_at=None if status == ValidationStatus.PENDING else now - timedelta(days=i),
+            created_at=now - timedelta(minutes=i),
+        )
+        address.fingerprint = client.fingerprint(address)
+        addresses.append({c.key: getattr(address, c.key) for c in Address.__table__.columns})
+        results.extend(
+            {
+                "address_id": address.id,
+                "status": status,
+                "matched_address": None,
+                "messages": None,
+                "created_at": now - timedelta(days=j),
+            }
+            for j in range(RESULTS_PER_ADDRESS if address.validated_at else 0)
+        )
+    return addresses, results
+
+
+@asynccontextmanager
+async def suite() -> AsyncIterator[dict[str, BenchmarkFn]]:
+    engine = create_async_engine(DATABASE_URL)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+        addresses, results = seed_rows()
+        await conn.execute(insert(Address), addresses)
+        await conn.execute(insert(ValidationResult), results)
+
+    session_maker = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    sample = addresses[SEED_ADDRESSES // 2]
+    sample_ids = [a["id"] for a in addresses[:100]]
+    cutoff = datetime.now(UTC) - timedelta(days=SEED_ADDRESSES // 2)
+
+    def query(method: str, *args: object, **kwargs: object) -> BenchmarkFn:
+        async def run() -> None:
+            # A fresh session per call so the identity map never serves a cached row.
+            async with session_maker() as session:
+                await getattr(AddressRepository(session), method)(*args, **kwargs)
+
+        return run
+
+    try:
+        yield {
+            "repository.get_by_id_with_results": query("get_by_id_with_results", sample["id"]),
+            "repository.get_all_with_results": query("get_all_with_results", limit=20),
+            "repository.get_all_with_results_sparse": query(
+                "get_all_with_results", limit=20, fields=SPARSE_FIELDS
+            ),
+            "repository.get_all_with_results_deep_offset": query(
+                "get_all_with_results", limit=20, offset=SEED_ADDRESSES - 20
+            ),
+            "repository.count": query("count"),
+            "repository.get_validated_by_fingerprint": query(
+                "get_validated_by_fingerprint", sample["fingerprint"]
+            ),
+            "repository.get_stale_keys": query("get_stale_keys", cutoff, limit=500),
+            "repository.get_by_ids": query("get_by_ids", sample_ids),
+            "repository.count_by_status_and_country": query("count_by_status_and_country"),
+        }
+    finally:
+        await engine.dispose()
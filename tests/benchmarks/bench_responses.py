@@ -0,0 +1,58 @@
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+
+from src.api.responses import PydanticResponse
+from src.schemas.address import AddressListResponse, AddressResponse
+from tests.benchmarks.bench_schemas import address_with_history
+from tests.benchmarks.runner import BenchmarkFn
+
+PAGE_SIZE = 100
+HISTORY_LENGTH = 10
+
+
+def build_app() -> FastAPI:
+    """Two routes serving the same ORM page: through `response_model`, and the fast path."""
+    page = [address_with_history(HISTORY_LENGTH) for _ in range(PAGE_SIZE)]
+    app = FastAPI()
+
+    @app.get("/response-model", response_model=AddressListResponse)
+    async def via_response_model() -> AddressListResponse:
+        return AddressListResponse(
+            items=[AddressResponse.model_validate(a) for a in page],
+            total=PAGE_SIZE,
+            limit=PAGE_SIZE,
+            offset=0,
+        )
+
+    @app.get("/fast-path", response_model=AddressListResponse)
+    async def via_fast_path() -> PydanticResponse:
+        return PydanticResponse(
+            AddressListResponse(
+                items=[AddressResponse.model_validate(a) for a in page],
+                total=PAGE_SIZE,
+                limit=PAGE_SIZE,
+                offset=0,
+            )
+        )
+
+    return app
+
+
+@asynccontextmanager
+async def suite() -> AsyncIterator[dict[str, BenchmarkFn]]:
+    transport = ASGITransport(app=build_app())
+    async with AsyncClient(transport=transport, base_url="http://bench") as http:
+
+        async def response_model() -> None:
+            (await http.get("/response-model")).raise_for_status()
+
+        async def fast_path() -> None:
+            (await http.get("/fast-path")).raise_for_status()
+
+        yield {
+            f"responses.list_page_{PAGE_SIZE}_response_model": response_model,
+            f"responses.list_page_{PAGE_SIZE}_fast_path": fast_path,
+        }
@@ -0,0 +1,55 @@
+import uuid
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from datetime import UTC, datetime, timedelta
+
+from src.core.enums import ValidationStatus
+from src.db.models.address import Address, ValidationResult
+from src.schemas.address import AddressListResponse, AddressResponse
+from tests.benchmarks.runner import BenchmarkFn
+from tests.factories.address_factory import create_test_address
+
+HISTORY_LENGTHS = (0, 10, 100)
+LIST_PAGE_SIZE = 20
+
+
+def address_with_history(length: int) -> Address:
+    address = create_test_address(validation_status=ValidationStatus.VERIFIED)
+    now = datetime.now(UTC)
+    address.validation_results = [
+        ValidationResult(
+            id=uuid.uuid4(),
+            address_id=address.id,
+            status=ValidationStatus.VERIFIED,
+            matched_address={
+                "address_line1": address.address_line1.upper(),
+                "city_locality": address.city_locality.upper(),
+                "state_province": address.state_province,
+                "postal_code": address.postal_code,
+                "country_code": address.country_code,
+            },
+            messages=None,
+            created_at=now - timedelta(days=i),
+        )
+        for i in range(length)
+    ]
+    return address
+
+
+@asynccontextmanager
+async def suite() -> AsyncIterator[dict[str, BenchmarkFn]]:
+    cases: dict[str, BenchmarkFn] = {}
+    for length in HISTORY_LENGTHS:
+        address = address_with_history(length)
+        cases[f"schemas.address_response_history_{length}"] = lambda address=address: (
+            AddressResponse.model_validate(address)
+        )
+
+    page = [address_with_history(10) for _ in range(LIST_PAGE_SIZE)]
+    cases["schemas.address_list_page"] = lambda: AddressListResponse(
+        items=[AddressResponse.model_validate(a) for a in page],
+        total=len(page),
+        limit=LIST_PAGE_SIZE,
+        offset=0,
+    )
+    yield cases
@@ -0,0 +1,35 @@
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+from src.services.shipengine_client import ShipEngineClient
+from tests.benchmarks.runner import BenchmarkFn
+from tests.constants import AddressData
+from tests.factories.address_factory import create_test_address
+
+
+@asynccontextmanager
+async def suite() -> AsyncIterator[dict[str, BenchmarkFn]]:
+    client = ShipEngineClient()
+    address = create_test_address()
+    invalid = create_test_address(
+        address_line1="",
+        city_locality="",
+        postal_code=AddressData.POSTAL_CODE_INVALID,
+        country_code=AddressData.COUNTRY_CODE_INVALID,
+    )
+    malformed_zip = create_test_address(postal_code="7870A")
+    long_street = "1600 Pennsylvania Avenue Northwest Boulevard Court Lane Drive Road Street"
+
+    yield {
+        "client.normalize_street": lambda: client._normalize_street(
+            AddressData.ADDRESS_LINE1_DEFAULT
+        ),
+        "client.normalize_street_long": lambda: client._normalize_street(long_street),
+        "client.normalize_postal_code": lambda: client._normalize_postal_code(
+            AddressData.POSTAL_CODE_DEFAULT, AddressData.COUNTRY_CODE_US
+        ),
+        "client.validate_fields": lambda: client._validate_fields(address),
+        "client.validate_fields_invalid": lambda: client._validate_fields(invalid),
+        "client.validate_fields_rules_reject": lambda: client._validate_fields(malformed_zip),
+        "client.fingerprint": lambda: client.fingerprint(address),
+    }
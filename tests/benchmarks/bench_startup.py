@@ -0,0 +1,65 @@
+import asyncio
+import sys
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from pathlib import Path
+
+from tests.benchmarks.runner import BenchmarkFn, SelfTimed
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+
+IMPORT_MAIN = """
+import time
+started_at = time.perf_counter()
+import src.main
+print(time.perf_counter() - started_at)
+"""
+
+FIRST_REQUEST = """
+import asyncio
+import logging
+import time
+
+logging.disable(logging.CRITICAL)
+started_at = time.perf_counter()
+
+from httpx import ASGITransport, AsyncClient
+
+from src.main import create_app
+
+
+async def main() -> float:
+    app = create_app()
+    async with app.router.lifespan_context(app):
+        transport = ASGITransport(app=app)
+        async with AsyncClient(transport=transport, base_url="http://bench") as http:
+            (await http.get("/api/v1/health")).raise_for_status()
+            return time.perf_counter() - started_at
+
+
+print(asyncio.run(main()))
+"""
+
+
+async def run_snippet(code: str) -> float:
+    """Seconds reported on the last stdout line of `code` run in a fresh interpreter."""
+    proc = await asyncio.create_subprocess_exec(
+        sys.executable,
+        "-c",
+        code,
+        cwd=PROJECT_ROOT,
+        stdout=asyncio.subprocess.PIPE,
+    )
+    stdout, _ = await proc.communicate()
+    if proc.returncode:
+        raise RuntimeError(f"Startup benchmark exited with {proc.returncode}")
+    return float(stdout.decode().split()[-1])
+
+
+@asynccontextmanager
+async def suite() -> AsyncIterator[dict[str, BenchmarkFn]]:
+    yield {
+        "startup.import_main": SelfTimed(lambda: run_snippet(IMPORT_MAIN)),
+        # Includes lifespan: engine creation, pool pre-warm and Redis connect.
+        "startup.first_request": SelfTimed(lambda: run_snippet(FIRST_REQUEST)),
+    }
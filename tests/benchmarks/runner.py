@@ -0,0 +1,101 @@
+import inspect
+import json
+import platform
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import AbstractAsyncContextManager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+
+@dataclass(frozen=True)
+class SelfTimed:
+    """A benchmark that reports its own duration in seconds, e.g. from a fresh subprocess."""
+
+    sample: Callable[[], Awaitable[float]]
+    repeats: int = 5
+
+
+BenchmarkFn = Callable[[], Any] | Callable[[], Awaitable[Any]] | SelfTimed
+Suite = Callable[[], AbstractAsyncContextManager[dict[str, BenchmarkFn]]]
+
+DEFAULT_BASELINE = Path(__file__).with_name("baseline.json")
+DEFAULT_TOLERANCE = 0.25
+
+
+@dataclass(frozen=True)
+class Regression:
+    name: str
+    baseline_ns: float
+    current_ns: float
+
+    @property
+    def ratio(self) -> float:
+        return self.current_ns / self.baseline_ns
+
+
+async def measure(fn: BenchmarkFn, *, min_time: float = 0.1, repeats: int = 7) -> float:
+    """Nanoseconds per call: the fastest of `repeats` loops that each run at least `min_time`.
+
+    The minimum is used because scheduler and GC noise only ever make a loop slower.
+    """
+    if isinstance(fn, SelfTimed):
+        return min([await fn.sample() for _ in range(fn.repeats)]) * 1e9
+
+    is_async = inspect.iscoroutinefunction(fn)
+
+    async def timed(number: int) -> float:
+        started_at = time.perf_counter()
+        if is_async:
+            for _ in range(number):
+                await fn()
+        else:
+            for _ in range(number):
+                fn()
+        return time.perf_counter() - started_at
+
+    number = 1
+    while (elapsed := await timed(number)) < min_time:
+        number *= 10 if elapsed < min_time / 10 else 2
+
+    best = elapsed / number
+    for _ in range(repeats - 1):
+        best = min(best, await timed(number) / number)
+    return best * 1e9
+
+
+async def run_suites(
+    suites: list[Suite], name_filter: str | None = None
+) -> AsyncIterator[tuple[str, float]]:
+    for suite in suites:
+        async with suite() as cases:
+            for name, fn in cases.items():
+                if name_filter and name_filter not in name:
+                    continue
+                yield name, await measure(fn)
+
+
+def compare(
+    results: dict[str, float], baseline: dict[str, float], tolerance: float
+) -> list[Regression]:
+    """Benchmarks slower than `baseline * (1 + tolerance)`; unknown names are ignored."""
+    return [
+        Regression(name, baseline[name], current)
+        for name, current in results.items()
+        if name in baseline and current > baseline[name] * (1 + tolerance)
+    ]
+
+
+def load_baseline(path: Path) -> dict[str, float]:
+    data = json.loads(path.read_text())
+    return {name: float(ns) for name, ns in data["results"].items()}
+
+
+def save_baseline(path: Path, results: dict[str, float]) -> None:
+    data = {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "results": {name: round(ns, 1) for name, ns in sorted(results.items())},
+    }
+    path.write_text(json.dumps(data, indent=2) + "\n")
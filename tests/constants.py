@@ -40,11 +40,14 @@ class ValidationMessages:
 class StatusCodes:
     OK = 200
     CREATED = 201
+    ACCEPTED = 202
     NO_CONTENT = 204
     BAD_REQUEST = 400
     NOT_FOUND = 404
     UNPROCESSABLE = 422
+    SERVICE_UNAVAILABLE = 503
 
 
 class TaskNames:
     VALIDATE_ADDRESS = "validate_address_task"
+    ENQUEUE_VALIDATION_BATCH = "enqueue_validation_batch_task"
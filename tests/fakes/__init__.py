@@ -0,0 +1 @@
+"""In-memory stand-ins for external services."""
@@ -0,0 +1,183 @@
+import fnmatch
+from collections.abc import AsyncIterator
+from typing import Any
+from unittest.mock import AsyncMock
+
+
+class FakePipeline:
+    def __init__(self, redis: "FakeRedis") -> None:
+        self._redis = redis
+        self._commands: list[tuple[str, tuple[Any, ...], dict[str, Any]]] = []
+
+    async def __aenter__(self) -> "FakePipeline":
+        return self
+
+    async def __aexit__(self, *exc: object) -> None:
+        return None
+
+    def __getattr__(self, name: str) -> Any:
+        def queue(*args: Any, **kwargs: Any) -> None:
+            self._commands.append((name, args, kwargs))
+
+        return queue
+
+    async def execute(self) -> list[Any]:
+        return [
+            await getattr(self._redis, name)(*args, **kwargs)
+            for name, args, kwargs in self._commands
+        ]
+
+
+class FakeRedis:
+    """Just enough of the string, hash, list and sorted set commands, SCAN and pipelines for
+    the Redis-backed services."""
+
+    def __init__(self) -> None:
+        self.hashes: dict[str, dict[bytes, bytes]] = {}
+        self.strings: dict[str, bytes] = {}
+        self.zsets: dict[str, dict[bytes, float]] = {}
+        self.lists: dict[str, list[bytes]] = {}
+        self.ttls: dict[str, Any] = {}
+        self.enqueue_job = AsyncMock(return_value=None)
+
+    def pipeline(self, **_kwargs: Any) -> FakePipeline:
+        return FakePipeline(self)
+
+    async def hincrby(self, key: str, field: str, amount: int) -> int:
+        fields = self.hashes.setdefault(key, {})
+        value = int(fields.get(field.encode(), b"0")) + amount
+        fields[field.encode()] = str(value).encode()
+        return value
+
+    async def get(self, key: str) -> bytes | None:
+        return self.strings.get(key)
+
+    async def mget(self, keys: list[str]) -> list[bytes | None]:
+        return [self.strings.get(key) for key in keys]
+
+    async def exists(self, *keys: str) -> int:
+        return sum(
+            any(key in store for store in (self.strings, self.hashes, self.lists, self.zsets))
+            for key in keys
+        )
+
+    async def set(
+        self,
+        key: str,
+        value: str,
+        *,
+        nx: bool = False,
+        px: int | None = None,
+        ex: Any = None,
+    ) -> bool | None:
+        if nx and key in self.strings:
+            return None
+        self.strings[key] = value.encode()
+        if px is not None or ex is not None:
+            self.ttls[key] = px if px is not None else ex
+        return True
+
+    async def delete(self, *keys: str) -> None:
+        for key in keys:
+            for store in (self.strings, self.hashes, self.lists, self.zsets):
+                store.pop(key, None)
+
+    async def rpush(self, key: str, *values: str | bytes) -> int:
+        items = self.lists.setdefault(key, [])
+        items.extend(v.encode() if isinstance(v, str) else v for v in values)
+        return len(items)
+
+    async def lmove(
+        self, source: str, destination: str, src: str = "LEFT", dest: str = "RIGHT"
+    ) -> bytes | None:
+        items = self.lists.get(source)
+        if not items:
+            return None
+        value = items.pop(0 if src == "LEFT" else -1)
+        if not items:
+            del self.lists[source]
+        target = self.lists.setdefault(destination, [])
+        target.insert(0 if dest == "LEFT" else len(target), value)
+        return value
+
+    async def zadd(
+        self, key: str, mapping: dict[Any, float], *, xx: bool = False, ch: bool = False
+    ) -> int:
+        members = self.zsets.setdefault(key, {})
+        changed = 0
+        for member, score in mapping.items():
+            member = member.encode() if isinstance(member, str) else member
+            if xx and member not in members:
+                continue
+            changed += member not in members or (ch and members[member] != score)
+            members[member] = score
+        if not members:
+            del self.zsets[key]
+        return changed
+
+    async def zrem(self, key: str, *members: str | bytes) -> int:
+        scores = self.zsets.get(key, {})
+        removed = 0
+        for member in members:
+            member = member.encode() if isinstance(member, str) else member
+            removed += scores.pop(member, None) is not None
+        if key in self.zsets and not scores:
+            del self.zsets[key]
+        return removed
+
+    async def zrangebyscore(
+        self,
+        key: str,
+        min: float,
+        max: float,
+        start: int | None = None,
+        num: int | None = None,
+    ) -> list[bytes]:
+        members = sorted(
+            (score, member)
+            for member, score in self.zsets.get(key, {}).items()
+            if min <= score <= max
+        )
+        found = [member for _score, member in members]
+        if start is not None and num is not None:
+            found = found[start : start + num]
+        return found
+
+    async def hset(self, key: str, mapping: dict[str, int]) -> None:
+        fields = self.hashes.setdefault(key, {})
+        fields.update({f.encode(): str(v).encode() for f, v in mapping.items()})
+
+    async def expire(self, key: str, ttl: Any) -> None:
+        self.ttls[key] = ttl
+
+    async def hgetall(self, key: str) -> dict[bytes, bytes]:
+        return dict(self.hashes.get(key, {}))
+
+    async def scan_iter(
+        self, match: str | None = None, _type: str | None = None, **_options: Any
+    ) -> AsyncIterator[bytes]:
+        types: dict[str, dict[str, Any]] = {
+            "hash": self.hashes,
+            "string": self.strings,
+            "zset": self.zsets,
+            "list": self.lists,
+        }
+        for type_name, keys in types.items():
+            if _type not in (None, type_name):
+                continue
+            for key in list(keys):
+                if match is None or fnmatch.fnmatchcase(key, match):
+                    yield key.encode()
+
+    async def zscan_iter(self, key: str) -> AsyncIterator[tuple[bytes, float]]:
+        for member, score in self.zsets.get(key, {}).items():
+            yield member, score
+
+    async def memory_usage(self, key: str) -> int | None:
+        if key in self.strings:
+            return len(self.strings[key])
+        if key in self.hashes:
+            return sum(len(f) + len(v) for f, v in self.hashes[key].items())
+        if key in self.zsets:
+            return sum(len(m) + 8 for m in self.zsets[key])
+        return None
@@ -1,7 +1,10 @@
 from collections.abc import AsyncGenerator
+from typing import Any
 
 import pytest
+from fastapi import FastAPI
 from httpx import ASGITransport, AsyncClient
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
     AsyncSession,
@@ -10,9 +13,8 @@ from sqlalchemy.ext.asyncio import (
 )
 
 from src.api.dependencies.database import get_db
-from src.api.dependencies.services import set_arq_pool
 from src.db.models.base import Base
-from src.main import app
+from src.main import create_app
 
 TEST_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
 
@@ -21,6 +23,11 @@ TEST_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
 async def test_engine() -> AsyncGenerator[AsyncEngine, None]:
     engine = create_async_engine(TEST_DATABASE_URL, echo=False)
 
+    @event.listens_for(engine.sync_engine, "connect")
+    def enable_foreign_keys(dbapi_connection: Any, _record: Any) -> None:
+        # SQLite ignores ON DELETE CASCADE unless foreign keys are switched on.
+        dbapi_connection.execute("PRAGMA foreign_keys=ON")
+
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
 
@@ -45,7 +52,7 @@ async def test_session(test_engine: AsyncEngine) -> AsyncGenerator[AsyncSession,
 
 
 @pytest.fixture
-async def client(test_engine: AsyncEngine) -> AsyncGenerator[AsyncClient, None]:
+def app(test_engine: AsyncEngine) -> FastAPI:
     session_maker = async_sessionmaker(
         test_engine,
         class_=AsyncSession,
@@ -61,13 +68,16 @@ async def client(test_engine: AsyncEngine) -> AsyncGenerator[AsyncClient, None]:
                 await session.rollback()
                 raise
 
+    app = create_app()
+    app.state.engine = test_engine
     app.dependency_overrides[get_db] = override_get_db
-    set_arq_pool(None)
+    return app
+
 
+@pytest.fixture
+async def client(app: FastAPI) -> AsyncGenerator[AsyncClient, None]:
     async with AsyncClient(
         transport=ASGITransport(app=app),
         base_url="http://test",
     ) as client:
         yield client
-
-    app.dependency_overrides.clear()
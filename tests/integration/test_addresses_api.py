@@ -1,8 +1,22 @@
+import asyncio
+import logging
 from typing import Any
+from unittest.mock import AsyncMock
+from uuid import UUID
 
 import pytest
+from fastapi import FastAPI
 from httpx import AsyncClient
-
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from src.api.dependencies.database import get_db
+from src.core.enums import ValidationStatus
+from src.db.models.address import ValidationResult
+from src.db.session import create_session_maker
+from src.db.slow_query import SlowQueryLog
+from src.repositories.address_repository import AddressRepository
+from src.services.address_service import AddressService
 from tests.constants import (
     AddressData,
     HealthStatus,
@@ -10,6 +24,7 @@ from tests.constants import (
     TestIds,
     ValidationStatusValues,
 )
+from tests.fakes.redis import FakeRedis
 
 
 class TestAddressesAPI:
@@ -76,6 +91,7 @@ class TestAddressesAPI:
         response = await client.get("/api/v1/addresses")
 
         assert response.status_code == StatusCodes.OK
+        assert response.headers["content-type"] == "application/json"
         data = response.json()
         assert data["total"] == 1
         assert len(data["items"]) == 1
@@ -97,6 +113,48 @@ class TestAddressesAPI:
         data = response.json()
         assert data["id"] == address_id
 
+    async def test_list_addresses_with_fields_returns_only_those_fields(
+        self,
+        client: AsyncClient,
+        valid_address_payload: dict[str, Any],
+    ) -> None:
+        await client.post("/api/v1/addresses", json=valid_address_payload)
+
+        response = await client.get(
+            "/api/v1/addresses", params={"fields": "validation_status,postal_code"}
+        )
+
+        assert response.status_code == StatusCodes.OK
+        data = response.json()
+        assert data["total"] == 1
+        assert data["items"][0].keys() == {"id", "validation_status", "postal_code"}
+        assert data["items"][0]["postal_code"] == AddressData.POSTAL_CODE_DEFAULT
+
+    async def test_get_address_with_fields_includes_requested_results(
+        self,
+        client: AsyncClient,
+        valid_address_payload: dict[str, Any],
+    ) -> None:
+        create_response = await client.post("/api/v1/addresses", json=valid_address_payload)
+        address_id = create_response.json()["id"]
+
+        response = await client.get(
+            f"/api/v1/addresses/{address_id}",
+            params={"fields": "city_locality,validation_results"},
+        )
+
+        assert response.status_code == StatusCodes.OK
+        assert response.json() == {
+            "id": address_id,
+            "city_locality": AddressData.CITY_DEFAULT,
+            "validation_results": [],
+        }
+
+    async def test_unknown_field_returns_400(self, client: AsyncClient) -> None:
+        response = await client.get("/api/v1/addresses", params={"fields": "id,secret"})
+
+        assert response.status_code == StatusCodes.BAD_REQUEST
+
     async def test_get_nonexistent_address_returns_404(self, client: AsyncClient) -> None:
         response = await client.get(f"/api/v1/addresses/{TestIds.FAKE_UUID}")
 
@@ -158,6 +216,267 @@ class TestAddressesAPI:
         assert response.status_code == StatusCodes.OK
         assert "message" in response.json()
 
+    async def test_create_with_return_answers_200_for_existing_twin(
+        self,
+        client: AsyncClient,
+        test_session: AsyncSession,
+        valid_address_payload: dict[str, Any],
+    ) -> None:
+        first = await client.post(
+            "/api/v1/addresses", params={"on_duplicate": "return"}, json=valid_address_payload
+        )
+        twin_id = first.json()["id"]
+        service = AddressService(AddressRepository(test_session))
+        await service.save_validation_result(UUID(twin_id), ValidationStatus.VERIFIED)
+        await test_session.commit()
+
+        second = await client.post(
+            "/api/v1/addresses", params={"on_duplicate": "return"}, json=valid_address_payload
+        )
+
+        assert first.status_code == StatusCodes.CREATED
+        assert second.status_code == StatusCodes.OK
+        assert second.json()["id"] == twin_id
+
+    async def test_create_with_link_reuses_validated_twin(
+        self,
+        client: AsyncClient,
+        test_session: AsyncSession,
+        valid_address_payload: dict[str, Any],
+    ) -> None:
+        create_response = await client.post("/api/v1/addresses", json=valid_address_payload)
+        twin_id = create_response.json()["id"]
+        service = AddressService(AddressRepository(test_session))
+        await service.save_validation_result(UUID(twin_id), ValidationStatus.VERIFIED)
+        await test_session.commit()
+
+        valid_address_payload["address_line1"] = valid_address_payload["address_line1"].upper()
+        response = await client.post(
+            "/api/v1/addresses",
+            params={"on_duplicate": "link"},
+            json=valid_address_payload,
+        )
+
+        assert response.status_code == StatusCodes.CREATED
+        data = response.json()
+        assert data["id"] != twin_id
+        assert data["validation_status"] == ValidationStatusValues.VERIFIED
+        assert len(data["validation_results"]) == 1
+
+    async def test_stats_counts_addresses_by_status_and_country(
+        self,
+        client: AsyncClient,
+        valid_address_payload: dict[str, Any],
+    ) -> None:
+        await client.post("/api/v1/addresses", json=valid_address_payload)
+        await client.post("/api/v1/addresses", json=valid_address_payload)
+
+        response = await client.get("/api/v1/addresses/stats")
+
+        assert response.status_code == StatusCodes.OK
+        data = response.json()
+        assert data["total"] == 2
+        assert data["by_status"] == {ValidationStatusValues.PENDING: 2}
+        assert data["by_country"] == {AddressData.COUNTRY_CODE_US: 2}
+
+    async def test_bulk_validate_resets_matching_addresses(
+        self,
+        app: FastAPI,
+        client: AsyncClient,
+        test_session: AsyncSession,
+        valid_address_payload: dict[str, Any],
+    ) -> None:
+        app.state.arq_pool = FakeRedis()
+        ids = []
+        for _ in range(2):
+            response = await client.post("/api/v1/addresses", json=valid_address_payload)
+            ids.append(response.json()["id"])
+        service = AddressService(AddressRepository(test_session))
+        await service.save_validation_result(UUID(ids[0]), ValidationStatus.WARNING)
+        await service.save_validation_result(UUID(ids[1]), ValidationStatus.VERIFIED)
+        await test_session.commit()
+
+        response = await client.post(
+            "/api/v1/addresses/validate",
+            json={"validation_status": ["warning"], "country_code": ["us"]},
+        )
+
+        assert response.status_code == StatusCodes.ACCEPTED
+        bulk = response.json()
+        assert bulk["total"] == 1
+        warning = (await client.get(f"/api/v1/addresses/{ids[0]}")).json()
+        verified = (await client.get(f"/api/v1/addresses/{ids[1]}")).json()
+        assert warning["validation_status"] == ValidationStatusValues.PENDING
+        assert verified["validation_status"] == ValidationStatusValues.VERIFIED
+
+        progress = await client.get(f"/api/v1/addresses/validate/{bulk['id']}")
+        assert progress.status_code == StatusCodes.OK
+        assert progress.json()["total"] == 1
+
+    async def test_bulk_validate_requires_a_filter(self, client: AsyncClient) -> None:
+        response = await client.post("/api/v1/addresses/validate", json={})
+
+        assert response.status_code == StatusCodes.UNPROCESSABLE
+
+    async def test_bulk_validate_without_redis_returns_503(self, client: AsyncClient) -> None:
+        response = await client.post(
+            "/api/v1/addresses/validate", json={"validation_status": ["warning"]}
+        )
+
+        assert response.status_code == StatusCodes.SERVICE_UNAVAILABLE
+
+    async def test_unknown_bulk_validation_returns_404(
+        self, app: FastAPI, client: AsyncClient
+    ) -> None:
+        app.state.arq_pool = FakeRedis()
+
+        response = await client.get(f"/api/v1/addresses/validate/{TestIds.FAKE_UUID}")
+
+        assert response.status_code == StatusCodes.NOT_FOUND
+
+    async def test_bulk_delete_by_filter_cascades_results(
+        self,
+        client: AsyncClient,
+        test_session: AsyncSession,
+        valid_address_payload: dict[str, Any],
+    ) -> None:
+        ids = []
+        for _ in range(3):
+            response = await client.post("/api/v1/addresses", json=valid_address_payload)
+            ids.append(response.json()["id"])
+        service = AddressService(AddressRepository(test_session))
+        await service.save_validation_result(UUID(ids[0]), ValidationStatus.ERROR)
+        await service.save_validation_result(UUID(ids[1]), ValidationStatus.ERROR)
+        await test_session.commit()
+
+        response = await client.post(
+            "/api/v1/addresses/delete", json={"validation_status": ["error"]}
+        )
+
+        assert response.status_code == StatusCodes.OK
+        assert response.json() == {"deleted": 2}
+        remaining = (await client.get("/api/v1/addresses")).json()
+        assert [a["id"] for a in remaining["items"]] == [ids[2]]
+        results = await test_session.execute(select(func.count()).select_from(ValidationResult))
+        assert results.scalar() == 0
+
+    async def test_bulk_delete_by_ids(
+        self,
+        client: AsyncClient,
+        valid_address_payload: dict[str, Any],
+    ) -> None:
+        ids = []
+        for _ in range(2):
+            response = await client.post("/api/v1/addresses", json=valid_address_payload)
+            ids.append(response.json()["id"])
+
+        response = await client.post(
+            "/api/v1/addresses/delete", json={"ids": [ids[0], TestIds.FAKE_UUID]}
+        )
+
+        assert response.json() == {"deleted": 1}
+        assert (await client.get(f"/api/v1/addresses/{ids[1]}")).status_code == StatusCodes.OK
+
+    async def test_bulk_delete_requires_ids_or_filter(self, client: AsyncClient) -> None:
+        response = await client.post("/api/v1/addresses/delete", json={})
+
+        assert response.status_code == StatusCodes.UNPROCESSABLE
+
+    async def test_slow_queries_are_attributed_to_the_route(
+        self,
+        app: FastAPI,
+        test_engine: AsyncEngine,
+        client: AsyncClient,
+        caplog: pytest.LogCaptureFixture,
+    ) -> None:
+        app.dependency_overrides.pop(get_db)
+        app.state.session_maker = create_session_maker(test_engine)
+        SlowQueryLog(test_engine, threshold=0).install()
+
+        with caplog.at_level(logging.WARNING, logger="src.db.slow_query"):
+            await client.get(f"/api/v1/addresses/{TestIds.FAKE_UUID}")
+
+        assert {r.slow_query["origin"] for r in caplog.records} == {
+            "GET /api/v1/addresses/{address_id}"
+        }
+
+    async def test_create_with_idempotency_key_replays_response(
+        self,
+        app: FastAPI,
+        client: AsyncClient,
+        valid_address_payload: dict[str, Any],
+    ) -> None:
+        app.state.arq_pool = FakeRedis()
+        headers = {"Idempotency-Key": "create-1"}
+
+        first = await client.post("/api/v1/addresses", json=valid_address_payload, headers=headers)
+        retry = await client.post("/api/v1/addresses", json=valid_address_payload, headers=headers)
+
+        assert first.status_code == retry.status_code == StatusCodes.CREATED
+        assert retry.json() == first.json()
+        assert retry.headers["Idempotent-Replayed"] == "true"
+        assert (await client.get("/api/v1/addresses")).json()["total"] == 1
+        app.state.arq_pool.enqueue_job.assert_called_once()
+
+    async def test_concurrent_duplicates_create_one_address(
+        self,
+        app: FastAPI,
+        client: AsyncClient,
+        valid_address_payload: dict[str, Any],
+    ) -> None:
+        app.state.arq_pool = FakeRedis()
+        headers = {"Idempotency-Key": "create-2"}
+
+        responses = await asyncio.gather(
+            *(
+                client.post("/api/v1/addresses", json=valid_address_payload, headers=headers)
+                for _ in range(3)
+            )
+        )
+
+        assert {r.json()["id"] for r in responses} == {responses[0].json()["id"]}
+        assert (await client.get("/api/v1/addresses")).json()["total"] == 1
+
+    async def test_idempotency_key_reused_with_other_body_returns_422(
+        self,
+        app: FastAPI,
+        client: AsyncClient,
+        valid_address_payload: dict[str, Any],
+    ) -> None:
+        app.state.arq_pool = FakeRedis()
+        headers = {"Idempotency-Key": "create-3"}
+        await client.post("/api/v1/addresses", json=valid_address_payload, headers=headers)
+
+        valid_address_payload["city_locality"] = AddressData.CITY_UPDATED
+        response = await client.post(
+            "/api/v1/addresses", json=valid_address_payload, headers=headers
+        )
+
+        assert response.status_code == StatusCodes.UNPROCESSABLE
+        assert response.json()["code"] == "IDEMPOTENCY_KEY_REUSED"
+
+    async def test_idempotency_key_reused_with_other_query_returns_422(
+        self,
+        app: FastAPI,
+        client: AsyncClient,
+        valid_address_payload: dict[str, Any],
+    ) -> None:
+        app.state.arq_pool = FakeRedis()
+        headers = {"Idempotency-Key": "create-4"}
+        await client.post("/api/v1/addresses", json=valid_address_payload, headers=headers)
+
+        response = await client.post(
+            "/api/v1/addresses?on_duplicate=link", json=valid_address_payload, headers=headers
+        )
+
+        assert response.status_code == StatusCodes.UNPROCESSABLE
+        assert response.json()["code"] == "IDEMPOTENCY_KEY_REUSED"
+
+    async def test_status_events_without_redis_returns_503(self, client: AsyncClient) -> None:
+        response = await client.get("/api/v1/addresses/events")
+
+        assert response.status_code == StatusCodes.SERVICE_UNAVAILABLE
+
 
 class TestHealthEndpoints:
     async def test_health_returns_ok(self, client: AsyncClient) -> None:
@@ -166,9 +485,27 @@ class TestHealthEndpoints:
         assert response.status_code == StatusCodes.OK
         assert response.json()["status"] == HealthStatus.OK
 
-    async def test_health_ready_returns_ok(self, client: AsyncClient) -> None:
+    async def test_health_ready_returns_ok(self, app: FastAPI, client: AsyncClient) -> None:
+        app.state.arq_pool = AsyncMock()
+
         response = await client.get("/api/v1/health/ready")
 
         assert response.status_code == StatusCodes.OK
         data = response.json()
         assert data["status"] == HealthStatus.OK
+        assert data["checks"]["database"]["latency_ms"] is not None
+        assert data["checks"]["redis"]["status"] == HealthStatus.OK
+
+    async def test_health_ready_without_redis_returns_503(self, client: AsyncClient) -> None:
+        response = await client.get("/api/v1/health/ready")
+
+        assert response.status_code == StatusCodes.SERVICE_UNAVAILABLE
+        data = response.json()
+        assert data["checks"]["database"]["status"] == HealthStatus.OK
+        assert data["checks"]["redis"]["error"] == "not initialized"
+
+    async def test_metrics_returns_prometheus_text(self, client: AsyncClient) -> None:
+        response = await client.get("/api/v1/metrics")
+
+        assert response.status_code == StatusCodes.OK
+        assert response.headers["content-type"].startswith("text/plain")
@@ -0,0 +1,77 @@
+from collections.abc import AsyncGenerator
+
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from src.config import get_settings
+from src.main import create_app
+from src.services.profiler import install_sql_capture
+from tests.constants import StatusCodes
+from tests.fakes.redis import FakeRedis
+
+
+@pytest.fixture
+async def profiled_client(
+    app: FastAPI, test_engine: AsyncEngine
+) -> AsyncGenerator[AsyncClient, None]:
+    settings = get_settings().model_copy(update={"profiling_enabled": True})
+    profiled = create_app(settings)
+    profiled.dependency_overrides = app.dependency_overrides
+    profiled.state.engine = test_engine
+    profiled.state.arq_pool = FakeRedis()
+    install_sql_capture(test_engine)
+    async with AsyncClient(transport=ASGITransport(app=profiled), base_url="http://test") as c:
+        yield c
+
+
+class TestProfilingAPI:
+    async def test_request_with_header_is_profiled_and_retrievable(
+        self, profiled_client: AsyncClient
+    ) -> None:
+        response = await profiled_client.get(
+            "/api/v1/addresses", headers={"X-Profile": "1", "X-Request-ID": "slow-list"}
+        )
+
+        profile_id = response.headers["X-Profile-Id"]
+        profile = (await profiled_client.get(f"/api/v1/profiles/{profile_id}")).json()
+        assert profile["path"] == "/api/v1/addresses"
+        assert profile["client_request_id"] == "slow-list"
+        assert any("FROM addresses" in q["statement"] for q in profile["queries"])
+        collapsed = await profiled_client.get(f"/api/v1/profiles/{profile_id}/collapsed")
+        assert collapsed.headers["content-type"].startswith("text/plain")
+
+    async def test_client_request_id_does_not_choose_the_profile_key(
+        self, profiled_client: AsyncClient
+    ) -> None:
+        headers = {"X-Profile": "1", "X-Request-ID": "shared"}
+
+        first = await profiled_client.get("/api/v1/addresses", headers=headers)
+        second = await profiled_client.get("/api/v1/addresses/validate/missing", headers=headers)
+
+        first_id, second_id = first.headers["X-Profile-Id"], second.headers["X-Profile-Id"]
+        assert len({first_id, second_id, "shared"}) == 3
+        profile = (await profiled_client.get(f"/api/v1/profiles/{first_id}")).json()
+        assert profile["path"] == "/api/v1/addresses"
+        missing = await profiled_client.get("/api/v1/profiles/shared")
+        assert missing.status_code == StatusCodes.NOT_FOUND
+
+    async def test_request_without_header_is_not_profiled(
+        self, profiled_client: AsyncClient
+    ) -> None:
+        response = await profiled_client.get("/api/v1/addresses")
+
+        assert "X-Profile-Id" not in response.headers
+
+    async def test_unknown_profile_returns_404(self, profiled_client: AsyncClient) -> None:
+        response = await profiled_client.get("/api/v1/profiles/missing")
+
+        assert response.status_code == StatusCodes.NOT_FOUND
+
+    async def test_profiling_is_off_by_default(self, client: AsyncClient, app: FastAPI) -> None:
+        app.state.arq_pool = FakeRedis()
+
+        response = await client.get("/api/v1/addresses", headers={"X-Profile": "1"})
+
+        assert "X-Profile-Id" not in response.headers
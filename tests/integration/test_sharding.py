@@ -0,0 +1,173 @@
+from collections.abc import AsyncGenerator
+from datetime import UTC, datetime, timedelta
+from uuid import UUID
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
+
+from src.core.enums import ValidationStatus
+from src.db.models.address import Address, ValidationResult
+from src.db.models.base import Base
+from src.db.session import create_session_maker
+from src.db.sharding import shard_for
+from src.repositories.address_repository import AddressRepository
+from src.schemas.address import BulkDeleteRequest
+from src.services.address_service import AddressService
+from src.services.address_stats import AddressStatsCounter
+from tests.factories.address_factory import AddressCreateFactory, create_test_address
+from tests.fakes.redis import FakeRedis
+
+SHARDS = 2
+ADDRESSES = 12
+
+
+@pytest.fixture
+async def shard_engines() -> AsyncGenerator[list[AsyncEngine], None]:
+    engines = [create_async_engine("sqlite+aiosqlite:///:memory:") for _ in range(SHARDS)]
+    for engine in engines:
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+    yield engines
+    for engine in engines:
+        await engine.dispose()
+
+
+@pytest.fixture
+async def session(shard_engines: list[AsyncEngine]) -> AsyncGenerator[AsyncSession, None]:
+    async with create_session_maker(*shard_engines)() as session:
+        yield session
+
+
+@pytest.fixture
+async def address_ids(session: AsyncSession) -> list[UUID]:
+    """Ids of addresses spread over both shards, newest first."""
+    now = datetime.now(UTC)
+    addresses = [
+        create_test_address(created_at=now - timedelta(minutes=i)) for i in range(ADDRESSES)
+    ]
+    session.add_all(addresses)
+    await session.commit()
+    return [address.id for address in addresses]
+
+
+async def _ids_on(engine: AsyncEngine, model: type[Address] | type[ValidationResult]) -> set[UUID]:
+    column = Address.id if model is Address else ValidationResult.address_id
+    async with engine.connect() as conn:
+        return set((await conn.execute(select(column))).scalars())
+
+
+class TestShardedStorage:
+    async def test_addresses_and_results_live_on_the_shard_of_their_id(
+        self, session: AsyncSession, shard_engines: list[AsyncEngine]
+    ) -> None:
+        service = AddressService(AddressRepository(session))
+        created = [(await service.create(AddressCreateFactory.build()))[0] for _ in range(6)]
+        for address in created:
+            await service.save_validation_result(address.id, ValidationStatus.VERIFIED)
+        await session.commit()
+
+        for shard, engine in enumerate(shard_engines):
+            expected = {a.id for a in created if shard_for(a.id, SHARDS) == str(shard)}
+            assert await _ids_on(engine, Address) == expected
+            assert await _ids_on(engine, ValidationResult) == expected
+
+    async def test_lookup_by_id_reads_its_shard(
+        self, session: AsyncSession, address_ids: list[UUID]
+    ) -> None:
+        repo = AddressRepository(session)
+
+        address = await repo.get_by_id_with_results(address_ids[0])
+
+        assert address is not None
+        assert address.id == address_ids[0]
+        assert {a.id for a in await repo.get_by_ids(address_ids)} == set(address_ids)
+
+    async def test_lock_existing_ids_skips_deleted_addresses(
+        self, session: AsyncSession, address_ids: list[UUID]
+    ) -> None:
+        repo = AddressRepository(session)
+        await AddressService(repo).delete(address_ids[0])
+
+        assert await repo.lock_existing_ids(address_ids) == set(address_ids[1:])
+
+    async def test_list_merges_shards_newest_first(
+        self, session: AsyncSession, address_ids: list[UUID]
+    ) -> None:
+        repo = AddressRepository(session)
+
+        pages = [await repo.get_all_with_results(limit=5, offset=offset) for offset in (0, 5, 10)]
+
+        assert [a.id for page in pages for a in page] == address_ids
+        assert await repo.count() == ADDRESSES
+
+    async def test_bulk_writes_go_to_each_address_shard(
+        self,
+        session: AsyncSession,
+        address_ids: list[UUID],
+        shard_engines: list[AsyncEngine],
+    ) -> None:
+        repo = AddressRepository(session)
+        validated_at = datetime.now(UTC)
+
+        await repo.add_validation_results(
+            [
+                {"address_id": address_id, "status": ValidationStatus.VERIFIED}
+                for address_id in address_ids
+            ]
+        )
+        await repo.set_validation_statuses(
+            dict.fromkeys(address_ids, (ValidationStatus.VERIFIED, validated_at))
+        )
+        await session.commit()
+
+        counts = await repo.count_by_status_and_country()
+        assert counts == [(ValidationStatus.VERIFIED, "US", ADDRESSES)]
+        assert set().union(*[await _ids_on(e, ValidationResult) for e in shard_engines]) == set(
+            address_ids
+        )
+
+    @pytest.mark.usefixtures("address_ids")
+    async def test_chunked_delete_reaches_every_shard(
+        self, session: AsyncSession, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr("src.services.address_service.BULK_DELETE_CHUNK_SIZE", 5)
+        service = AddressService(AddressRepository(session))
+
+        deleted = await service.delete_matching(BulkDeleteRequest(country_code=["US"]))
+
+        assert deleted == ADDRESSES
+        assert await AddressRepository(session).count() == 0
+
+    async def test_pending_keys_page_across_shards_oldest_first(
+        self, session: AsyncSession, address_ids: list[UUID]
+    ) -> None:
+        repo = AddressRepository(session)
+        cutoff = datetime.now(UTC)
+
+        keys: list[tuple[datetime, UUID]] = []
+        cursor = None
+        while page := await repo.get_pending_keys(cutoff, after=cursor, limit=5):
+            keys.extend(page)
+            cursor = page[-1]
+
+        assert [address_id for _since, address_id in keys] == address_ids[::-1]
+
+    async def test_database_stats_match_redis_counters(self, session: AsyncSession) -> None:
+        repo = AddressRepository(session)
+        counted = AddressService(repo, stats=AddressStatsCounter(FakeRedis()))  # type: ignore[arg-type]
+        for country_code in ("US", "us", "CA"):
+            await counted.create(AddressCreateFactory.build(country_code=country_code))
+        await session.commit()
+
+        from_redis = await counted.get_stats()
+        from_database = await AddressService(repo).get_stats()
+
+        assert (
+            from_database
+            == from_redis
+            == {
+                (ValidationStatus.PENDING, "US"): 2,
+                (ValidationStatus.PENDING, "CA"): 1,
+            }
+        )
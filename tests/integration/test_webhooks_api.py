@@ -0,0 +1,70 @@
+from typing import Any
+
+import pytest
+from httpx import AsyncClient
+
+from tests.constants import StatusCodes, TestIds
+
+
+class TestWebhooksAPI:
+    @pytest.fixture
+    def webhook_payload(self) -> dict[str, Any]:
+        return {
+            "client_id": "acme",
+            "url": "https://example.com/hooks/validation",
+            "secret": "s3cret",
+        }
+
+    async def test_register_webhook_returns_201(
+        self,
+        client: AsyncClient,
+        webhook_payload: dict[str, Any],
+    ) -> None:
+        response = await client.post("/api/v1/webhooks", json=webhook_payload)
+
+        assert response.status_code == StatusCodes.CREATED
+        data = response.json()
+        assert data["url"] == webhook_payload["url"]
+        assert data["is_active"] is True
+        assert "secret" not in data
+
+    async def test_register_webhook_with_invalid_url_returns_422(
+        self,
+        client: AsyncClient,
+        webhook_payload: dict[str, Any],
+    ) -> None:
+        webhook_payload["url"] = "not-a-url"
+
+        response = await client.post("/api/v1/webhooks", json=webhook_payload)
+
+        assert response.status_code == StatusCodes.UNPROCESSABLE
+
+    async def test_list_webhooks_filters_by_client(
+        self,
+        client: AsyncClient,
+        webhook_payload: dict[str, Any],
+    ) -> None:
+        await client.post("/api/v1/webhooks", json=webhook_payload)
+        await client.post("/api/v1/webhooks", json={**webhook_payload, "client_id": "other"})
+
+        response = await client.get("/api/v1/webhooks", params={"client_id": "acme"})
+
+        assert response.status_code == StatusCodes.OK
+        assert len(response.json()) == 1
+
+    async def test_delete_webhook_returns_204(
+        self,
+        client: AsyncClient,
+        webhook_payload: dict[str, Any],
+    ) -> None:
+        create_response = await client.post("/api/v1/webhooks", json=webhook_payload)
+        webhook_id = create_response.json()["id"]
+
+        response = await client.delete(f"/api/v1/webhooks/{webhook_id}")
+
+        assert response.status_code == StatusCodes.NO_CONTENT
+
+    async def test_delete_nonexistent_webhook_returns_404(self, client: AsyncClient) -> None:
+        response = await client.delete(f"/api/v1/webhooks/{TestIds.FAKE_UUID}")
+
+        assert response.status_code == StatusCodes.NOT_FOUND
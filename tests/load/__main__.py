@@ -0,0 +1,67 @@
+"""Load test: `python -m tests.load --duration 60 --concurrency 100 --output run.json`."""
+
+import argparse
+import asyncio
+import json
+import sys
+
+from tests.load.harness import OPERATIONS, LoadConfig, run_load_test
+
+
+def parse_mix(value: str) -> dict[str, float]:
+    mix: dict[str, float] = {}
+    for part in value.split(","):
+        op, _, weight = part.partition("=")
+        if op not in OPERATIONS:
+            raise argparse.ArgumentTypeError(f"unknown operation {op!r}")
+        mix[op] = float(weight)
+    return mix
+
+
+def main() -> None:
+    defaults = LoadConfig()
+    parser = argparse.ArgumentParser(prog="python -m tests.load", description=__doc__)
+    parser.add_argument("--duration", type=float, default=defaults.duration)
+    parser.add_argument("--concurrency", type=int, default=defaults.concurrency)
+    parser.add_argument(
+        "--mix",
+        type=parse_mix,
+        default=defaults.mix,
+        help="Weighted traffic mix, e.g. create=3,get=4,list=2,validate=1",
+    )
+    parser.add_argument("--seed-addresses", type=int, default=defaults.seed_addresses)
+    parser.add_argument(
+        "--upstream-latency",
+        type=float,
+        default=defaults.upstream_latency,
+        help="Seconds the stubbed ShipEngine call takes",
+    )
+    parser.add_argument("--worker-max-jobs", type=int, default=defaults.worker_max_jobs)
+    parser.add_argument("--drain-timeout", type=float, default=defaults.drain_timeout)
+    parser.add_argument(
+        "--base-url",
+        help="Target a running API instead of the in-process app; start the worker separately",
+    )
+    parser.add_argument("--output", help="Write the JSON report here instead of stdout")
+    args = parser.parse_args()
+
+    config = LoadConfig(
+        duration=args.duration,
+        concurrency=args.concurrency,
+        mix=args.mix,
+        seed_addresses=args.seed_addresses,
+        upstream_latency=args.upstream_latency,
+        worker_max_jobs=args.worker_max_jobs,
+        drain_timeout=args.drain_timeout,
+        base_url=args.base_url,
+    )
+    report = json.dumps(asyncio.run(run_load_test(config)), indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(report + "\n")
+    else:
+        sys.stdout.write(report + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,264 @@
+import asyncio
+import contextlib
+import math
+import random
+import time
+from collections import Counter, defaultdict
+from collections.abc import AsyncIterator
+from dataclasses import asdict, dataclass, field
+from functools import partial
+from typing import Any
+from unittest.mock import patch
+
+from arq.worker import Worker
+from httpx import ASGITransport, AsyncClient, HTTPError
+from redis.asyncio import Redis
+from redis.asyncio.client import PubSub
+
+from src.config import get_settings
+from src.core.enums import ValidationStatus
+from src.main import create_app
+from src.services.shipengine_client import ShipEngineClient
+from src.services.status_stream import STATUS_CHANNEL, StatusEvent
+from src.workers import settings as worker_settings
+from src.workers import tasks
+from src.workers.settings import WorkerSettings
+from tests.constants import AddressData
+
+ADDRESSES_URL = "/api/v1/addresses"
+OPERATIONS = ("create", "get", "list", "validate")
+LIST_PAGES = 10
+LIST_PAGE_SIZE = 20
+
+
+@dataclass
+class LoadConfig:
+    duration: float = 30.0
+    concurrency: int = 50
+    mix: dict[str, float] = field(
+        default_factory=lambda: {"create": 0.3, "get": 0.4, "list": 0.2, "validate": 0.1}
+    )
+    seed_addresses: int = 50
+    upstream_latency: float = 0.05
+    worker_max_jobs: int = WorkerSettings.max_jobs
+    drain_timeout: float = 60.0
+    base_url: str | None = None
+
+
+@dataclass
+class Recorder:
+    latencies: defaultdict[str, list[float]] = field(default_factory=lambda: defaultdict(list))
+    errors: Counter[str] = field(default_factory=Counter)
+    address_ids: list[str] = field(default_factory=list)
+    pending: dict[str, float] = field(default_factory=dict)
+    completions: list[float] = field(default_factory=list)
+
+    def start_validation(self, address_id: str, started_at: float) -> None:
+        # Keep the earliest start: a re-validate of a still-pending row completes with it.
+        self.pending.setdefault(address_id, started_at)
+
+    def finish_validation(self, event: StatusEvent) -> None:
+        if event.validation_status == ValidationStatus.PENDING:
+            return
+        started_at = self.pending.pop(event.address_id, None)
+        if started_at is not None:
+            self.completions.append(time.monotonic() - started_at)
+
+
+def percentile(samples: list[float], q: float) -> float:
+    """Nearest-rank percentile of an already sorted sample."""
+    if not samples:
+        return 0.0
+    rank = max(math.ceil(q / 100 * len(samples)), 1)
+    return samples[rank - 1]
+
+
+def summarize(samples: list[float]) -> dict[str, float | int]:
+    """Latency summary in milliseconds."""
+    ordered = sorted(samples)
+    return {
+        "count": len(ordered),
+        "mean_ms": round(1000 * sum(ordered) / len(ordered), 3) if ordered else 0.0,
+        "p50_ms": round(1000 * percentile(ordered, 50), 3),
+        "p95_ms": round(1000 * percentile(ordered, 95), 3),
+        "p99_ms": round(1000 * percentile(ordered, 99), 3),
+        "max_ms": round(1000 * ordered[-1], 3) if ordered else 0.0,
+    }
+
+
+def build_report(config: LoadConfig, recorder: Recorder, elapsed: float) -> dict[str, Any]:
+    requests = sum(len(samples) for samples in recorder.latencies.values())
+    return {
+        "config": asdict(config),
+        "elapsed_seconds": round(elapsed, 3),
+        "requests": requests,
+        "errors": sum(recorder.errors.values()),
+        "rps": round(requests / elapsed, 2) if elapsed else 0.0,
+        "operations": {
+            op: {**summarize(recorder.latencies[op]), "errors": recorder.errors[op]}
+            for op in OPERATIONS
+            if op in recorder.latencies or op in recorder.errors
+        },
+        "validation": {
+            **summarize(recorder.completions),
+            "outstanding": len(recorder.pending),
+        },
+    }
+
+
+def address_payload() -> dict[str, Any]:
+    return {
+        "name": AddressData.NAME_DEFAULT,
+        "address_line1": f"{random.randint(1, 99999)} Main Street",
+        "city_locality": AddressData.CITY_DEFAULT,
+        "state_province": AddressData.STATE_DEFAULT,
+        "postal_code": AddressData.POSTAL_CODE_DEFAULT,
+        "country_code": AddressData.COUNTRY_CODE_US,
+    }
+
+
+class LoadGenerator:
+    """Closed-loop traffic: `concurrency` clients each issue the next request on completion.
+
+    Validation completion is measured from the create/validate request until the worker's
+    status event arrives on the `address-status` channel, so it includes queue wait.
+    """
+
+    def __init__(self, config: LoadConfig, http: AsyncClient, recorder: Recorder) -> None:
+        self._config = config
+        self._http = http
+        self._recorder = recorder
+        self._operations = list(config.mix)
+        self._weights = [config.mix[op] for op in self._operations]
+
+    async def seed(self) -> None:
+        for _ in range(self._config.seed_addresses):
+            response = await self._http.post(ADDRESSES_URL, json=address_payload())
+            response.raise_for_status()
+            self._recorder.address_ids.append(response.json()["id"])
+
+    async def run(self) -> float:
+        deadline = time.monotonic() + self._config.duration
+        started_at = time.monotonic()
+        await asyncio.gather(*(self._client(deadline) for _ in range(self._config.concurrency)))
+        return time.monotonic() - started_at
+
+    async def drain(self) -> None:
+        deadline = time.monotonic() + self._config.drain_timeout
+        while self._recorder.pending and time.monotonic() < deadline:
+            await asyncio.sleep(0.1)
+
+    async def _client(self, deadline: float) -> None:
+        while time.monotonic() < deadline:
+            op = random.choices(self._operations, self._weights)[0]
+            started_at = time.monotonic()
+            try:
+                ok = await self._request(op, started_at)
+            except HTTPError:
+                ok = False
+            self._recorder.latencies[op].append(time.monotonic() - started_at)
+            if not ok:
+                self._recorder.errors[op] += 1
+
+    async def _request(self, op: str, started_at: float) -> bool:
+        ids = self._recorder.address_ids
+        if op == "create" or not ids:
+            response = await self._http.post(ADDRESSES_URL, json=address_payload())
+            if response.status_code == 201:
+                address_id = response.json()["id"]
+                ids.append(address_id)
+                self._recorder.start_validation(address_id, started_at)
+        elif op == "get":
+            response = await self._http.get(f"{ADDRESSES_URL}/{random.choice(ids)}")
+        elif op == "list":
+            offset = random.randrange(LIST_PAGES) * LIST_PAGE_SIZE
+            response = await self._http.get(
+                ADDRESSES_URL, params={"limit": LIST_PAGE_SIZE, "offset": offset}
+            )
+        else:
+            address_id = random.choice(ids)
+            response = await self._http.post(f"{ADDRESSES_URL}/{address_id}/validate")
+            if response.is_success:
+                self._recorder.start_validation(address_id, started_at)
+        return response.is_success
+
+
+async def _collect_completions(pubsub: PubSub, recorder: Recorder) -> None:
+    async for message in pubsub.listen():
+        recorder.finish_validation(StatusEvent.from_json(message["data"]))
+
+
+@contextlib.asynccontextmanager
+async def _in_process_stack(config: LoadConfig) -> AsyncIterator[AsyncClient]:
+    """Run the ASGI app and an ARQ worker in this process with a stubbed upstream.
+
+    The worker gets the production hooks, so jobs run with the breaker, result buffer and
+    timing, and the webhook dispatcher drains `webhooks:events`. Cron jobs are left out.
+    """
+    worker = Worker(
+        functions=WorkerSettings.functions,
+        on_startup=WorkerSettings.on_startup,
+        on_shutdown=WorkerSettings.on_shutdown,
+        on_job_start=WorkerSettings.on_job_start,
+        after_job_end=WorkerSettings.after_job_end,
+        redis_settings=WorkerSettings.redis_settings,
+        max_jobs=config.worker_max_jobs,
+        job_timeout=WorkerSettings.job_timeout,
+        max_tries=WorkerSettings.max_tries,
+        keep_result=WorkerSettings.keep_result,
+        job_serializer=WorkerSettings.job_serializer,
+        job_deserializer=WorkerSettings.job_deserializer,
+        handle_signals=False,
+    )
+    stub_client = partial(ShipEngineClient, latency=config.upstream_latency)
+    app = create_app()
+
+    with (
+        patch.object(tasks, "ShipEngineClient", stub_client),
+        # A worker already running on this machine may hold the metrics port.
+        patch.object(worker_settings.settings, "worker_metrics_port", None),
+    ):
+        async with app.router.lifespan_context(app):
+            worker_task = asyncio.create_task(worker.async_run())
+            try:
+                async with AsyncClient(
+                    transport=ASGITransport(app=app), base_url="http://loadtest"
+                ) as http:
+                    yield http
+            finally:
+                await worker.close()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await worker_task
+
+
+@contextlib.asynccontextmanager
+async def _stack(config: LoadConfig) -> AsyncIterator[AsyncClient]:
+    if config.base_url:
+        async with AsyncClient(base_url=config.base_url, timeout=30.0) as http:
+            yield http
+    else:
+        async with _in_process_stack(config) as http:
+            yield http
+
+
+async def run_load_test(config: LoadConfig) -> dict[str, Any]:
+    recorder = Recorder()
+    redis = Redis.from_url(get_settings().redis_url)
+    pubsub = redis.pubsub(ignore_subscribe_messages=True)
+    # Subscribe before any traffic so no completion event is missed.
+    await pubsub.subscribe(STATUS_CHANNEL)
+    collector = asyncio.create_task(_collect_completions(pubsub, recorder))
+    try:
+        async with _stack(config) as http:
+            generator = LoadGenerator(config, http, recorder)
+            await generator.seed()
+            elapsed = await generator.run()
+            await generator.drain()
+    finally:
+        collector.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await collector
+        await pubsub.aclose()
+        await redis.aclose()
+
+    return build_report(config, recorder, elapsed)
@@ -0,0 +1,95 @@
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from src.core.enums import ValidationStatus
+from src.services.address_rules import AddressRules, get_address_rules
+from src.services.shipengine_client import ShipEngineClient
+from tests.factories.address_factory import create_test_address
+
+
+class TestAddressRules:
+    @pytest.fixture
+    def rules(self) -> AddressRules:
+        return get_address_rules()
+
+    def test_valid_us_address_passes(self, rules: AddressRules) -> None:
+        assert rules.check(create_test_address()) == []
+
+    @pytest.mark.parametrize("postal_code", ["78701", "78701-1234", "787011234"])
+    def test_us_zip_formats_pass(self, rules: AddressRules, postal_code: str) -> None:
+        assert rules.check(create_test_address(postal_code=postal_code)) == []
+
+    @pytest.mark.parametrize("postal_code", ["7870A", "787", "78701-12"])
+    def test_malformed_us_zip_is_rejected(self, rules: AddressRules, postal_code: str) -> None:
+        errors = rules.check(create_test_address(postal_code=postal_code))
+
+        assert [e["code"] for e in errors] == ["invalid_postal_code_format"]
+
+    @pytest.mark.parametrize("state", ["TX", "tx", "Texas", " new  york "])
+    def test_us_state_accepts_code_or_name(self, rules: AddressRules, state: str) -> None:
+        assert rules.check(create_test_address(state_province=state)) == []
+
+    def test_unknown_us_state_is_rejected(self, rules: AddressRules) -> None:
+        errors = rules.check(create_test_address(state_province="ZZ"))
+
+        assert [e["code"] for e in errors] == ["invalid_state_province"]
+
+    def test_missing_us_state_is_rejected(self, rules: AddressRules) -> None:
+        errors = rules.check(create_test_address(state_province=""))
+
+        assert [e["code"] for e in errors] == ["state_province_required"]
+
+    @pytest.mark.parametrize("postal_code", ["SW1A 1AA", "sw1a1aa", "M1 1AE", "GIR 0AA"])
+    def test_uk_postcodes_pass(self, rules: AddressRules, postal_code: str) -> None:
+        address = create_test_address(country_code="GB", state_province="", postal_code=postal_code)
+
+        assert rules.check(address) == []
+
+    @pytest.mark.parametrize("postal_code", ["SW1A 1A", "SW1A 1AAA", "12345"])
+    def test_wrong_length_uk_postcode_is_rejected(
+        self, rules: AddressRules, postal_code: str
+    ) -> None:
+        address = create_test_address(country_code="GB", state_province="", postal_code=postal_code)
+
+        errors = rules.check(address)
+
+        assert [e["code"] for e in errors] == ["invalid_postal_code_format"]
+
+    def test_country_without_rules_is_not_checked(self, rules: AddressRules) -> None:
+        address = create_test_address(country_code="NZ", state_province="??", postal_code="ABC")
+
+        assert rules.check(address) == []
+
+    def test_rules_are_loaded_once(self) -> None:
+        assert get_address_rules() is get_address_rules()
+
+
+class TestShipEngineClientLocalRules:
+    async def test_implausible_address_is_rejected_without_upstream_call(self) -> None:
+        client = ShipEngineClient()
+        address = create_test_address(postal_code="ABCDE")
+
+        with patch.object(client, "_call_upstream", AsyncMock()) as upstream:
+            result = await client.validate_address(address)
+
+        assert result.status == ValidationStatus.ERROR
+        assert result.messages is not None
+        assert result.messages[0]["code"] == "invalid_postal_code_format"
+        upstream.assert_not_awaited()
+
+    async def test_local_rejection_does_not_touch_breaker(self) -> None:
+        breaker = AsyncMock()
+        client = ShipEngineClient(breaker=breaker)
+
+        result = await client.validate_address(create_test_address(state_province="ZZ"))
+
+        assert result.status == ValidationStatus.ERROR
+        breaker.call.assert_not_awaited()
+
+    async def test_plausible_address_reaches_upstream(self) -> None:
+        client = ShipEngineClient(latency=0)
+
+        result = await client.validate_address(create_test_address())
+
+        assert result.status == ValidationStatus.VERIFIED
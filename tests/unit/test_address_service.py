@@ -1,14 +1,32 @@
 import uuid
+from collections import Counter
+from datetime import UTC, datetime
 from unittest.mock import AsyncMock
 
 import pytest
 
-from src.core.enums import ValidationStatus
-from src.core.exceptions import AddressNotFoundError
-from src.schemas.address import AddressCreate, AddressUpdate
-from src.services.address_service import AddressService
+from src.core.enums import DuplicatePolicy, ValidationStatus
+from src.core.exceptions import (
+    AddressNotFoundError,
+    BulkValidationNotFoundError,
+    ServiceUnavailableError,
+)
+from src.db.models.address import ValidationResult
+from src.schemas.address import (
+    AddressCreate,
+    AddressUpdate,
+    BulkDeleteRequest,
+    BulkValidationRequest,
+)
+from src.services.address_service import (
+    BULK_DELETE_CHUNK_SIZE,
+    BULK_VALIDATION_CHUNK_SIZE,
+    AddressService,
+)
+from src.services.bulk_validation import BulkValidationTracker
 from tests.constants import AddressData, TaskNames
-from tests.factories.address_factory import create_test_address
+from tests.factories.address_factory import AddressCreateFactory, create_test_address
+from tests.fakes.redis import FakeRedis
 
 
 class TestAddressService:
@@ -44,15 +62,85 @@ class TestAddressService:
         mock_repo.create.return_value = mock_address
         mock_repo.get_by_id_with_results.return_value = mock_address
 
-        result = await service.create(data)
+        result, created = await service.create(data)
 
         assert result == mock_address
+        assert created
         mock_repo.create.assert_called_once()
         mock_arq.enqueue_job.assert_called_once_with(
             TaskNames.VALIDATE_ADDRESS,
             str(mock_address.id),
         )
 
+    async def test_create_returns_existing_validated_twin(
+        self,
+        service: AddressService,
+        mock_repo: AsyncMock,
+        mock_arq: AsyncMock,
+    ) -> None:
+        twin = create_test_address(validation_status=ValidationStatus.VERIFIED)
+        mock_repo.get_validated_by_fingerprint.return_value = twin
+
+        result, created = await service.create(
+            AddressCreateFactory.build(),
+            duplicate_policy=DuplicatePolicy.RETURN_EXISTING,
+        )
+
+        assert result == twin
+        assert not created
+        mock_repo.create.assert_not_called()
+        mock_arq.enqueue_job.assert_not_called()
+
+    async def test_create_links_validated_twin_without_enqueueing(
+        self,
+        service: AddressService,
+        mock_repo: AsyncMock,
+        mock_arq: AsyncMock,
+    ) -> None:
+        twin = create_test_address(
+            validation_status=ValidationStatus.VERIFIED,
+            validated_at=datetime.now(UTC),
+        )
+        twin.validation_results = [
+            ValidationResult(
+                status=ValidationStatus.VERIFIED,
+                matched_address={"address_line1": "123 MAIN ST", "name": "Someone Else"},
+                messages=None,
+            )
+        ]
+        mock_repo.get_validated_by_fingerprint.return_value = twin
+        mock_repo.create.side_effect = lambda address: address
+
+        await service.create(AddressCreateFactory.build(), duplicate_policy=DuplicatePolicy.LINK)
+
+        created = mock_repo.create.call_args.args[0]
+        assert created.validation_status == ValidationStatus.VERIFIED
+        assert created.validated_at == twin.validated_at
+        copied = mock_repo.add_validation_result.call_args.args[0]
+        assert copied.address_id == created.id
+        assert copied.matched_address["name"] == AddressData.NAME_DEFAULT
+        mock_arq.enqueue_job.assert_not_called()
+
+    async def test_create_without_twin_enqueues_validation(
+        self,
+        service: AddressService,
+        mock_repo: AsyncMock,
+        mock_arq: AsyncMock,
+    ) -> None:
+        mock_address = create_test_address()
+        mock_repo.get_validated_by_fingerprint.return_value = None
+        mock_repo.create.return_value = mock_address
+
+        await service.create(AddressCreateFactory.build(), duplicate_policy=DuplicatePolicy.LINK)
+
+        created = mock_repo.create.call_args.args[0]
+        assert created.validation_status == ValidationStatus.PENDING
+        assert created.fingerprint is not None
+        mock_arq.enqueue_job.assert_called_once_with(
+            TaskNames.VALIDATE_ADDRESS,
+            str(mock_address.id),
+        )
+
     async def test_get_by_id_returns_address(
         self,
         service: AddressService,
@@ -65,7 +153,7 @@ class TestAddressService:
         result = await service.get_by_id(address_id)
 
         assert result == mock_address
-        mock_repo.get_by_id_with_results.assert_called_once_with(address_id)
+        mock_repo.get_by_id_with_results.assert_called_once_with(address_id, fields=None)
 
     async def test_get_by_id_raises_not_found(
         self,
@@ -124,3 +212,140 @@ class TestAddressService:
 
         with pytest.raises(AddressNotFoundError):
             await service.delete(address_id)
+
+    async def test_update_moves_address_between_stats_groups(
+        self,
+        mock_repo: AsyncMock,
+        mock_arq: AsyncMock,
+    ) -> None:
+        mock_stats = AsyncMock()
+        service = AddressService(mock_repo, mock_arq, mock_stats)
+        mock_address = create_test_address(validation_status=ValidationStatus.VERIFIED)
+        mock_repo.get_by_id.return_value = mock_address
+        mock_repo.update.return_value = mock_address
+
+        await service.update(mock_address.id, AddressUpdate(city_locality=AddressData.CITY_UPDATED))
+
+        country_code = mock_address.country_code
+        mock_stats.apply.assert_called_once_with(
+            Counter(
+                {
+                    (ValidationStatus.VERIFIED, country_code): -1,
+                    (ValidationStatus.PENDING, country_code): 1,
+                }
+            )
+        )
+
+    async def test_get_stats_falls_back_to_database_without_redis(
+        self,
+        service: AddressService,
+        mock_repo: AsyncMock,
+    ) -> None:
+        mock_repo.count_by_status_and_country.return_value = [
+            (ValidationStatus.VERIFIED.value, AddressData.COUNTRY_CODE_US, 4)
+        ]
+
+        result = await service.get_stats()
+
+        assert result == {(ValidationStatus.VERIFIED, AddressData.COUNTRY_CODE_US): 4}
+
+    async def test_validate_matching_resets_and_enqueues_in_chunks(
+        self,
+        mock_repo: AsyncMock,
+    ) -> None:
+        redis = FakeRedis()
+        mock_stats = AsyncMock()
+        service = AddressService(mock_repo, redis, mock_stats, BulkValidationTracker(redis))  # type: ignore[arg-type]
+        us = AddressData.COUNTRY_CODE_US
+        rows = [
+            (uuid.uuid4(), ValidationStatus.WARNING.value, us)
+            for _ in range(BULK_VALIDATION_CHUNK_SIZE + 1)
+        ]
+        mock_repo.reset_validation.return_value = rows
+
+        progress = await service.validate_matching(
+            BulkValidationRequest(validation_status=[ValidationStatus.WARNING], country_code=["us"])
+        )
+
+        mock_repo.reset_validation.assert_called_once_with(
+            statuses=[ValidationStatus.WARNING], country_codes=[us], validated_before=None
+        )
+        assert progress.total == len(rows)
+        batches = [c.args for c in redis.enqueue_job.call_args_list]
+        assert [(name, bulk_id) for name, bulk_id, _ids in batches] == [
+            (TaskNames.ENQUEUE_VALIDATION_BATCH, str(progress.id))
+        ] * 2
+        assert [len(ids) for _name, _bulk_id, ids in batches] == [BULK_VALIDATION_CHUNK_SIZE, 1]
+        mock_stats.apply.assert_called_once_with(
+            Counter(
+                {
+                    (ValidationStatus.WARNING, us): -len(rows),
+                    (ValidationStatus.PENDING, us): len(rows),
+                }
+            )
+        )
+
+    async def test_validate_matching_queues_nothing_if_commit_fails(
+        self,
+        mock_repo: AsyncMock,
+    ) -> None:
+        redis = FakeRedis()
+        mock_stats = AsyncMock()
+        service = AddressService(mock_repo, redis, mock_stats, BulkValidationTracker(redis))  # type: ignore[arg-type]
+        mock_repo.reset_validation.return_value = [
+            (uuid.uuid4(), ValidationStatus.WARNING.value, AddressData.COUNTRY_CODE_US)
+        ]
+        mock_repo.commit.side_effect = ConnectionError("connection lost")
+
+        with pytest.raises(ConnectionError):
+            await service.validate_matching(BulkValidationRequest(country_code=["US"]))
+
+        redis.enqueue_job.assert_not_called()
+        mock_stats.apply.assert_not_called()
+
+    async def test_validate_matching_requires_task_queue(
+        self,
+        mock_repo: AsyncMock,
+    ) -> None:
+        service = AddressService(mock_repo)
+
+        with pytest.raises(ServiceUnavailableError):
+            await service.validate_matching(BulkValidationRequest(country_code=["US"]))
+
+        mock_repo.reset_validation.assert_not_called()
+
+    async def test_get_bulk_validation_raises_not_found(
+        self,
+        mock_repo: AsyncMock,
+    ) -> None:
+        redis = FakeRedis()
+        service = AddressService(mock_repo, redis, bulk=BulkValidationTracker(redis))  # type: ignore[arg-type]
+
+        with pytest.raises(BulkValidationNotFoundError):
+            await service.get_bulk_validation(uuid.uuid4())
+
+    async def test_delete_matching_commits_each_chunk(
+        self,
+        mock_repo: AsyncMock,
+        mock_arq: AsyncMock,
+    ) -> None:
+        mock_stats = AsyncMock()
+        service = AddressService(mock_repo, mock_arq, mock_stats)
+        us = AddressData.COUNTRY_CODE_US
+        first = sorted(uuid.uuid4() for _ in range(2))
+        second = [uuid.uuid4()]
+        mock_repo.delete_chunk.side_effect = [
+            [(address_id, ValidationStatus.ERROR.value, us) for address_id in first],
+            [(address_id, ValidationStatus.VERIFIED.value, us) for address_id in second],
+            [],
+        ]
+
+        deleted = await service.delete_matching(BulkDeleteRequest(country_code=["us"]))
+
+        assert deleted == 3
+        assert mock_repo.commit.await_count == 2
+        calls = mock_repo.delete_chunk.call_args_list
+        assert [c.kwargs["after"] for c in calls] == [None, first[-1], second[0]]
+        assert all(c.kwargs["limit"] == BULK_DELETE_CHUNK_SIZE for c in calls)
+        assert calls[0].kwargs["country_codes"] == [us]
+        mock_stats.apply.assert_any_call(Counter({(ValidationStatus.ERROR, us): -2}))
@@ -0,0 +1,40 @@
+from collections import Counter
+
+from src.core.enums import ValidationStatus
+from src.services.address_stats import ADDRESS_STATS_KEY, AddressStatsCounter
+from tests.constants import AddressData
+from tests.fakes.redis import FakeRedis
+
+US = AddressData.COUNTRY_CODE_US
+
+
+class TestAddressStatsCounter:
+    async def test_apply_accumulates_deltas(self) -> None:
+        stats = AddressStatsCounter(FakeRedis())  # type: ignore[arg-type]
+
+        await stats.apply(Counter({(ValidationStatus.PENDING, US): 2}))
+        await stats.apply(
+            Counter({(ValidationStatus.PENDING, US): -1, (ValidationStatus.VERIFIED, US): 1})
+        )
+
+        assert await stats.read() == {
+            (ValidationStatus.PENDING, US): 1,
+            (ValidationStatus.VERIFIED, US): 1,
+        }
+
+    async def test_read_omits_groups_that_reached_zero(self) -> None:
+        stats = AddressStatsCounter(FakeRedis())  # type: ignore[arg-type]
+
+        await stats.apply(Counter({(ValidationStatus.PENDING, US): 1}))
+        await stats.apply(Counter({(ValidationStatus.PENDING, US): -1}))
+
+        assert await stats.read() == {}
+
+    async def test_replace_discards_drifted_counts(self) -> None:
+        redis = FakeRedis()
+        stats = AddressStatsCounter(redis)  # type: ignore[arg-type]
+        await stats.apply(Counter({(ValidationStatus.ERROR, US): 7}))
+
+        await stats.replace([((ValidationStatus.VERIFIED, "us"), 3)])
+
+        assert redis.hashes[ADDRESS_STATS_KEY] == {b"verified:US": b"3"}
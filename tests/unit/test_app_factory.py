@@ -0,0 +1,72 @@
+import asyncio
+import subprocess
+import sys
+from unittest.mock import AsyncMock, patch
+
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from src.config import Settings
+from src.main import create_app, lifespan
+
+IMPORT_CHECK = """
+import sys
+import src.main
+from src.config import get_settings
+assert get_settings.cache_info().currsize == 0, "Settings built at import"
+assert "asyncpg" not in sys.modules, "database driver loaded at import"
+"""
+
+
+class TestCreateApp:
+    def test_uses_injected_settings(self) -> None:
+        settings = Settings(debug=False)
+
+        app = create_app(settings)
+
+        assert app.state.settings is settings
+        assert app.docs_url is None
+
+    def test_defers_connections_to_lifespan(self) -> None:
+        app = create_app(Settings())
+
+        assert app.state.engine is None
+        assert app.state.session_maker is None
+        assert app.state.arq_pool is None
+
+    def test_importing_main_has_no_side_effects(self) -> None:
+        result = subprocess.run(
+            [sys.executable, "-c", IMPORT_CHECK], capture_output=True, text=True
+        )
+
+        assert result.returncode == 0, result.stderr
+
+
+class TestLifespan:
+    async def test_retries_redis_that_was_down_at_startup(self) -> None:
+        app = create_app(Settings(redis_reconnect_seconds=0.01))
+        pool = AsyncMock()
+
+        with (
+            patch("src.main.create_engines", return_value=[AsyncMock()]),
+            patch("src.main.create_session_maker"),
+            patch("src.main.prewarm"),
+            patch("src.main.StatusBroadcaster", return_value=AsyncMock()) as broadcaster_class,
+            patch(
+                "src.main.create_pool",
+                side_effect=[
+                    RedisConnectionError("refused"),
+                    RedisConnectionError("refused"),
+                    pool,
+                ],
+            ),
+        ):
+            async with lifespan(app):
+                assert app.state.arq_pool is None
+                async with asyncio.timeout(1):
+                    while app.state.arq_pool is None:
+                        await asyncio.sleep(0.01)
+
+                assert app.state.arq_pool is pool
+                broadcaster_class.assert_called_once_with(pool)
+
+        pool.aclose.assert_awaited_once()
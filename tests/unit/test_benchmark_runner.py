@@ -0,0 +1,46 @@
+from pathlib import Path
+
+import pytest
+
+from tests.benchmarks.__main__ import main
+from tests.benchmarks.runner import compare, load_baseline, measure, save_baseline
+
+
+class TestCompare:
+    def test_flags_only_regressions_beyond_tolerance(self) -> None:
+        baseline = {"fast": 100.0, "slow": 100.0, "faster": 100.0}
+        results = {"fast": 120.0, "slow": 130.0, "faster": 50.0, "new": 1e9}
+
+        regressions = compare(results, baseline, tolerance=0.25)
+
+        assert [r.name for r in regressions] == ["slow"]
+        assert regressions[0].ratio == 1.3
+
+
+class TestBaseline:
+    def test_round_trip(self, tmp_path: Path) -> None:
+        path = tmp_path / "baseline.json"
+
+        save_baseline(path, {"client.normalize_street": 1234.56})
+
+        assert load_baseline(path) == {"client.normalize_street": 1234.6}
+
+
+class TestMain:
+    def test_compare_without_baseline_asks_for_save(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        missing = tmp_path / "baseline.json"
+        monkeypatch.setattr("sys.argv", ["benchmarks", "--compare", "--baseline", str(missing)])
+
+        assert main() == 2
+        assert "--save" in capsys.readouterr().err
+
+
+class TestMeasure:
+    async def test_measures_sync_and_async_callables(self) -> None:
+        async def noop() -> None:
+            return None
+
+        assert await measure(lambda: None, min_time=0.001, repeats=2) > 0
+        assert await measure(noop, min_time=0.001, repeats=2) > 0
@@ -0,0 +1,52 @@
+import uuid
+
+from src.core.enums import ValidationStatus
+from src.services.bulk_validation import (
+    BULK_VALIDATION_KEY,
+    BULK_VALIDATION_TTL,
+    BulkValidationTracker,
+)
+from tests.fakes.redis import FakeRedis
+
+
+class TestBulkValidationTracker:
+    async def test_start_records_total_with_expiry(self) -> None:
+        redis = FakeRedis()
+        tracker = BulkValidationTracker(redis)  # type: ignore[arg-type]
+        bulk_id = uuid.uuid4()
+
+        progress = await tracker.start(bulk_id, total=3)
+
+        assert progress.total == 3
+        assert redis.ttls[BULK_VALIDATION_KEY.format(bulk_id)] == BULK_VALIDATION_TTL
+
+    async def test_get_reports_counters(self) -> None:
+        tracker = BulkValidationTracker(FakeRedis())  # type: ignore[arg-type]
+        bulk_id = uuid.uuid4()
+        await tracker.start(bulk_id, total=3)
+
+        await tracker.record_enqueued(bulk_id, 3)
+        await tracker.record_result(bulk_id, ValidationStatus.VERIFIED)
+        await tracker.record_result(bulk_id, ValidationStatus.VERIFIED)
+        await tracker.record_result(bulk_id, ValidationStatus.ERROR)
+        progress = await tracker.get(bulk_id)
+
+        assert progress is not None
+        assert (progress.total, progress.enqueued, progress.completed) == (3, 3, 3)
+        assert progress.by_status == {ValidationStatus.VERIFIED: 2, ValidationStatus.ERROR: 1}
+
+    async def test_update_after_expiry_sets_expiry_again(self) -> None:
+        redis = FakeRedis()
+        tracker = BulkValidationTracker(redis)  # type: ignore[arg-type]
+        bulk_id = uuid.uuid4()
+
+        # The hash expired before this bulk's last jobs finished.
+        await tracker.record_enqueued(bulk_id, 1)
+        await tracker.record_result(bulk_id, ValidationStatus.VERIFIED)
+
+        assert redis.ttls[BULK_VALIDATION_KEY.format(bulk_id)] == BULK_VALIDATION_TTL
+
+    async def test_get_unknown_returns_none(self) -> None:
+        tracker = BulkValidationTracker(FakeRedis())  # type: ignore[arg-type]
+
+        assert await tracker.get(uuid.uuid4()) is None
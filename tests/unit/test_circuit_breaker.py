@@ -0,0 +1,149 @@
+import asyncio
+
+import pytest
+
+from src.core.enums import CircuitState
+from src.core.exceptions import CircuitOpenError
+from src.services.circuit_breaker import CircuitBreaker
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class UpstreamError(Exception):
+    pass
+
+
+class TestCircuitBreaker:
+    @pytest.fixture
+    def clock(self) -> FakeClock:
+        return FakeClock()
+
+    @pytest.fixture
+    def breaker(self, clock: FakeClock) -> CircuitBreaker:
+        return CircuitBreaker(
+            "test",
+            window_size=4,
+            min_calls=4,
+            failure_rate_threshold=0.5,
+            slow_call_seconds=1.0,
+            slow_call_rate_threshold=0.5,
+            open_seconds=10.0,
+            clock=clock,
+        )
+
+    async def _succeed(self, breaker: CircuitBreaker, clock: FakeClock, took: float = 0.0) -> None:
+        async def call() -> str:
+            clock.now += took
+            return "ok"
+
+        assert await breaker.call(call) == "ok"
+
+    async def _fail(self, breaker: CircuitBreaker) -> None:
+        async def call() -> None:
+            raise UpstreamError
+
+        with pytest.raises(UpstreamError):
+            await breaker.call(call)
+
+    async def test_opens_on_failure_rate(self, breaker: CircuitBreaker, clock: FakeClock) -> None:
+        await self._succeed(breaker, clock)
+        await self._succeed(breaker, clock)
+        await self._fail(breaker)
+        assert breaker.state == CircuitState.CLOSED
+
+        await self._fail(breaker)
+
+        assert breaker.state == CircuitState.OPEN
+
+    async def test_opens_on_slow_call_rate(self, breaker: CircuitBreaker, clock: FakeClock) -> None:
+        for took in (0.1, 0.1, 2.0, 2.0):
+            await self._succeed(breaker, clock, took)
+
+        assert breaker.state == CircuitState.OPEN
+
+    async def test_rejects_while_open(self, breaker: CircuitBreaker, clock: FakeClock) -> None:
+        for _ in range(4):
+            await self._fail(breaker)
+        clock.now += 4.0
+
+        with pytest.raises(CircuitOpenError) as exc_info:
+            await self._succeed(breaker, clock)
+
+        assert exc_info.value.retry_after == 6.0
+
+    async def test_successful_probe_closes_circuit(
+        self, breaker: CircuitBreaker, clock: FakeClock
+    ) -> None:
+        for _ in range(4):
+            await self._fail(breaker)
+        clock.now += 10.0
+        assert breaker.state == CircuitState.HALF_OPEN
+
+        await self._succeed(breaker, clock)
+
+        assert breaker.state == CircuitState.CLOSED
+
+    async def test_failed_probe_reopens_circuit(
+        self, breaker: CircuitBreaker, clock: FakeClock
+    ) -> None:
+        for _ in range(4):
+            await self._fail(breaker)
+        clock.now += 10.0
+
+        await self._fail(breaker)
+
+        assert breaker.state == CircuitState.OPEN
+        assert breaker.retry_after() == 10.0
+
+    async def test_call_from_before_opening_does_not_settle_half_open(
+        self, breaker: CircuitBreaker, clock: FakeClock
+    ) -> None:
+        release_stale = asyncio.Event()
+        release_probe = asyncio.Event()
+
+        async def wait_for(event: asyncio.Event) -> str:
+            await event.wait()
+            return "ok"
+
+        stale = asyncio.create_task(breaker.call(lambda: wait_for(release_stale)))
+        await asyncio.sleep(0)
+        for _ in range(4):
+            await self._fail(breaker)
+        clock.now += 10.0
+        probe = asyncio.create_task(breaker.call(lambda: wait_for(release_probe)))
+        await asyncio.sleep(0)
+
+        release_stale.set()
+        await stale
+
+        assert breaker.state == CircuitState.HALF_OPEN
+        with pytest.raises(CircuitOpenError):
+            await self._succeed(breaker, clock)
+
+        release_probe.set()
+        await probe
+
+        assert breaker.state == CircuitState.CLOSED
+
+    async def test_cancelled_probe_frees_its_slot(
+        self, breaker: CircuitBreaker, clock: FakeClock
+    ) -> None:
+        for _ in range(4):
+            await self._fail(breaker)
+        clock.now += 10.0
+        probe = asyncio.create_task(breaker.call(lambda: asyncio.Event().wait()))
+        await asyncio.sleep(0)
+
+        probe.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await probe
+
+        assert breaker.state == CircuitState.HALF_OPEN
+        await self._succeed(breaker, clock)
+        assert breaker.state == CircuitState.CLOSED
@@ -0,0 +1,17 @@
+import pytest
+from pydantic import ValidationError
+
+from src.config import Settings
+
+
+class TestSettings:
+    @pytest.mark.parametrize("minutes", [1, 10, 30])
+    def test_accepts_cron_interval_dividing_the_hour(self, minutes: int) -> None:
+        assert (
+            Settings(revalidation_interval_minutes=minutes).revalidation_interval_minutes == minutes
+        )
+
+    @pytest.mark.parametrize("minutes", [0, 7, 45, 60, 90])
+    def test_rejects_cron_interval_not_dividing_the_hour(self, minutes: int) -> None:
+        with pytest.raises(ValidationError, match="revalidation_interval_minutes"):
+            Settings(revalidation_interval_minutes=minutes)
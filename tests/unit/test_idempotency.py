@@ -0,0 +1,59 @@
+import asyncio
+
+import pytest
+
+from src.services.idempotency import (
+    IdempotencyInProgressError,
+    IdempotencyKeyReusedError,
+    IdempotencyStore,
+    StoredResponse,
+)
+from tests.fakes.redis import FakeRedis
+
+KEY = "/api/v1/addresses:retry-1"
+RESPONSE = StoredResponse(status_code=201, content_type="application/json", body='{"id": "1"}')
+
+
+class TestIdempotencyStore:
+    @pytest.fixture
+    def store(self) -> IdempotencyStore:
+        return IdempotencyStore(FakeRedis(), wait_timeout=0.2, poll_interval=0.01)  # type: ignore[arg-type]
+
+    async def test_first_request_claims_key(self, store: IdempotencyStore) -> None:
+        assert await store.claim(KEY, "body-hash") is None
+
+    async def test_completed_duplicate_gets_stored_response(self, store: IdempotencyStore) -> None:
+        await store.claim(KEY, "body-hash")
+        await store.complete(KEY, "body-hash", RESPONSE)
+
+        assert await store.claim(KEY, "body-hash") == RESPONSE
+
+    async def test_in_flight_duplicate_waits_for_first(self, store: IdempotencyStore) -> None:
+        await store.claim(KEY, "body-hash")
+
+        async def finish_first() -> None:
+            await asyncio.sleep(0.05)
+            await store.complete(KEY, "body-hash", RESPONSE)
+
+        duplicate, _ = await asyncio.gather(store.claim(KEY, "body-hash"), finish_first())
+
+        assert duplicate == RESPONSE
+
+    async def test_in_flight_duplicate_gives_up_after_wait(self, store: IdempotencyStore) -> None:
+        await store.claim(KEY, "body-hash")
+
+        with pytest.raises(IdempotencyInProgressError):
+            await store.claim(KEY, "body-hash")
+
+    async def test_released_key_can_be_claimed_again(self, store: IdempotencyStore) -> None:
+        await store.claim(KEY, "body-hash")
+        await store.release(KEY)
+
+        assert await store.claim(KEY, "body-hash") is None
+
+    async def test_reuse_with_different_body_is_rejected(self, store: IdempotencyStore) -> None:
+        await store.claim(KEY, "body-hash")
+        await store.complete(KEY, "body-hash", RESPONSE)
+
+        with pytest.raises(IdempotencyKeyReusedError):
+            await store.claim(KEY, "other-hash")
@@ -0,0 +1,105 @@
+import pickle
+import uuid
+from datetime import UTC, datetime
+
+import pytest
+from arq.constants import default_queue_name, job_key_prefix, result_key_prefix
+from arq.jobs import deserialize_job, serialize_job, serialize_result
+
+from src.cli.redis_memory import memory_report
+from src.services.address_stats import ADDRESS_STATS_KEY
+from src.workers.serialization import deserialize, serialize
+from src.workers.settings import WorkerSettings
+from tests.constants import TaskNames
+from tests.fakes.redis import FakeRedis
+
+
+class TestSerialization:
+    def test_job_round_trip(self) -> None:
+        address_id = str(uuid.uuid4())
+        raw = serialize_job(
+            TaskNames.VALIDATE_ADDRESS, (address_id,), {"bulk_id": None}, 1, 0, serializer=serialize
+        )
+
+        job = deserialize_job(raw, deserializer=deserialize)
+
+        assert job.function == TaskNames.VALIDATE_ADDRESS
+        assert list(job.args) == [address_id]
+        assert job.kwargs == {"bulk_id": None}
+        assert len(raw) < len(
+            serialize_job(TaskNames.VALIDATE_ADDRESS, (address_id,), {"bulk_id": None}, 1, 0)
+        )
+
+    def test_exception_result_is_stored_as_text(self) -> None:
+        raw = serialize_result(
+            TaskNames.VALIDATE_ADDRESS,
+            ("x",),
+            {},
+            1,
+            0,
+            False,
+            ValueError("Address x not found"),
+            0,
+            0,
+            "ref",
+            default_queue_name,
+            "job",
+            serializer=serialize,
+        )
+
+        assert raw is not None
+        assert deserialize(raw)["r"] == "ValueError: Address x not found"
+
+    def test_datetimes_and_uuids_are_encoded_as_strings(self) -> None:
+        moment = datetime(2026, 1, 1, tzinfo=UTC)
+        value = uuid.uuid4()
+
+        assert deserialize(serialize([moment, value])) == [moment.isoformat(), str(value)]
+
+    def test_pickled_payloads_from_before_the_switch_are_read(self) -> None:
+        data = {"f": TaskNames.VALIDATE_ADDRESS, "a": ("x",)}
+
+        assert deserialize(pickle.dumps(data)) == data
+
+    def test_empty_map_is_not_mistaken_for_pickle(self) -> None:
+        assert deserialize(serialize({})) == {}
+
+    def test_unsupported_type_fails_loudly(self) -> None:
+        with pytest.raises(TypeError):
+            serialize(object())
+
+
+class TestResultRetention:
+    def test_per_task_override_and_default(self) -> None:
+        keep = {f.name: f.keep_result_s for f in WorkerSettings.functions}
+
+        assert keep[TaskNames.VALIDATE_ADDRESS] == 0
+        assert keep[TaskNames.ENQUEUE_VALIDATION_BATCH] == 0
+        assert keep["backfill_fingerprints_task"] is None  # worker-wide keep_result
+
+
+class TestMemoryReport:
+    async def test_attributes_keys_to_queues_tasks_and_prefixes(self) -> None:
+        redis = FakeRedis()
+        redis.zsets[default_queue_name] = {b"job-1": 1.0, b"job-2": 2.0}
+        for job_id in ("job-1", "job-2"):
+            redis.strings[job_key_prefix + job_id] = serialize_job(
+                TaskNames.VALIDATE_ADDRESS, (job_id,), {}, 1, 0, serializer=serialize
+            )
+        redis.strings[result_key_prefix + "done"] = serialize(
+            {"f": "backfill_fingerprints_task", "q": default_queue_name, "r": {"updated": 3}}
+        )
+        redis.hashes[ADDRESS_STATS_KEY] = {b"pending:US": b"3"}
+
+        report = await memory_report(redis, scan_count=2)  # type: ignore[arg-type]
+
+        queue = report.queues[default_queue_name]
+        assert queue.queued == 2
+        assert queue.index.keys == 1
+        assert queue.jobs.keys == 2
+        assert set(queue.results) == {"backfill_fingerprints_task"}
+        assert report.other["address"].keys == 1
+        expected = 0
+        for key in [*redis.strings, *redis.hashes, *redis.zsets]:
+            expected += await redis.memory_usage(key) or 0
+        assert report.total_bytes == expected
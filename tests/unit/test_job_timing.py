@@ -0,0 +1,74 @@
+import logging
+import time
+
+import pytest
+from prometheus_client import REGISTRY
+
+from src.workers.timing import (
+    JOB_TIMING_KEY,
+    JobTiming,
+    after_job_end,
+    job_timing,
+    on_job_start,
+)
+
+
+def _phase_count(phase: str) -> float:
+    return (
+        REGISTRY.get_sample_value("address_validation_phase_seconds_count", {"phase": phase}) or 0.0
+    )
+
+
+class TestJobTiming:
+    def test_phase_accumulates_and_records_on_error(self) -> None:
+        timing = JobTiming()
+
+        with timing.phase("save"):
+            pass
+        with pytest.raises(RuntimeError), timing.phase("save"):
+            raise RuntimeError
+
+        assert set(timing.phases) == {"save"}
+        assert timing.phases["save"] >= 0
+
+    def test_outside_worker_gets_detached_timing(self) -> None:
+        assert isinstance(job_timing({}), JobTiming)
+
+
+class TestHooks:
+    async def test_queue_wait_is_measured_from_due_time(self) -> None:
+        ctx = {"score": int((time.time() - 2) * 1000)}
+
+        await on_job_start(ctx)
+
+        assert ctx[JOB_TIMING_KEY].queue_wait == pytest.approx(2, abs=0.5)
+
+    async def test_job_not_yet_due_has_no_wait(self) -> None:
+        ctx = {"score": int((time.time() + 60) * 1000)}
+
+        await on_job_start(ctx)
+
+        assert ctx[JOB_TIMING_KEY].queue_wait == 0
+
+    async def test_phases_are_exported_and_logged(self, caplog: pytest.LogCaptureFixture) -> None:
+        timing = JobTiming(queue_wait=0.5, fields={"address_id": "a1"})
+        timing.phases.update(load=0.01, upstream=0.2)
+        before = _phase_count("upstream"), _phase_count("total")
+
+        with caplog.at_level(logging.INFO, logger="src.workers.timing"):
+            await after_job_end({"job_id": "j1", JOB_TIMING_KEY: timing})
+
+        assert (_phase_count("upstream"), _phase_count("total")) == (before[0] + 1, before[1] + 1)
+        record = caplog.records[-1]
+        assert "address_id=a1" in record.getMessage()
+        assert record.job_timing["upstream"] == 0.2
+        assert record.job_timing["queue_wait"] == 0.5
+
+    async def test_jobs_without_phases_are_not_reported(
+        self, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        with caplog.at_level(logging.INFO, logger="src.workers.timing"):
+            await after_job_end({"job_id": "j1", JOB_TIMING_KEY: JobTiming()})
+            await after_job_end({"job_id": "j2"})
+
+        assert not caplog.records
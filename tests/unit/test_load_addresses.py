@@ -0,0 +1,113 @@
+import uuid
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.cli.load_addresses import COLUMNS, AddressLoader, missing_columns
+from src.core.enums import ValidationStatus
+from src.db.sharding import shard_for
+from src.services.address_stats import AddressStatsCounter
+from src.services.bulk_validation import BulkValidationTracker
+from tests.constants import AddressData, TaskNames
+from tests.fakes.redis import FakeRedis
+
+
+def _row(**overrides: str) -> dict[str, str]:
+    row = {
+        "name": "",
+        "address_line1": AddressData.ADDRESS_LINE1_DEFAULT,
+        "city_locality": AddressData.CITY_DEFAULT,
+        "state_province": AddressData.STATE_DEFAULT,
+        "postal_code": AddressData.POSTAL_CODE_DEFAULT,
+        "country_code": AddressData.COUNTRY_CODE_US,
+    }
+    return row | overrides
+
+
+class TestAddressLoader:
+    @pytest.fixture
+    def conn(self) -> MagicMock:
+        conn = MagicMock()
+        conn.copy_records_to_table = AsyncMock()
+        return conn
+
+    def _copied(self, conn: MagicMock) -> list[list[tuple[object, ...]]]:
+        return [call.kwargs["records"] for call in conn.copy_records_to_table.call_args_list]
+
+    async def test_copies_rows_in_batches(self, conn: MagicMock) -> None:
+        loader = AddressLoader([conn], batch_size=2)
+
+        report = await loader.load([_row() for _ in range(5)])
+
+        assert report.loaded == 5
+        assert [len(batch) for batch in self._copied(conn)] == [2, 2, 1]
+        assert conn.transaction.call_count == 3
+        assert conn.copy_records_to_table.call_args.kwargs["columns"] == COLUMNS
+
+    async def test_record_matches_columns(self, conn: MagicMock) -> None:
+        await AddressLoader([conn]).load([_row(name="Jane")])
+
+        record = dict(zip(COLUMNS, self._copied(conn)[0][0], strict=True))
+        assert isinstance(record["id"], uuid.UUID)
+        assert record["name"] == "Jane"
+        assert record["address_line2"] is None
+        assert record["fingerprint"] is None
+        assert record["validation_status"] == ValidationStatus.PENDING.value
+
+    async def test_invalid_rows_are_skipped(self, conn: MagicMock) -> None:
+        report = await AddressLoader([conn]).load(
+            [_row(), _row(country_code=AddressData.COUNTRY_CODE_INVALID), _row(address_line1="")]
+        )
+
+        assert report.loaded == 1
+        assert report.rejected == 2
+
+    async def test_fingerprint_is_optional(self, conn: MagicMock) -> None:
+        await AddressLoader([conn], fingerprint=True).load([_row()])
+
+        record = dict(zip(COLUMNS, self._copied(conn)[0][0], strict=True))
+        assert len(record["fingerprint"]) == 64
+
+    async def test_validate_enqueues_batches_and_counts_stats(self, conn: MagicMock) -> None:
+        redis = FakeRedis()
+        loader = AddressLoader([conn], redis, batch_size=2, validate=True)  # type: ignore[arg-type]
+
+        report = await loader.load([_row() for _ in range(3)])
+
+        assert report.bulk_id is not None
+        jobs = redis.enqueue_job.call_args_list
+        assert [job.args[0] for job in jobs] == [TaskNames.ENQUEUE_VALIDATION_BATCH] * 2
+        assert sum(len(job.args[2]) for job in jobs) == 3
+        progress = await BulkValidationTracker(redis).get(report.bulk_id)  # type: ignore[arg-type]
+        assert progress is not None
+        assert progress.total == 3
+        stats = await AddressStatsCounter(redis).read()  # type: ignore[arg-type]
+        assert stats == {(ValidationStatus.PENDING, AddressData.COUNTRY_CODE_US): 3}
+
+    async def test_rows_are_copied_to_their_shard(self) -> None:
+        shards = [MagicMock(copy_records_to_table=AsyncMock()) for _ in range(2)]
+
+        report = await AddressLoader(shards, batch_size=10).load([_row() for _ in range(20)])
+
+        assert report.loaded == 20
+        for shard_id, conn in enumerate(shards):
+            ids = [record[0] for batch in self._copied(conn) for record in batch]
+            assert ids
+            assert {shard_for(address_id, 2) for address_id in ids} == {str(shard_id)}
+        assert sum(len(batch) for conn in shards for batch in self._copied(conn)) == 20
+
+    def test_validate_requires_redis(self, conn: MagicMock) -> None:
+        with pytest.raises(ValueError):
+            AddressLoader([conn], validate=True)
+
+
+class TestMissingColumns:
+    def test_reports_required_fields_only(self) -> None:
+        assert missing_columns(["address_line1", "city_locality", "name"]) == [
+            "state_province",
+            "postal_code",
+            "country_code",
+        ]
+
+    def test_complete_header(self) -> None:
+        assert missing_columns(list(_row())) == []
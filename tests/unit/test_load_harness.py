@@ -0,0 +1,45 @@
+import time
+
+from src.core.enums import ValidationStatus
+from tests.load.harness import LoadConfig, Recorder, build_report, percentile, summarize
+from tests.unit.test_status_stream import make_event
+
+
+class TestPercentile:
+    def test_nearest_rank(self) -> None:
+        samples = [float(i) for i in range(1, 101)]
+
+        assert percentile(samples, 50) == 50.0
+        assert percentile(samples, 95) == 95.0
+        assert percentile(samples, 99) == 99.0
+
+    def test_empty_sample(self) -> None:
+        assert percentile([], 99) == 0.0
+        assert summarize([])["count"] == 0
+
+
+class TestRecorder:
+    def test_completion_measured_from_first_request(self) -> None:
+        recorder = Recorder()
+        recorder.start_validation("a", time.monotonic() - 2.0)
+        recorder.start_validation("a", time.monotonic())
+
+        recorder.finish_validation(make_event("a", ValidationStatus.PENDING))
+        recorder.finish_validation(make_event("a", ValidationStatus.VERIFIED))
+
+        assert recorder.pending == {}
+        assert len(recorder.completions) == 1
+        assert recorder.completions[0] >= 2.0
+
+    def test_report_counts_outstanding_validations(self) -> None:
+        recorder = Recorder()
+        recorder.latencies["get"].extend([0.01, 0.02])
+        recorder.errors["get"] += 1
+        recorder.start_validation("a", time.monotonic())
+
+        report = build_report(LoadConfig(), recorder, elapsed=2.0)
+
+        assert report["requests"] == 2
+        assert report["rps"] == 1.0
+        assert report["operations"]["get"]["errors"] == 1
+        assert report["validation"]["outstanding"] == 1
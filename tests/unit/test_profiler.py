@@ -0,0 +1,79 @@
+import asyncio
+import time
+from datetime import UTC, datetime
+
+from src.services.profiler import (
+    MAX_QUERIES,
+    WAITING_FRAME,
+    ProfileStore,
+    RequestProfile,
+    StackSampler,
+)
+from tests.fakes.redis import FakeRedis
+
+
+def _profile() -> RequestProfile:
+    return RequestProfile(
+        request_id="req-1", method="GET", path="/api/v1/addresses", started_at=datetime.now(UTC)
+    )
+
+
+def _spin(seconds: float) -> None:
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        pass
+
+
+async def _handler() -> None:
+    _spin(0.05)
+    await asyncio.sleep(0.05)
+
+
+class TestStackSampler:
+    async def test_samples_running_and_awaiting_stacks_of_its_task(self) -> None:
+        async def profiled() -> dict[str, int]:
+            task = asyncio.current_task()
+            assert task is not None
+            sampler = StackSampler(task, interval=0.002)
+            sampler.start()
+            try:
+                await _handler()
+            finally:
+                samples = sampler.stop()
+            return samples
+
+        other = asyncio.create_task(asyncio.sleep(0.2))
+        samples = await asyncio.create_task(profiled())
+        other.cancel()
+
+        assert any(stack.split(";")[-1].startswith("_spin ") for stack in samples)
+        assert any("_handler" in stack and stack.endswith(WAITING_FRAME) for stack in samples)
+        assert all(stack.split(";")[0].startswith("TestStackSampler.") for stack in samples)
+
+
+class TestRequestProfile:
+    def test_collapsed_output_is_one_folded_stack_per_line(self) -> None:
+        profile = _profile()
+        profile.samples = {"main;handler;query": 3, "main;handler": 1}
+
+        assert profile.collapsed() == "main;handler 1\nmain;handler;query 3\n"
+
+    def test_queries_beyond_the_cap_are_counted_not_kept(self) -> None:
+        profile = _profile()
+        for _ in range(MAX_QUERIES + 2):
+            profile.record_query("SELECT 1", 0.001)
+
+        assert len(profile.queries) == MAX_QUERIES
+        assert profile.queries_dropped == 2
+        assert profile.queries[0].duration_ms == 1.0
+
+    async def test_store_round_trip(self) -> None:
+        store = ProfileStore(FakeRedis(), ttl=60)  # type: ignore[arg-type]
+        profile = _profile()
+        profile.samples = {"main;handler": 2}
+        profile.record_query("SELECT 1", 0.002)
+
+        await store.save(profile)
+
+        assert await store.get("req-1") == profile
+        assert await store.get("req-2") is None
@@ -0,0 +1,54 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+from sqlalchemy.pool import QueuePool
+
+from src.services.readiness import ERROR, OK, check_database, check_redis
+
+
+class TestCheckRedis:
+    async def test_reports_latency(self) -> None:
+        result = await check_redis(AsyncMock(), timeout=1.0)
+
+        assert result.status == OK
+        assert result.latency_ms is not None
+
+    async def test_times_out(self) -> None:
+        async def slow_ping() -> None:
+            await asyncio.sleep(1)
+
+        redis = AsyncMock()
+        redis.ping.side_effect = slow_ping
+
+        result = await check_redis(redis, timeout=0.01)
+
+        assert result.status == ERROR
+        assert result.error == "timed out after 0.01s"
+
+    async def test_reports_connection_error(self) -> None:
+        redis = AsyncMock()
+        redis.ping.side_effect = ConnectionError("Connection refused")
+
+        result = await check_redis(redis, timeout=1.0)
+
+        assert result.status == ERROR
+        assert result.error == "Connection refused"
+
+
+class TestCheckDatabase:
+    async def test_saturated_pool_fails_without_waiting_for_a_connection(self) -> None:
+        engine = MagicMock()
+        engine.pool = MagicMock(spec=QueuePool)
+        engine.pool.checkedout.return_value = 14
+
+        result = await check_database(engine, timeout=1.0, capacity=15, max_usage=0.9)
+
+        assert result.status == ERROR
+        assert result.pool is not None
+        assert (result.pool.checked_out, result.pool.capacity) == (14, 15)
+        engine.connect.assert_not_called()
+
+    async def test_uninitialized_engine(self) -> None:
+        result = await check_database(None, timeout=1.0, capacity=15, max_usage=0.9)
+
+        assert result.status == ERROR
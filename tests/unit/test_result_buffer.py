@@ -0,0 +1,143 @@
+import asyncio
+import uuid
+from collections.abc import AsyncGenerator, Iterator
+from contextlib import asynccontextmanager
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.core.enums import ValidationStatus
+from src.services.address_stats import AddressStatsCounter
+from src.services.result_buffer import (
+    ResultWriteError,
+    ValidationOutcome,
+    ValidationResultBuffer,
+)
+
+
+def _outcome(status: ValidationStatus = ValidationStatus.VERIFIED) -> ValidationOutcome:
+    return ValidationOutcome(
+        address_id=uuid.uuid4(),
+        status=status,
+        previous_status=ValidationStatus.PENDING,
+        country_code="US",
+        validated_at=datetime.now(UTC),
+    )
+
+
+class TestValidationResultBuffer:
+    @pytest.fixture
+    def mock_repo(self) -> AsyncMock:
+        repo = AsyncMock()
+        repo.lock_existing_ids.side_effect = set
+        return repo
+
+    @pytest.fixture
+    def session_factory(self) -> MagicMock:
+        @asynccontextmanager
+        async def factory() -> AsyncGenerator[AsyncMock, None]:
+            yield AsyncMock()
+
+        return MagicMock(side_effect=factory)
+
+    @pytest.fixture(autouse=True)
+    def patch_repo(self, mock_repo: AsyncMock) -> Iterator[None]:
+        with patch("src.services.result_buffer.AddressRepository", return_value=mock_repo):
+            yield
+
+    async def test_full_batch_is_written_in_one_transaction(
+        self, session_factory: MagicMock, mock_repo: AsyncMock
+    ) -> None:
+        buffer = ValidationResultBuffer(session_factory, max_items=3, flush_interval=60)
+        outcomes = [_outcome() for _ in range(3)]
+
+        await asyncio.gather(*(buffer.save(o) for o in outcomes))
+
+        assert session_factory.call_count == 1
+        rows = mock_repo.add_validation_results.call_args.args[0]
+        assert [row["address_id"] for row in rows] == [o.address_id for o in outcomes]
+        statuses = mock_repo.set_validation_statuses.call_args.args[0]
+        assert statuses == {o.address_id: (o.status, o.validated_at) for o in outcomes}
+
+    async def test_partial_batch_is_written_after_interval(
+        self, session_factory: MagicMock, mock_repo: AsyncMock
+    ) -> None:
+        buffer = ValidationResultBuffer(session_factory, max_items=100, flush_interval=0.01)
+
+        await asyncio.wait_for(buffer.save(_outcome()), timeout=1)
+
+        assert session_factory.call_count == 1
+        mock_repo.add_validation_results.assert_awaited_once()
+
+    async def test_save_waits_until_batch_is_written(
+        self, session_factory: MagicMock, mock_repo: AsyncMock
+    ) -> None:
+        buffer = ValidationResultBuffer(session_factory, max_items=2, flush_interval=60)
+
+        first = asyncio.create_task(buffer.save(_outcome()))
+        await asyncio.sleep(0)
+        assert not first.done()
+        mock_repo.add_validation_results.assert_not_awaited()
+
+        await buffer.save(_outcome())
+        await first
+
+    async def test_outcome_of_deleted_address_is_dropped_from_batch(
+        self, session_factory: MagicMock, mock_repo: AsyncMock
+    ) -> None:
+        kept, deleted = _outcome(), _outcome()
+        mock_repo.lock_existing_ids.side_effect = None
+        mock_repo.lock_existing_ids.return_value = {kept.address_id}
+        stats = AsyncMock(spec=AddressStatsCounter)
+        buffer = ValidationResultBuffer(session_factory, stats, max_items=2, flush_interval=60)
+
+        saved = await asyncio.gather(buffer.save(kept), buffer.save(deleted))
+
+        assert saved == [True, False]
+        rows = mock_repo.add_validation_results.call_args.args[0]
+        assert [row["address_id"] for row in rows] == [kept.address_id]
+        assert set(mock_repo.set_validation_statuses.call_args.args[0]) == {kept.address_id}
+        assert stats.apply.call_args.args[0] == {
+            (ValidationStatus.PENDING, "US"): -1,
+            (ValidationStatus.VERIFIED, "US"): 1,
+        }
+
+    async def test_write_failure_reaches_every_job_in_batch(
+        self, session_factory: MagicMock, mock_repo: AsyncMock
+    ) -> None:
+        mock_repo.set_validation_statuses.side_effect = RuntimeError("connection lost")
+        buffer = ValidationResultBuffer(session_factory, max_items=2, flush_interval=60)
+
+        results = await asyncio.gather(
+            buffer.save(_outcome()), buffer.save(_outcome()), return_exceptions=True
+        )
+
+        assert all(isinstance(r, ResultWriteError) for r in results)
+        assert all(isinstance(r.__cause__, RuntimeError) for r in results)
+
+    async def test_stats_are_applied_after_write(self, session_factory: MagicMock) -> None:
+        stats = AsyncMock(spec=AddressStatsCounter)
+        buffer = ValidationResultBuffer(session_factory, stats, max_items=2, flush_interval=60)
+
+        await asyncio.gather(
+            buffer.save(_outcome(ValidationStatus.VERIFIED)),
+            buffer.save(_outcome(ValidationStatus.ERROR)),
+        )
+
+        deltas = stats.apply.call_args.args[0]
+        assert deltas[(ValidationStatus.PENDING, "US")] == -2
+        assert deltas[(ValidationStatus.VERIFIED, "US")] == 1
+        assert deltas[(ValidationStatus.ERROR, "US")] == 1
+
+    async def test_close_writes_waiting_outcomes(
+        self, session_factory: MagicMock, mock_repo: AsyncMock
+    ) -> None:
+        buffer = ValidationResultBuffer(session_factory, max_items=100, flush_interval=60)
+        job = asyncio.create_task(buffer.save(_outcome()))
+        await asyncio.sleep(0)
+
+        await buffer.close()
+
+        mock_repo.add_validation_results.assert_awaited_once()
+        await asyncio.wait_for(job, timeout=1)
@@ -1,7 +1,13 @@
+import asyncio
+from unittest.mock import MagicMock
+
 import pytest
 
-from src.core.enums import ValidationStatus
-from src.services.shipengine_client import ShipEngineClient
+from src.core.enums import CircuitState, ValidationStatus
+from src.core.exceptions import UpstreamTimeoutError
+from src.services.circuit_breaker import CircuitBreaker
+from src.services.hedging import HedgePolicy
+from src.services.shipengine_client import ShipEngineClient, ValidationResponse
 from tests.constants import AddressData, ValidationMessages
 from tests.factories.address_factory import create_test_address
 
@@ -59,3 +65,135 @@ class TestShipEngineClient:
 
         assert result.status == ValidationStatus.ERROR
         assert result.messages is not None
+
+    def test_fingerprint_ignores_case_spacing_and_street_suffix(
+        self, client: ShipEngineClient
+    ) -> None:
+        address = create_test_address(address_line1="123 Main Street")
+        twin = create_test_address(
+            address_line1="  123   MAIN st ",
+            city_locality=AddressData.CITY_DEFAULT.lower(),
+            state_province=AddressData.STATE_DEFAULT.lower(),
+        )
+
+        assert client.fingerprint(address) == client.fingerprint(twin)
+
+    def test_fingerprint_differs_for_different_postal_code(self, client: ShipEngineClient) -> None:
+        address = create_test_address()
+        other = create_test_address(postal_code="78702")
+
+        assert client.fingerprint(address) != client.fingerprint(other)
+
+
+class TestShipEngineClientTimeouts:
+    async def test_hung_upstream_raises_after_attempts(self) -> None:
+        client = ShipEngineClient(latency=10, call_timeout=0.01, total_timeout=1, max_attempts=3)
+        upstream = MagicMock(side_effect=lambda _address: asyncio.sleep(10))
+        client._call_upstream = upstream  # type: ignore[method-assign]
+
+        with pytest.raises(UpstreamTimeoutError):
+            await client.validate_address(create_test_address())
+
+        assert upstream.call_count == 3
+
+    async def test_total_budget_caps_attempts(self) -> None:
+        client = ShipEngineClient(latency=10, call_timeout=0.05, total_timeout=0.08, max_attempts=5)
+
+        with pytest.raises(UpstreamTimeoutError) as exc_info:
+            async with asyncio.timeout(1):
+                await client.validate_address(create_test_address())
+
+        assert exc_info.value.budget == 0.08
+
+    async def test_retry_after_timeout_can_succeed(self) -> None:
+        client = ShipEngineClient(latency=0, call_timeout=0.05)
+        verified = ValidationResponse(status=ValidationStatus.VERIFIED)
+        upstream = MagicMock(side_effect=[asyncio.sleep(10), _resolved(verified)])
+        client._call_upstream = upstream  # type: ignore[method-assign]
+
+        result = await client.validate_address(create_test_address())
+
+        assert result is verified
+
+    async def test_timeouts_count_as_breaker_failures(self) -> None:
+        breaker = CircuitBreaker("test", window_size=2, min_calls=2, failure_rate_threshold=1.0)
+        client = ShipEngineClient(latency=10, breaker=breaker, call_timeout=0.01, max_attempts=2)
+
+        with pytest.raises(UpstreamTimeoutError):
+            await client.validate_address(create_test_address())
+
+        assert breaker.state == CircuitState.OPEN
+
+
+class TestShipEngineClientHedging:
+    @pytest.fixture
+    def hedge(self) -> HedgePolicy:
+        policy = HedgePolicy(percentile=95, min_samples=5)
+        for _ in range(5):
+            policy.observe(0.01)
+        return policy
+
+    async def test_backup_request_wins_when_first_is_slow(self, hedge: HedgePolicy) -> None:
+        client = ShipEngineClient(hedge=hedge)
+        fast = ValidationResponse(status=ValidationStatus.VERIFIED)
+        upstream = MagicMock(side_effect=[asyncio.sleep(10), _resolved(fast)])
+        client._call_upstream = upstream  # type: ignore[method-assign]
+
+        async with asyncio.timeout(1):
+            result = await client.validate_address(create_test_address())
+
+        assert result is fast
+        assert upstream.call_count == 2
+
+    async def test_no_backup_request_when_first_is_fast(self, hedge: HedgePolicy) -> None:
+        client = ShipEngineClient(latency=0, hedge=hedge)
+
+        result = await client.validate_address(create_test_address())
+
+        assert result.status == ValidationStatus.VERIFIED
+
+    async def test_failed_first_call_waits_for_backup(self, hedge: HedgePolicy) -> None:
+        client = ShipEngineClient(hedge=hedge)
+        verified = ValidationResponse(status=ValidationStatus.VERIFIED)
+        upstream = MagicMock(side_effect=[_failing_after(0.05), _resolved(verified, after=0.1)])
+        client._call_upstream = upstream  # type: ignore[method-assign]
+
+        result = await client.validate_address(create_test_address())
+
+        assert result is verified
+
+    async def test_cold_policy_does_not_hedge(self) -> None:
+        client = ShipEngineClient(hedge=HedgePolicy(min_samples=5))
+        verified = ValidationResponse(status=ValidationStatus.VERIFIED)
+        upstream = MagicMock(side_effect=[_resolved(verified, after=0.05)])
+        client._call_upstream = upstream  # type: ignore[method-assign]
+
+        await client.validate_address(create_test_address())
+
+        assert upstream.call_count == 1
+
+
+class TestHedgePolicy:
+    def test_delay_is_percentile_of_recent_latency(self) -> None:
+        policy = HedgePolicy(percentile=95, window_size=100, min_samples=10)
+        for ms in range(1, 101):
+            policy.observe(ms / 1000)
+
+        assert policy.delay() == 0.095
+
+    def test_no_delay_until_min_samples(self) -> None:
+        policy = HedgePolicy(min_samples=3)
+        policy.observe(0.1)
+        policy.observe(0.1)
+
+        assert policy.delay() is None
+
+
+async def _resolved(result: ValidationResponse, after: float = 0) -> ValidationResponse:
+    await asyncio.sleep(after)
+    return result
+
+
+async def _failing_after(seconds: float) -> ValidationResponse:
+    await asyncio.sleep(seconds)
+    raise ConnectionError("upstream reset")
@@ -0,0 +1,100 @@
+import asyncio
+import logging
+from collections.abc import AsyncGenerator
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+
+from src.db.slow_query import (
+    MAX_LOGGED_PARAMETERS,
+    SlowQueryLog,
+    explain_statement,
+    redact,
+    set_query_origin,
+)
+
+LOGGER = "src.db.slow_query"
+
+
+@pytest.fixture
+async def engine() -> AsyncGenerator[AsyncEngine, None]:
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    yield engine
+    await engine.dispose()
+
+
+class TestRedact:
+    def test_values_are_replaced_by_types(self) -> None:
+        assert redact(("221B Baker St", 3, None, uuid4())) == ["<str>", "<int>", None, "<UUID>"]
+        assert redact({"city": "London"}) == {"city": "<str>"}
+
+    def test_long_parameter_lists_are_truncated(self) -> None:
+        redacted = redact([("a",)] * (MAX_LOGGED_PARAMETERS + 5))
+
+        assert len(redacted) == MAX_LOGGED_PARAMETERS + 1
+        assert redacted[-1] == "... 5 more"
+
+
+class TestExplainStatement:
+    def test_only_reads_are_analyzed(self) -> None:
+        assert explain_statement("SELECT 1").startswith("EXPLAIN (ANALYZE, BUFFERS) ")
+        assert explain_statement("UPDATE addresses SET city = $1") == (
+            "EXPLAIN UPDATE addresses SET city = $1"
+        )
+
+    def test_locking_reads_are_not_analyzed(self) -> None:
+        for clause in ("FOR UPDATE", "FOR NO KEY UPDATE", "FOR SHARE", "FOR KEY SHARE"):
+            statement = f"SELECT addresses.id FROM addresses WHERE addresses.id = $1 {clause}"
+            assert explain_statement(statement) == f"EXPLAIN {statement}"
+
+
+class TestSlowQueryLog:
+    async def test_slow_statement_is_logged_with_origin(
+        self, engine: AsyncEngine, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        SlowQueryLog(engine, threshold=0).install()
+
+        async def route() -> None:
+            set_query_origin("GET /api/v1/addresses")
+            async with engine.connect() as conn:
+                await conn.execute(text("SELECT :city"), {"city": "London"})
+
+        with caplog.at_level(logging.WARNING, logger=LOGGER):
+            await asyncio.create_task(route())
+
+        record = caplog.records[0]
+        assert record.slow_query["origin"] == "GET /api/v1/addresses"
+        assert record.slow_query["parameters"] == ["<str>"]
+        assert "London" not in caplog.text
+
+    async def test_fast_statement_is_not_logged(
+        self, engine: AsyncEngine, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        SlowQueryLog(engine, threshold=60).install()
+
+        with caplog.at_level(logging.WARNING, logger=LOGGER):
+            async with engine.connect() as conn:
+                await conn.execute(text("SELECT 1"))
+
+        assert not caplog.records
+
+    async def test_plan_is_captured_in_background(
+        self,
+        engine: AsyncEngine,
+        caplog: pytest.LogCaptureFixture,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        monkeypatch.setattr(engine.dialect, "name", "postgresql")
+        log = SlowQueryLog(engine, threshold=0, explain_sample_rate=1.0)
+        log.install()
+
+        with caplog.at_level(logging.WARNING, logger=LOGGER):
+            async with engine.connect() as conn:
+                await conn.execute(text("SELECT 1"))
+            assert log._explaining is not None
+            await log._explaining
+
+        # SQLite rejects `SET LOCAL`; the failure is logged, never raised into the caller.
+        assert "Failed to explain slow query" in caplog.text
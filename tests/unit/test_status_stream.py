@@ -0,0 +1,97 @@
+import uuid
+from datetime import UTC, datetime
+
+import pytest
+
+from src.core.enums import ValidationStatus
+from src.services.status_stream import (
+    StatusBroadcaster,
+    StatusEvent,
+    StatusFilter,
+    Subscription,
+)
+from tests.constants import AddressData
+
+
+def make_event(
+    address_id: str | None = None,
+    status: ValidationStatus = ValidationStatus.VERIFIED,
+    country_code: str = AddressData.COUNTRY_CODE_US,
+) -> StatusEvent:
+    return StatusEvent(
+        address_id=address_id or str(uuid.uuid4()),
+        validation_status=status,
+        country_code=country_code,
+        validated_at=datetime.now(UTC),
+    )
+
+
+class TestStatusEvent:
+    def test_json_round_trip(self) -> None:
+        event = make_event()
+
+        assert StatusEvent.from_json(event.to_json()) == event
+
+
+class TestStatusBroadcaster:
+    @pytest.fixture
+    def broadcaster(self) -> StatusBroadcaster:
+        return StatusBroadcaster(redis=None)  # type: ignore[arg-type]
+
+    def test_address_subscription_receives_only_its_address(
+        self, broadcaster: StatusBroadcaster
+    ) -> None:
+        watched = make_event()
+        subscription = broadcaster.subscribe(
+            StatusFilter(address_ids=frozenset({watched.address_id}))
+        )
+
+        broadcaster.dispatch(make_event())
+        broadcaster.dispatch(watched)
+
+        assert subscription.queue.qsize() == 1
+        assert subscription.queue.get_nowait() == watched
+
+    def test_filter_subscription_matches_status_and_country(
+        self, broadcaster: StatusBroadcaster
+    ) -> None:
+        subscription = broadcaster.subscribe(
+            StatusFilter(
+                statuses=frozenset({ValidationStatus.ERROR}),
+                country_codes=frozenset({"CA"}),
+            )
+        )
+
+        broadcaster.dispatch(make_event(status=ValidationStatus.ERROR))
+        broadcaster.dispatch(make_event(country_code="CA"))
+        broadcaster.dispatch(make_event(status=ValidationStatus.ERROR, country_code="CA"))
+
+        assert subscription.queue.qsize() == 1
+
+    def test_unsubscribed_client_receives_nothing(self, broadcaster: StatusBroadcaster) -> None:
+        event = make_event()
+        subscription = broadcaster.subscribe(
+            StatusFilter(address_ids=frozenset({event.address_id}))
+        )
+
+        broadcaster.unsubscribe(subscription)
+        broadcaster.dispatch(event)
+
+        assert subscription.queue.empty()
+
+    def test_malformed_message_is_ignored(self, broadcaster: StatusBroadcaster) -> None:
+        subscription = broadcaster.subscribe(StatusFilter())
+
+        broadcaster._handle({"data": b"not json"})
+
+        assert subscription.queue.empty()
+
+
+class TestSubscription:
+    def test_full_queue_drops_events(self) -> None:
+        subscription = Subscription(StatusFilter())
+        for _ in range(subscription.queue.maxsize + 2):
+            subscription.push(make_event())
+
+        assert subscription.queue.full()
+        assert subscription.dropped == 2
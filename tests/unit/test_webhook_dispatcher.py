@@ -0,0 +1,323 @@
+import asyncio
+import json
+import time
+import uuid
+from collections.abc import AsyncGenerator, Iterator
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+from redis.exceptions import ConnectionError as RedisConnectionError
+from sqlalchemy.exc import IntegrityError
+
+from src.db.models.webhook import WebhookDeadLetter, WebhookEndpoint
+from src.services.webhook_dispatcher import (
+    WEBHOOK_CLAIM_KEY,
+    WEBHOOK_DELIVERIES_KEY,
+    WEBHOOK_EVENTS_KEY,
+    WEBHOOK_LEASE_KEY,
+    WEBHOOK_PROCESSING_KEY,
+    Delivery,
+    WebhookDispatcher,
+)
+from tests.fakes.redis import FakeRedis
+
+EVENT = {"address_id": str(uuid.uuid4()), "validation_status": "verified", "client_id": "acme"}
+
+
+class TestWebhookDispatcher:
+    @pytest.fixture
+    def endpoints(self) -> list[WebhookEndpoint]:
+        return [
+            WebhookEndpoint(
+                id=uuid.uuid4(), client_id="acme", url="https://a.test/hook", secret="s3cret"
+            ),
+            WebhookEndpoint(
+                id=uuid.uuid4(), client_id="acme", url="https://b.test/hook", secret=None
+            ),
+        ]
+
+    @pytest.fixture
+    def redis(self) -> FakeRedis:
+        redis = FakeRedis()
+        redis.lists[WEBHOOK_EVENTS_KEY] = [json.dumps(EVENT).encode(), json.dumps(EVENT).encode()]
+        return redis
+
+    @pytest.fixture(autouse=True)
+    def mock_repo(self, endpoints: list[WebhookEndpoint]) -> Iterator[AsyncMock]:
+        repo = AsyncMock()
+        repo.get_active.return_value = endpoints
+        with patch("src.services.webhook_dispatcher.WebhookRepository", return_value=repo):
+            yield repo
+
+    def _dispatcher(
+        self,
+        redis: FakeRedis,
+        handler: httpx.MockTransport,
+        max_attempts: int = 3,
+        endpoint_concurrency: int = 2,
+    ) -> WebhookDispatcher:
+        @asynccontextmanager
+        async def session_factory() -> AsyncGenerator[AsyncMock, None]:
+            yield AsyncMock()
+
+        return WebhookDispatcher(
+            redis,  # type: ignore[arg-type]
+            httpx.AsyncClient(transport=handler),
+            session_factory,
+            max_attempts=max_attempts,
+            endpoint_concurrency=endpoint_concurrency,
+        )
+
+    async def _dispatch(self, dispatcher: WebhookDispatcher) -> int:
+        handled = await dispatcher.dispatch_once()
+        await dispatcher.join()
+        return handled
+
+    def _queued(self, redis: FakeRedis, endpoint: WebhookEndpoint) -> list[Delivery]:
+        queue = redis.zsets.get(WEBHOOK_DELIVERIES_KEY.format(endpoint.id), {})
+        return [Delivery.from_json(raw) for raw in queue]
+
+    async def test_sends_one_signed_batch_per_endpoint(self, redis: FakeRedis) -> None:
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(200)
+
+        await self._dispatch(self._dispatcher(redis, httpx.MockTransport(handler)))
+
+        assert sorted(r.url.host for r in requests) == ["a.test", "b.test"]
+        for request in requests:
+            assert len(json.loads(request.content)["events"]) == 2
+        signed = next(r for r in requests if r.url.host == "a.test")
+        assert signed.headers["X-Webhook-Signature"].startswith("sha256=")
+        # Acknowledged: nothing left to process or deliver.
+        assert redis.lists == {}
+        assert redis.zsets == {}
+
+    async def test_endpoints_only_receive_their_clients_addresses(
+        self, redis: FakeRedis, endpoints: list[WebhookEndpoint]
+    ) -> None:
+        endpoints.append(
+            WebhookEndpoint(id=uuid.uuid4(), client_id="globex", url="https://c.test/hook")
+        )
+        other = {**EVENT, "address_id": str(uuid.uuid4()), "client_id": "globex"}
+        unowned = {**EVENT, "client_id": None}
+        redis.lists[WEBHOOK_EVENTS_KEY] = [json.dumps(e).encode() for e in (EVENT, other, unowned)]
+        received: dict[str, list[dict[str, str]]] = {}
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            received[request.url.host] = json.loads(request.content)["events"]
+            return httpx.Response(200)
+
+        await self._dispatch(self._dispatcher(redis, httpx.MockTransport(handler)))
+
+        assert received == {"a.test": [EVENT], "b.test": [EVENT], "c.test": [other]}
+
+    async def test_failed_delivery_stays_queued_for_retry(
+        self, redis: FakeRedis, endpoints: list[WebhookEndpoint]
+    ) -> None:
+        dispatcher = self._dispatcher(
+            redis, httpx.MockTransport(lambda _request: httpx.Response(503))
+        )
+
+        await self._dispatch(dispatcher)
+
+        for endpoint in endpoints:
+            (retry,) = self._queued(redis, endpoint)
+            assert retry.attempt == 1
+            (score,) = redis.zsets[WEBHOOK_DELIVERIES_KEY.format(endpoint.id)].values()
+            assert score > time.time()
+        assert not any(key.startswith("webhooks:claim:") for key in redis.strings)
+
+    async def test_slow_endpoint_does_not_hold_up_others(
+        self, redis: FakeRedis, endpoints: list[WebhookEndpoint]
+    ) -> None:
+        unblock = asyncio.Event()
+        delivered: list[str] = []
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.host == "a.test":
+                await unblock.wait()
+            delivered.append(request.url.host)
+            return httpx.Response(200)
+
+        dispatcher = self._dispatcher(redis, httpx.MockTransport(handler))
+        await dispatcher.dispatch_once()
+        for _ in range(10):
+            await asyncio.sleep(0)
+
+        assert delivered == ["b.test"]
+        assert self._queued(redis, endpoints[1]) == []
+        # The slow endpoint's delivery is claimed, not lost.
+        assert len(self._queued(redis, endpoints[0])) == 1
+
+        unblock.set()
+        await dispatcher.join()
+        assert delivered == ["b.test", "a.test"]
+        assert redis.zsets == {}
+
+    async def test_endpoint_concurrency_is_limited(
+        self, redis: FakeRedis, endpoints: list[WebhookEndpoint]
+    ) -> None:
+        redis.lists.clear()
+        key = WEBHOOK_DELIVERIES_KEY.format(endpoints[0].id)
+        for _ in range(3):
+            await redis.zadd(key, {Delivery(str(endpoints[0].id), [EVENT]).to_json(): 0})
+        unblock = asyncio.Event()
+
+        async def handler(_request: httpx.Request) -> httpx.Response:
+            await unblock.wait()
+            return httpx.Response(200)
+
+        dispatcher = self._dispatcher(redis, httpx.MockTransport(handler), endpoint_concurrency=2)
+
+        assert await dispatcher.dispatch_once() == 2
+        assert await dispatcher.dispatch_once() == 0
+
+        unblock.set()
+        await dispatcher.join()
+        assert len(self._queued(redis, endpoints[0])) == 1
+
+    async def test_exhausted_retry_is_dead_lettered(
+        self, redis: FakeRedis, mock_repo: AsyncMock, endpoints: list[WebhookEndpoint]
+    ) -> None:
+        redis.lists.clear()
+        retry = Delivery(str(endpoints[0].id), [EVENT], attempt=2)
+        await redis.zadd(WEBHOOK_DELIVERIES_KEY.format(endpoints[0].id), {retry.to_json(): 0})
+
+        dispatcher = self._dispatcher(
+            redis, httpx.MockTransport(lambda _request: httpx.Response(500))
+        )
+        await self._dispatch(dispatcher)
+
+        dead_letter: WebhookDeadLetter = mock_repo.add_dead_letter.call_args.args[0]
+        assert dead_letter.endpoint_id == endpoints[0].id
+        assert dead_letter.attempts == 3
+        assert redis.zsets == {}
+
+    async def test_delivery_claimed_by_another_dispatcher_is_skipped(
+        self, redis: FakeRedis, endpoints: list[WebhookEndpoint]
+    ) -> None:
+        redis.lists.clear()
+        retry = Delivery(str(endpoints[0].id), [EVENT], attempt=1)
+        await redis.zadd(WEBHOOK_DELIVERIES_KEY.format(endpoints[0].id), {retry.to_json(): 0})
+        await redis.set(WEBHOOK_CLAIM_KEY.format(retry.id), "other")
+        transport = httpx.MockTransport(lambda _request: pytest.fail("unexpected delivery"))
+
+        handled = await self._dispatch(self._dispatcher(redis, transport))
+
+        assert handled == 0
+        assert self._queued(redis, endpoints[0]) == [retry]
+
+    async def test_unexpected_error_only_affects_its_own_delivery(
+        self, redis: FakeRedis, endpoints: list[WebhookEndpoint]
+    ) -> None:
+        delivered: list[str] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.host == "a.test":
+                raise RuntimeError("boom")
+            delivered.append(request.url.host)
+            return httpx.Response(200)
+
+        await self._dispatch(self._dispatcher(redis, httpx.MockTransport(handler)))
+
+        assert delivered == ["b.test"]
+        assert [d.attempt for d in self._queued(redis, endpoints[0])] == [1]
+        assert self._queued(redis, endpoints[1]) == []
+
+    async def test_events_are_requeued_when_deliveries_cannot_be_queued(
+        self, redis: FakeRedis
+    ) -> None:
+        claimed = list(redis.lists[WEBHOOK_EVENTS_KEY])
+        dispatcher = self._dispatcher(redis, httpx.MockTransport(lambda _r: httpx.Response(200)))
+
+        with (
+            patch.object(redis, "zadd", side_effect=RedisConnectionError("down")),
+            pytest.raises(RedisConnectionError),
+        ):
+            await dispatcher.dispatch_once()
+
+        assert redis.lists == {WEBHOOK_EVENTS_KEY: claimed}
+
+    async def test_delivery_that_cannot_be_rescheduled_stays_claimed(
+        self, redis: FakeRedis, endpoints: list[WebhookEndpoint]
+    ) -> None:
+        dispatcher = self._dispatcher(
+            redis, httpx.MockTransport(lambda _request: httpx.Response(503))
+        )
+        await dispatcher.dispatch_once()
+
+        with patch.object(redis, "zrem", side_effect=RedisConnectionError("down")):
+            await dispatcher.join()
+
+        # Sent again by whichever dispatcher finds it once the claim expires.
+        for endpoint in endpoints:
+            (delivery,) = self._queued(redis, endpoint)
+            assert delivery.attempt == 0
+            assert WEBHOOK_CLAIM_KEY.format(delivery.id) in redis.strings
+
+    async def test_dead_letter_for_deleted_endpoint_is_dropped(
+        self, redis: FakeRedis, mock_repo: AsyncMock, endpoints: list[WebhookEndpoint]
+    ) -> None:
+        redis.lists.clear()
+        retry = Delivery(str(endpoints[0].id), [EVENT], attempt=2)
+        await redis.zadd(WEBHOOK_DELIVERIES_KEY.format(endpoints[0].id), {retry.to_json(): 0})
+        mock_repo.add_dead_letter.side_effect = IntegrityError("INSERT", {}, Exception("fk"))
+
+        dispatcher = self._dispatcher(
+            redis, httpx.MockTransport(lambda _request: httpx.Response(500))
+        )
+        await self._dispatch(dispatcher)
+
+        assert redis.zsets == {}
+
+    async def test_deliveries_of_removed_endpoint_are_dropped(
+        self, redis: FakeRedis, endpoints: list[WebhookEndpoint]
+    ) -> None:
+        dispatcher = self._dispatcher(
+            redis, httpx.MockTransport(lambda _request: httpx.Response(503))
+        )
+        await self._dispatch(dispatcher)
+        removed = endpoints.pop(0)
+
+        with patch.object(time, "monotonic", return_value=time.monotonic() + 60):
+            await self._dispatch(dispatcher)
+
+        assert WEBHOOK_DELIVERIES_KEY.format(removed.id) not in redis.zsets
+        assert len(self._queued(redis, endpoints[0])) == 1
+
+    async def test_release_makes_claimed_deliveries_due_again(
+        self, redis: FakeRedis, endpoints: list[WebhookEndpoint]
+    ) -> None:
+        async def handler(_request: httpx.Request) -> httpx.Response:
+            await asyncio.Event().wait()
+            return httpx.Response(200)
+
+        dispatcher = self._dispatcher(redis, httpx.MockTransport(handler))
+        await dispatcher.dispatch_once()
+
+        await dispatcher.release()
+
+        now = time.time()
+        for endpoint in endpoints:
+            scores = redis.zsets[WEBHOOK_DELIVERIES_KEY.format(endpoint.id)].values()
+            assert all(score <= now for score in scores)
+        assert redis.strings == {}
+
+    async def test_expired_processing_lists_are_requeued(self, redis: FakeRedis) -> None:
+        crashed = WEBHOOK_PROCESSING_KEY.format("crashed")
+        alive = WEBHOOK_PROCESSING_KEY.format("alive")
+        redis.lists[crashed] = [b"orphan-1", b"orphan-2"]
+        redis.lists[alive] = [b"in-flight"]
+        await redis.set(WEBHOOK_LEASE_KEY.format("alive"), "alive")
+
+        dispatcher = self._dispatcher(redis, httpx.MockTransport(lambda _r: httpx.Response(200)))
+        recovered = await dispatcher.recover_orphaned_events()
+
+        assert recovered == 2
+        assert redis.lists[WEBHOOK_EVENTS_KEY][:2] == [b"orphan-1", b"orphan-2"]
+        assert redis.lists[alive] == [b"in-flight"]
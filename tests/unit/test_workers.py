@@ -1,13 +1,32 @@
 import uuid
+from datetime import UTC, datetime, timedelta
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from arq import Retry
+from arq.constants import job_key_prefix
 
 from src.core.enums import ValidationStatus
+from src.core.exceptions import CircuitOpenError, UpstreamTimeoutError
+from src.services.bulk_validation import BulkValidationTracker
+from src.services.result_buffer import ValidationResultBuffer
 from src.services.shipengine_client import ValidationResponse
-from src.workers.tasks import validate_address_task
-from tests.constants import ValidationStatusValues
+from src.services.status_stream import STATUS_CHANNEL, StatusEvent, StatusFilter
+from src.services.validation_queue import VALIDATION_JOB_KEY, enqueue_validation
+from src.services.webhook_dispatcher import WEBHOOK_EVENTS_KEY
+from src.workers.tasks import (
+    REVALIDATION_CURSOR_KEY,
+    backfill_fingerprints_task,
+    enqueue_validation_batch_task,
+    reconcile_address_stats_task,
+    revalidate_stale_addresses_task,
+    sweep_pending_addresses_task,
+    validate_address_task,
+)
+from src.workers.timing import JOB_TIMING_KEY, JobTiming
+from tests.constants import TaskNames, ValidationStatusValues
 from tests.factories.address_factory import create_test_address
+from tests.fakes.redis import FakeRedis
 
 
 class TestValidateAddressTask:
@@ -62,6 +81,278 @@ class TestValidateAddressTask:
             mock_client.validate_address.assert_called_once_with(mock_address)
             mock_service.save_validation_result.assert_called_once()
 
+    async def test_validate_address_task_times_its_phases(
+        self,
+        mock_session: AsyncMock,
+        mock_address: MagicMock,
+        mock_validation_response: ValidationResponse,
+    ) -> None:
+        timing = JobTiming()
+
+        with (
+            patch("src.workers.tasks.get_session") as mock_get_session,
+            patch("src.workers.tasks.AddressRepository") as mock_repo_class,
+            patch("src.workers.tasks.AddressService") as mock_service_class,
+            patch("src.workers.tasks.ShipEngineClient") as mock_client_class,
+        ):
+            mock_get_session.return_value.__aenter__.return_value = mock_session
+            mock_service_class.return_value = AsyncMock()
+            mock_repo_class.return_value.get_by_id = AsyncMock(return_value=mock_address)
+            mock_client_class.return_value.validate_address = AsyncMock(
+                return_value=mock_validation_response
+            )
+
+            await validate_address_task(
+                {"redis": AsyncMock(), JOB_TIMING_KEY: timing}, str(mock_address.id)
+            )
+
+        assert set(timing.phases) == {"load", "upstream", "save", "publish"}
+        assert timing.fields == {"address_id": str(mock_address.id)}
+        mock_session.commit.assert_awaited()
+
+    async def test_validate_address_task_hands_result_to_buffer(
+        self,
+        mock_session: AsyncMock,
+        mock_address: MagicMock,
+        mock_validation_response: ValidationResponse,
+    ) -> None:
+        buffer = AsyncMock()
+
+        with (
+            patch("src.workers.tasks.get_session") as mock_get_session,
+            patch("src.workers.tasks.AddressRepository") as mock_repo_class,
+            patch("src.workers.tasks.AddressService") as mock_service_class,
+            patch("src.workers.tasks.ShipEngineClient") as mock_client_class,
+        ):
+            mock_get_session.return_value.__aenter__.return_value = mock_session
+            mock_service_class.return_value = AsyncMock()
+            mock_repo_class.return_value.get_by_id = AsyncMock(return_value=mock_address)
+            mock_client_class.return_value.validate_address = AsyncMock(
+                return_value=mock_validation_response
+            )
+
+            await validate_address_task({"result_buffer": buffer}, str(mock_address.id))
+
+        mock_service_class.return_value.save_validation_result.assert_not_called()
+        outcome = buffer.save.call_args.args[0]
+        assert outcome.address_id == mock_address.id
+        assert outcome.status == ValidationStatus.VERIFIED
+        assert outcome.previous_status == ValidationStatus.PENDING
+        assert outcome.matched_address == mock_validation_response.matched_address
+
+    async def test_validate_address_task_retries_when_buffer_write_fails(
+        self,
+        mock_session: AsyncMock,
+        mock_address: MagicMock,
+        mock_validation_response: ValidationResponse,
+    ) -> None:
+        mock_redis = AsyncMock()
+        failing_session = MagicMock()
+        failing_session.return_value.__aenter__.side_effect = ConnectionError("db down")
+        buffer = ValidationResultBuffer(failing_session, max_items=1)
+
+        with (
+            patch("src.workers.tasks.get_session") as mock_get_session,
+            patch("src.workers.tasks.AddressRepository") as mock_repo_class,
+            patch("src.workers.tasks.AddressService") as mock_service_class,
+            patch("src.workers.tasks.ShipEngineClient") as mock_client_class,
+        ):
+            mock_get_session.return_value.__aenter__.return_value = mock_session
+            mock_service_class.return_value = AsyncMock()
+            mock_repo_class.return_value.get_by_id = AsyncMock(return_value=mock_address)
+            mock_client_class.return_value.validate_address = AsyncMock(
+                return_value=mock_validation_response
+            )
+
+            with pytest.raises(Retry) as exc_info:
+                await validate_address_task(
+                    {"redis": mock_redis, "result_buffer": buffer, "job_try": 2},
+                    str(mock_address.id),
+                )
+
+        assert exc_info.value.defer_score == 10_000
+        mock_redis.publish.assert_not_called()
+
+    async def test_validate_address_task_skips_events_for_dropped_result(
+        self,
+        mock_session: AsyncMock,
+        mock_address: MagicMock,
+        mock_validation_response: ValidationResponse,
+    ) -> None:
+        mock_redis = AsyncMock()
+        buffer = AsyncMock()
+        buffer.save.return_value = False
+
+        with (
+            patch("src.workers.tasks.get_session") as mock_get_session,
+            patch("src.workers.tasks.AddressRepository") as mock_repo_class,
+            patch("src.workers.tasks.AddressService") as mock_service_class,
+            patch("src.workers.tasks.ShipEngineClient") as mock_client_class,
+            patch("src.workers.tasks.BulkValidationTracker") as mock_tracker_class,
+        ):
+            mock_get_session.return_value.__aenter__.return_value = mock_session
+            mock_service_class.return_value = AsyncMock()
+            mock_repo_class.return_value.get_by_id = AsyncMock(return_value=mock_address)
+            mock_client_class.return_value.validate_address = AsyncMock(
+                return_value=mock_validation_response
+            )
+
+            result = await validate_address_task(
+                {"redis": mock_redis, "result_buffer": buffer},
+                str(mock_address.id),
+                str(uuid.uuid4()),
+            )
+
+        assert result["status"] == "dropped"
+        mock_redis.publish.assert_not_called()
+        mock_redis.rpush.assert_not_called()
+        mock_tracker_class.assert_not_called()
+
+    async def test_validate_address_task_publishes_status_and_webhook_event(
+        self,
+        mock_session: AsyncMock,
+        mock_address: MagicMock,
+        mock_validation_response: ValidationResponse,
+    ) -> None:
+        mock_redis = AsyncMock()
+        mock_address.client_id = "acme"
+
+        with (
+            patch("src.workers.tasks.get_session") as mock_get_session,
+            patch("src.workers.tasks.AddressRepository") as mock_repo_class,
+            patch("src.workers.tasks.AddressService") as mock_service_class,
+            patch("src.workers.tasks.ShipEngineClient") as mock_client_class,
+        ):
+            mock_get_session.return_value.__aenter__.return_value = mock_session
+            mock_service_class.return_value = AsyncMock()
+            mock_repo_class.return_value.get_by_id = AsyncMock(return_value=mock_address)
+            mock_client_class.return_value.validate_address = AsyncMock(
+                return_value=mock_validation_response
+            )
+
+            await validate_address_task({"redis": mock_redis}, str(mock_address.id))
+
+        channel, payload = mock_redis.publish.call_args.args
+        assert channel == STATUS_CHANNEL
+        event = StatusEvent.from_json(payload)
+        assert event.address_id == str(mock_address.id)
+        assert event.validation_status == ValidationStatus.VERIFIED
+        assert event.client_id == "acme"
+        mock_redis.rpush.assert_called_once_with(WEBHOOK_EVENTS_KEY, payload)
+
+    async def test_status_event_country_matches_upper_case_filter(
+        self,
+        mock_session: AsyncMock,
+        mock_validation_response: ValidationResponse,
+    ) -> None:
+        mock_redis = AsyncMock()
+        address = create_test_address(country_code="us")
+
+        with (
+            patch("src.workers.tasks.get_session") as mock_get_session,
+            patch("src.workers.tasks.AddressRepository") as mock_repo_class,
+            patch("src.workers.tasks.AddressService") as mock_service_class,
+            patch("src.workers.tasks.ShipEngineClient") as mock_client_class,
+        ):
+            mock_get_session.return_value.__aenter__.return_value = mock_session
+            mock_service_class.return_value = AsyncMock()
+            mock_repo_class.return_value.get_by_id = AsyncMock(return_value=address)
+            mock_client_class.return_value.validate_address = AsyncMock(
+                return_value=mock_validation_response
+            )
+
+            await validate_address_task({"redis": mock_redis}, str(address.id))
+
+        event = StatusEvent.from_json(mock_redis.publish.call_args.args[1])
+        assert event.country_code == "US"
+        assert StatusFilter(country_codes=frozenset({"US"})).matches(event)
+
+    async def test_validate_address_task_defers_while_circuit_open(
+        self,
+        mock_session: AsyncMock,
+        mock_address: MagicMock,
+    ) -> None:
+        mock_redis = AsyncMock()
+
+        with (
+            patch("src.workers.tasks.get_session") as mock_get_session,
+            patch("src.workers.tasks.AddressRepository") as mock_repo_class,
+            patch("src.workers.tasks.AddressService") as mock_service_class,
+            patch("src.workers.tasks.ShipEngineClient") as mock_client_class,
+        ):
+            mock_get_session.return_value.__aenter__.return_value = mock_session
+            mock_service_class.return_value = AsyncMock()
+            mock_repo_class.return_value.get_by_id = AsyncMock(return_value=mock_address)
+            mock_client_class.return_value.validate_address = AsyncMock(
+                side_effect=CircuitOpenError("shipengine", retry_after=5.0)
+            )
+
+            result = await validate_address_task({"redis": mock_redis}, str(mock_address.id))
+
+        assert result == {"status": "deferred", "address_id": str(mock_address.id)}
+        mock_service_class.return_value.save_validation_result.assert_not_called()
+        (name, address_id), kwargs = mock_redis.enqueue_job.call_args
+        assert (name, address_id) == (TaskNames.VALIDATE_ADDRESS, str(mock_address.id))
+        assert kwargs["_defer_by"] >= timedelta(seconds=5)
+        mock_redis.publish.assert_not_called()
+
+    async def test_validate_address_task_retries_when_budget_exhausted(
+        self,
+        mock_session: AsyncMock,
+        mock_address: MagicMock,
+    ) -> None:
+        with (
+            patch("src.workers.tasks.get_session") as mock_get_session,
+            patch("src.workers.tasks.AddressRepository") as mock_repo_class,
+            patch("src.workers.tasks.AddressService") as mock_service_class,
+            patch("src.workers.tasks.ShipEngineClient") as mock_client_class,
+        ):
+            mock_get_session.return_value.__aenter__.return_value = mock_session
+            mock_service_class.return_value = AsyncMock()
+            mock_repo_class.return_value.get_by_id = AsyncMock(return_value=mock_address)
+            mock_client_class.return_value.validate_address = AsyncMock(
+                side_effect=UpstreamTimeoutError("ShipEngine", budget=25.0)
+            )
+
+            with pytest.raises(Retry) as exc_info:
+                await validate_address_task({"job_try": 2}, str(mock_address.id))
+
+        assert exc_info.value.defer_score == 50_000
+        mock_service_class.return_value.save_validation_result.assert_not_called()
+
+    async def test_validate_address_task_records_bulk_progress(
+        self,
+        mock_session: AsyncMock,
+        mock_address: MagicMock,
+        mock_validation_response: ValidationResponse,
+    ) -> None:
+        redis = FakeRedis()
+        redis.publish = AsyncMock()  # type: ignore[attr-defined]
+        redis.rpush = AsyncMock()  # type: ignore[attr-defined]
+        tracker = BulkValidationTracker(redis)  # type: ignore[arg-type]
+        bulk_id = uuid.uuid4()
+        await tracker.start(bulk_id, total=1)
+
+        with (
+            patch("src.workers.tasks.get_session") as mock_get_session,
+            patch("src.workers.tasks.AddressRepository") as mock_repo_class,
+            patch("src.workers.tasks.AddressService") as mock_service_class,
+            patch("src.workers.tasks.ShipEngineClient") as mock_client_class,
+        ):
+            mock_get_session.return_value.__aenter__.return_value = mock_session
+            mock_service_class.return_value = AsyncMock()
+            mock_repo_class.return_value.get_by_id = AsyncMock(return_value=mock_address)
+            mock_client_class.return_value.validate_address = AsyncMock(
+                return_value=mock_validation_response
+            )
+
+            await validate_address_task({"redis": redis}, str(mock_address.id), str(bulk_id))
+
+        progress = await tracker.get(bulk_id)
+        assert progress is not None
+        assert progress.completed == 1
+        assert progress.by_status == {ValidationStatus.VERIFIED: 1}
+
     async def test_validate_address_task_not_found_raises_error(
         self,
         mock_session: AsyncMock,
@@ -116,3 +407,210 @@ class TestValidateAddressTask:
 
             assert result["status"] == ValidationStatusValues.ERROR
             mock_service.save_validation_result.assert_called_once()
+
+
+class TestEnqueueValidationBatchTask:
+    async def test_fans_out_per_address_jobs(self) -> None:
+        redis = FakeRedis()
+        bulk_id = uuid.uuid4()
+        await BulkValidationTracker(redis).start(bulk_id, total=2)  # type: ignore[arg-type]
+        address_ids = [str(uuid.uuid4()), str(uuid.uuid4())]
+
+        result = await enqueue_validation_batch_task({"redis": redis}, str(bulk_id), address_ids)
+
+        assert result == {"enqueued": 2}
+        assert [c.args for c in redis.enqueue_job.call_args_list] == [
+            (TaskNames.VALIDATE_ADDRESS, address_id) for address_id in address_ids
+        ]
+        assert all(c.kwargs == {"bulk_id": str(bulk_id)} for c in redis.enqueue_job.call_args_list)
+        progress = await BulkValidationTracker(redis).get(bulk_id)  # type: ignore[arg-type]
+        assert progress is not None
+        assert progress.enqueued == 2
+
+
+class TestBackfillFingerprintsTask:
+    async def test_backfill_fingerprints_until_exhausted(self) -> None:
+        addresses = [create_test_address(), create_test_address()]
+
+        with (
+            patch("src.workers.tasks.get_session") as mock_get_session,
+            patch("src.workers.tasks.AddressRepository") as mock_repo_class,
+        ):
+            mock_get_session.return_value.__aenter__.return_value = AsyncMock()
+
+            mock_repo = AsyncMock()
+            mock_repo.get_without_fingerprint.side_effect = [addresses, []]
+            mock_repo_class.return_value = mock_repo
+
+            result = await backfill_fingerprints_task({}, batch_size=2)
+
+            assert result["updated"] == len(addresses)
+            fingerprints = mock_repo.set_fingerprints.call_args.args[0]
+            assert set(fingerprints) == {a.id for a in addresses}
+
+
+class TestRevalidateStaleAddressesTask:
+    @pytest.fixture
+    def mock_redis(self) -> AsyncMock:
+        redis = AsyncMock()
+        redis.get.return_value = None
+        return redis
+
+    @pytest.fixture
+    def mock_settings(self) -> MagicMock:
+        mock = MagicMock()
+        mock.shipengine_rate_limit = 1.0
+        mock.revalidation_budget_share = 0.5
+        mock.revalidation_interval_minutes = 1
+        mock.revalidation_chunk_size = 100
+        mock.revalidation_max_age_days = 30
+        return mock
+
+    def _stale_keys(self, count: int) -> list[tuple[datetime, uuid.UUID]]:
+        validated_at = datetime.now(UTC) - timedelta(days=365)
+        return [(validated_at, uuid.uuid4()) for _ in range(count)]
+
+    async def test_enqueues_stale_addresses_spaced_by_rate(
+        self,
+        mock_redis: AsyncMock,
+        mock_settings: MagicMock,
+    ) -> None:
+        keys = self._stale_keys(3)
+
+        with (
+            patch("src.workers.tasks.settings", mock_settings),
+            patch("src.workers.tasks.get_session"),
+            patch("src.workers.tasks.AddressRepository") as mock_repo_class,
+        ):
+            mock_repo_class.return_value.get_stale_keys = AsyncMock(side_effect=[keys, []])
+
+            result = await revalidate_stale_addresses_task({"redis": mock_redis})
+
+        assert result["enqueued"] == len(keys)
+        delays = [c.kwargs["_defer_by"] for c in mock_redis.enqueue_job.call_args_list]
+        assert delays == [timedelta(seconds=i / 0.5) for i in range(len(keys))]
+        mock_redis.delete.assert_called_once_with(REVALIDATION_CURSOR_KEY)
+
+    async def test_stops_at_rate_budget_and_saves_cursor(
+        self,
+        mock_redis: AsyncMock,
+        mock_settings: MagicMock,
+    ) -> None:
+        budget = 30
+        keys = self._stale_keys(budget)
+
+        with (
+            patch("src.workers.tasks.settings", mock_settings),
+            patch("src.workers.tasks.get_session"),
+            patch("src.workers.tasks.AddressRepository") as mock_repo_class,
+        ):
+            mock_repo_class.return_value.get_stale_keys = AsyncMock(return_value=keys)
+
+            result = await revalidate_stale_addresses_task({"redis": mock_redis})
+
+        assert result["enqueued"] == budget
+        assert mock_repo_class.return_value.get_stale_keys.call_args.kwargs["limit"] == budget
+        last_validated_at, last_id = keys[-1]
+        # The last SET saves the cursor; the ones before record each job's id.
+        mock_redis.set.assert_called_with(
+            REVALIDATION_CURSOR_KEY, f"{last_validated_at.isoformat()}|{last_id}"
+        )
+
+
+class TestSweepPendingAddressesTask:
+    def _pending_keys(self, *address_ids: uuid.UUID) -> list[tuple[datetime, uuid.UUID]]:
+        pending_since = datetime.now(UTC) - timedelta(hours=1)
+        return [(pending_since, address_id) for address_id in address_ids]
+
+    async def test_reenqueues_only_addresses_without_queued_job(self) -> None:
+        queued_id, finished_id, stuck_id = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+        redis = FakeRedis()
+        redis.enqueue_job.return_value = MagicMock(job_id="new-job")
+        await enqueue_validation(redis, str(queued_id))  # type: ignore[arg-type]
+        await redis.set(f"{job_key_prefix}new-job", "job")
+        await redis.set(VALIDATION_JOB_KEY.format(finished_id), "finished-job")
+        redis.enqueue_job.reset_mock()
+
+        with (
+            patch("src.workers.tasks.get_session"),
+            patch("src.workers.tasks.AddressRepository") as mock_repo_class,
+        ):
+            mock_repo_class.return_value.get_pending_keys = AsyncMock(
+                return_value=self._pending_keys(queued_id, finished_id, stuck_id)
+            )
+
+            result = await sweep_pending_addresses_task({"redis": redis})
+
+        assert result == {"pending": 3, "recovered": 2}
+        assert [c.args for c in redis.enqueue_job.call_args_list] == [
+            (TaskNames.VALIDATE_ADDRESS, str(finished_id)),
+            (TaskNames.VALIDATE_ADDRESS, str(stuck_id)),
+        ]
+        assert await redis.get(VALIDATION_JOB_KEY.format(stuck_id)) == b"new-job"
+
+    async def test_pages_past_addresses_with_queued_jobs(self) -> None:
+        queued_ids = [uuid.uuid4(), uuid.uuid4()]
+        stuck_ids = [uuid.uuid4(), uuid.uuid4()]
+        redis = FakeRedis()
+        for address_id in queued_ids:
+            await redis.set(VALIDATION_JOB_KEY.format(address_id), f"job-{address_id}")
+            await redis.set(f"{job_key_prefix}job-{address_id}", "job")
+        mock_settings = MagicMock(pending_sweep_batch_size=2, pending_sweep_threshold_minutes=15)
+        first_page = self._pending_keys(*queued_ids)
+        second_page = self._pending_keys(*stuck_ids)
+
+        with (
+            patch("src.workers.tasks.settings", mock_settings),
+            patch("src.workers.tasks.get_session"),
+            patch("src.workers.tasks.AddressRepository") as mock_repo_class,
+        ):
+            get_pending_keys = AsyncMock(side_effect=[first_page, second_page])
+            mock_repo_class.return_value.get_pending_keys = get_pending_keys
+
+            result = await sweep_pending_addresses_task({"redis": redis})
+
+        assert result == {"pending": 4, "recovered": 2}
+        assert get_pending_keys.call_args_list[1].kwargs["after"] == first_page[-1]
+        assert [c.args[1] for c in redis.enqueue_job.call_args_list] == [
+            str(address_id) for address_id in stuck_ids
+        ]
+
+    async def test_skips_queue_check_when_nothing_is_pending(self) -> None:
+        mock_redis = AsyncMock()
+
+        with (
+            patch("src.workers.tasks.get_session"),
+            patch("src.workers.tasks.AddressRepository") as mock_repo_class,
+        ):
+            mock_repo_class.return_value.get_pending_keys = AsyncMock(return_value=[])
+
+            result = await sweep_pending_addresses_task({"redis": mock_redis})
+
+        assert result == {"pending": 0, "recovered": 0}
+        mock_redis.mget.assert_not_called()
+        mock_redis.enqueue_job.assert_not_called()
+
+
+class TestReconcileAddressStatsTask:
+    async def test_replaces_stats_with_database_counts(self) -> None:
+        rows = [
+            (ValidationStatusValues.VERIFIED, "US", 3),
+            (ValidationStatusValues.PENDING, "CA", 2),
+        ]
+
+        with (
+            patch("src.workers.tasks.get_session"),
+            patch("src.workers.tasks.AddressRepository") as mock_repo_class,
+            patch("src.workers.tasks.AddressStatsCounter") as mock_stats_class,
+        ):
+            mock_repo_class.return_value.count_by_status_and_country = AsyncMock(return_value=rows)
+            mock_stats_class.return_value.replace = AsyncMock()
+
+            result = await reconcile_address_stats_task({"redis": AsyncMock()})
+
+        assert result == {"groups": 2, "total": 5}
+        replaced = list(mock_stats_class.return_value.replace.call_args.args[0])
+        assert replaced == [
+            ((ValidationStatus.VERIFIED, "US"), 3),
+            ((ValidationStatus.PENDING, "CA"), 2),
+        ]